@@ -1,7 +1,11 @@
+import json
 import os
-from pydantic_settings import BaseSettings, SettingsConfigDict
+from dataclasses import MISSING, dataclass, field, fields
+from functools import cached_property, lru_cache
 from typing import Optional, List
 
+from dotenv import load_dotenv
+
 
 def get_env_file() -> str:
     """Détermine le fichier .env à utiliser selon l'environnement"""
@@ -14,36 +18,129 @@ def get_env_file() -> str:
     return env_files.get(env, ".env.dev")
 
 
-class Settings(BaseSettings):
-    database_url: str  # Pydantic cherchera DATABASE_URL (insensible à la casse)
-    secret_key: str  # Pydantic cherchera SECRET_KEY (insensible à la casse)
+def _parse_env_value(raw: str, annotation):
+    """Convertit une valeur d'environnement selon le type déclaré du champ."""
+    if annotation is int:
+        return int(raw)
+    if annotation is float:
+        return float(raw)
+    if annotation is bool:
+        return raw.strip().lower() in ("1", "true", "yes", "on")
+    if annotation == List[str]:
+        raw = raw.strip()
+        if raw.startswith("["):
+            return json.loads(raw)
+        return [item.strip() for item in raw.split(",") if item.strip()]
+    return raw
+
+
+def _from_env(cls, prefix: str = ""):
+    """Construit un bloc de paramètres depuis os.environ.
+
+    Chaque champ est lu dans la variable PREFIX + NOM (en majuscules), ou dans
+    `metadata["env"]` si précisé; les champs absents gardent leur valeur par défaut.
+    """
+    kwargs = {}
+    missing = []
+    for f in fields(cls):
+        env_name = f.metadata.get("env", prefix + f.name).upper()
+        raw = os.environ.get(env_name)
+        if raw is not None:
+            kwargs[f.name] = _parse_env_value(raw, f.type)
+        elif f.default is MISSING and f.default_factory is MISSING:
+            missing.append(env_name)
+    if missing:
+        raise RuntimeError(f"Variables d'environnement manquantes: {', '.join(missing)}")
+    return cls(**kwargs)
+
+
+@dataclass(frozen=True, slots=True)
+class SmtpSettings:
+    """Paramètres SMTP (SMTP_HOST, SMTP_PORT, ...), chargés au premier envoi d'email."""
+
+    host: str = "smtp-relay.gmail.com"
+    port: int = 465
+    user: Optional[str] = "cleanapp"
+    password: Optional[str] = None
+    sender_email: str = field(default="cbdlt.dev@gmail.com", metadata={"env": "sender_email"})
+    sender_name: str = field(default="Cleaning Tracker", metadata={"env": "sender_name"})
+
+
+@dataclass(frozen=True, slots=True)
+class S3Settings:
+    """Paramètres S3 (S3_ACCESS_KEY, S3_SECRET_KEY)."""
+
+    access_key: Optional[str] = None
+    secret_key: Optional[str] = None
+
+
+@dataclass(frozen=True, slots=True)
+class ExpoSettings:
+    """Paramètres des notifications push Expo (EXPO_ACCESS_TOKEN)."""
+
+    access_token: Optional[str] = None
+
+
+_DEFAULT_CORS_ORIGINS = [
+    "http://localhost:8080",
+    "http://127.0.0.1:8080",
+    "http://localhost:3000",
+    "http://127.0.0.1:3000",
+    "http://localhost:5173",
+    "http://127.0.0.1:5173",
+    "http://host.docker.internal:5173",
+    "http://host.docker.internal:3000",
+    "https://cleaning-app-api.onrender.com",
+    "https://cleaning-tracker-czza.onrender.com",
+]
+
+
+@dataclass(frozen=True)
+class Settings:
+    """Paramètres de l'application, en lecture seule.
+
+    Pas de slots: les blocs optionnels (smtp, s3, expo) sont des cached_property,
+    qui ont besoin du __dict__ de l'instance.
+    """
+
+    database_url: str  # DATABASE_URL
+    secret_key: str  # SECRET_KEY
     redis_url: str  # Variable dans .env
-    service_role_key: Optional[str] = None  # Peut être absent en dev (actions admin désactivées)
 
     # Supabase settings
     supabase_url: str  # URL de votre projet Supabase
     supabase_anon_key: str  # Clé publique anon
+    service_role_key: Optional[str] = None  # Peut être absent en dev (actions admin désactivées)
 
     # JWT settings
     jwt_algorithm: str = "HS256"
     access_token_expire_minutes: int = 30
     refresh_token_expire_days: int = 7
 
-    # Propriété dérivée pour celery_broker_url
-    @property
-    def celery_broker_url(self) -> str:
-        return self.redis_url
-
-    # S3 settings
-    s3_access_key: Optional[str] = None
-    s3_secret_key: Optional[str] = None
-
-    model_config = SettingsConfigDict(
-        env_file=get_env_file(),  # Appel de la fonction
-        env_file_encoding="utf-8",
-        extra="ignore",
-        case_sensitive=False,
-    )
+    # Database settings
+    database_pooler_url: Optional[str] = None  # Prioritaire sur database_url si défini
+    # Mode du pooler devant Postgres (PGBOUNCER_MODE): "transaction", "session" ou
+    # "none" (connexion directe). En mode transaction, une requête préparée sur un
+    # backend n'existe pas forcément sur le suivant: cache désactivé.
+    pgbouncer_mode: str = "transaction"
+    # Cache de requêtes préparées asyncpg (par connexion), hors mode transaction
+    db_statement_cache_size: int = 256
+    # Taille du pool (DB_POOL_MIN / DB_POOL_MAX). Loi de Little: connexions
+    # nécessaires ~ débit de requêtes x durée moyenne d'une requête (RTT inclus);
+    # par défaut 4 par CPU, au moins 10, pour absorber les pics sans file d'attente.
+    db_pool_min: int = 2
+    db_pool_max: int = field(default_factory=lambda: max(10, 4 * (os.cpu_count() or 1)))
+    # Connexions inactives fermées après ce délai (secondes), sans renouvellement permanent
+    db_max_inactive_connection_lifetime: float = 300.0
+    db_max_queries: int = 50000  # Connexion recyclée après ce nombre de requêtes
+    # Une requête lente ne bloque pas indéfiniment une place du pool (secondes)
+    db_command_timeout: float = 30.0
+    db_application_name: str = "cleaning_tracker_api"  # Visible dans pg_stat_activity
+    # Listes d'occurrences lues sur la vue matérialisée mv_task_occurrences_enriched
+    # (OCCURRENCES_VIEW_ENABLED, migration requise). Le détail d'une occurrence
+    # reste lu sur les tables, pour refléter immédiatement une mutation.
+    occurrences_view_enabled: bool = False
+    occurrences_view_refresh_delay: float = 2.0  # Regroupement des REFRESH (secondes)
 
     # Logging settings
     environment: str = "development"  # development, staging, production
@@ -55,33 +152,62 @@ class Settings(BaseSettings):
     log_max_bytes: int = 10485760
     log_backup_count: int = 5  # Nombre de fichiers de backup à conserver
 
-    # SMTP settings pour les emails 
-    smtp_host: str = "smtp-relay.gmail.com"
-    smtp_port: int = 465
-    smtp_user: Optional[str] = "cleanapp"
-    smtp_password: Optional[str] = os.getenv("SMTP_PASSWORD", None)
-    sender_email: str = "cbdlt.dev@gmail.com"
-    sender_name: str = "Cleaning Tracker"
-
     # URL de l'application (pour les liens dans les emails)
-    app_url: str = os.getenv("APP_URL", "http://localhost:5173")
+    app_url: str = "http://localhost:5173"
 
-    # Expo push notifications
-    expo_access_token: Optional[str] = None
+    # CORS origins allowed for the API (CORS_ORIGINS: liste JSON ou séparée par des virgules)
+    cors_origins: List[str] = field(default_factory=lambda: list(_DEFAULT_CORS_ORIGINS))
 
-    # CORS origins allowed for the API
-    cors_origins: List[str] = [
-        "http://localhost:8080",
-        "http://127.0.0.1:8080",
-        "http://localhost:3000",
-        "http://127.0.0.1:3000",
-    "http://localhost:5173",
-    "http://127.0.0.1:5173",
-    "http://host.docker.internal:5173",
-    "http://host.docker.internal:3000",
-    "https://cleaning-app-api.onrender.com",
-    "https://cleaning-tracker-czza.onrender.com",
-    ]
+    def __post_init__(self):
+        # DSN directement utilisables par asyncpg (normalisés une seule fois, au chargement)
+        for name in ("database_url", "database_pooler_url"):
+            dsn = getattr(self, name)
+            if dsn and dsn.startswith("postgresql+asyncpg://"):
+                object.__setattr__(
+                    self, name, dsn.replace("postgresql+asyncpg://", "postgresql://", 1)
+                )
+
+    @property
+    def prepared_statements_enabled(self) -> bool:
+        """Requêtes préparées utilisables (pooler en mode session ou connexion directe)."""
+        return self.pgbouncer_mode != "transaction" and self.db_statement_cache_size > 0
+
+    # Propriété dérivée pour celery_broker_url (calculée une seule fois)
+    @cached_property
+    def celery_broker_url(self) -> str:
+        return self.redis_url
+
+    # Blocs optionnels: lus depuis l'environnement uniquement au premier accès
+    @cached_property
+    def smtp(self) -> SmtpSettings:
+        return _from_env(SmtpSettings, prefix="smtp_")
+
+    @cached_property
+    def s3(self) -> S3Settings:
+        return _from_env(S3Settings, prefix="s3_")
+
+    @cached_property
+    def expo(self) -> ExpoSettings:
+        return _from_env(ExpoSettings, prefix="expo_")
+
+
+def load_settings() -> Settings:
+    """Charge le fichier .env de l'environnement puis construit les paramètres.
+
+    Les variables déjà présentes dans l'environnement restent prioritaires.
+    """
+    load_dotenv(get_env_file(), encoding="utf-8")
+    return _from_env(Settings)
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Retourne l'instance unique des paramètres (env et .env lus une seule fois)."""
+    return load_settings()
 
 
-settings = Settings()
+def __getattr__(name: str):
+    # Compatibilité: `from app.config import settings` construit les paramètres à la demande
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
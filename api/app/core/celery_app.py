@@ -1,12 +1,18 @@
 from celery import Celery
 from celery.schedules import crontab  # AJOUTER cet import
-from app.config import settings
+from app.config import get_settings
 
-celery_app = Celery(
-    "cleaning_tracker",
-    broker=settings.celery_broker_url,
-    backend=settings.celery_broker_url,
-)
+celery_app = Celery("cleaning_tracker")
+
+
+def _broker_defaults() -> dict:
+    """URLs broker/backend, résolues seulement quand Celery charge sa configuration."""
+    broker_url = get_settings().celery_broker_url
+    return {"broker_url": broker_url, "result_backend": broker_url}
+
+
+# Passé comme callable: les paramètres ne sont pas construits à l'import du module
+celery_app.add_defaults(_broker_defaults)
 
 # Configuration pour l'autodiscovery des tâches
 celery_app.conf.update(
@@ -2,16 +2,116 @@ import asyncpg
 import asyncio
 import logging
 import os
-from typing import Optional, Dict, Any, List
-from uuid import UUID
+import time
+import weakref
+from functools import lru_cache
+from itertools import islice, product
+from typing import Optional, Dict, Any, AsyncIterator, List, Sequence, Tuple, Final
+from uuid import UUID, uuid4
 from datetime import date, datetime, timedelta
 from dateutil.rrule import rrulestr
 
 from app.config import settings
 import socket
 from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+from app.core.logging import get_logger, with_context
+from app.core.materialized_views import OCCURRENCES_VIEW, occurrences_view_refresher
 from app.schemas.task import TaskStatus
 
+logger = get_logger("app.database")
+
+# Valeurs de statut liées une fois à l'import (paramètres SQL des chemins fréquents)
+_STATUS_PENDING, _STATUS_DONE, _STATUS_OVERDUE = (
+    status.value for status in (TaskStatus.PENDING, TaskStatus.DONE, TaskStatus.OVERDUE)
+)
+
+
+class Row(asyncpg.Record):
+    """Record asyncpg exposé tel quel aux routers.
+
+    L'accès par attribut permet aux schémas de sortie (from_attributes=True)
+    de valider directement les lignes, sans copie intermédiaire en dict
+    (`in` teste déjà les noms de colonnes, comme pour un dict). Sans __dict__
+    (__slots__ vide), une ligne ne coûte pas plus qu'un Record et se
+    sérialise directement via `app.core.serialization.dumps`.
+    """
+
+    __slots__ = ()
+
+    def __getattr__(self, name: str) -> Any:
+        try:
+            return self[name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+
+# Adresses IPv4 déjà résolues: (hôte, port) -> (IP, valide jusqu'à)
+_IPV4_CACHE_TTL: Final[float] = 300.0
+_ipv4_cache: Dict[tuple, Tuple[str, float]] = {}
+
+
+async def _resolve_ipv4(host: str, port: int) -> Optional[str]:
+    """Résout l'enregistrement A de `host` sans bloquer la boucle d'événements.
+
+    Le résultat est mis en cache quelques minutes: les recréations rapprochées
+    du pool (tests, tâches Celery) ne refont pas de requête DNS, et un
+    changement d'IP de l'hôte (pooler) est pris en compte après expiration.
+    """
+    key = (host, port)
+    now = time.monotonic()
+    cached = _ipv4_cache.get(key)
+    if cached is not None and cached[1] > now:
+        return cached[0]
+    infos = await asyncio.get_running_loop().getaddrinfo(
+        host, port, family=socket.AF_INET, type=socket.SOCK_STREAM
+    )
+    if not infos:
+        return None
+    address = infos[0][4][0]
+    _ipv4_cache[key] = (address, now + _IPV4_CACHE_TTL)
+    return address
+
+
+@lru_cache(maxsize=4)
+def _build_dsn(raw_url: str, ipv4_addr: Optional[str] = None) -> str:
+    """DSN final: sslmode=require ajouté si absent (bonne pratique pour Supabase),
+    hôte remplacé par `ipv4_addr` si fourni.
+
+    Mis en cache: une recréation du pool ne refait ni parsing ni réencodage de l'URL.
+    """
+    parts = urlsplit(raw_url)
+    query_pairs = dict(parse_qsl(parts.query, keep_blank_values=True))
+    query_pairs.setdefault("sslmode", "require")
+
+    netloc = parts.netloc
+    if ipv4_addr:
+        # Rebuild netloc with credentials if any
+        userinfo = ''
+        if parts.username:
+            userinfo += parts.username
+            if parts.password:
+                userinfo += f':{parts.password}'
+            userinfo += '@'
+        netloc = f"{userinfo}{ipv4_addr}:{parts.port or 5432}"
+
+    return urlunsplit((parts.scheme, netloc, parts.path, urlencode(query_pairs), parts.fragment))
+
+
+def _server_settings() -> Dict[str, str]:
+    """Paramètres de session fixés à l'ouverture de chaque connexion.
+
+    Fuseau UTC pour des conversions de dates déterministes; JIT désactivé,
+    son coût de compilation n'étant jamais amorti sur des requêtes OLTP courtes.
+    """
+    server_settings = {
+        "application_name": settings.db_application_name,
+        "timezone": "UTC",
+    }
+    # pgbouncer rejette les paramètres de démarrage qu'il ne gère pas (dont jit)
+    if settings.pgbouncer_mode == "none":
+        server_settings["jit"] = "off"
+    return server_settings
+
 
 async def init_db_pool(optional: bool = False, timeout: float = 10.0):
     """Initialise le pool de connexions à la base de données.
@@ -24,73 +124,179 @@ async def init_db_pool(optional: bool = False, timeout: float = 10.0):
         asyncpg.Pool ou None si optional et échec.
     """
     # Point de départ: URL principale
-    database_url = os.getenv("DATABASE_POOLER_URL") or settings.database_url
-    if database_url.startswith("postgresql+asyncpg://"):
-        database_url = database_url.replace("postgresql+asyncpg://", "postgresql://")
-
-    # S'assurer que sslmode=require est présent (bonne pratique pour Supabase)
-    try:
-        parts = urlsplit(database_url)
-        query_pairs = dict(parse_qsl(parts.query, keep_blank_values=True))
-        if query_pairs.get("sslmode") is None:
-            query_pairs["sslmode"] = "require"
-        database_url = urlunsplit((parts.scheme, parts.netloc, parts.path, urlencode(query_pairs), parts.fragment))
-    except Exception:
-        pass
+    # Schéma déjà normalisé (postgresql://) au chargement des paramètres
+    database_url = settings.database_pooler_url or settings.database_url
 
     # Force IPv4 if requested (default True in Docker where IPv6 route may be unavailable)
-    prefer_ipv4 = os.getenv("PREFER_IPV4", "1") == "1"
-    if prefer_ipv4:
+    ipv4_addr = None
+    ipv4_key = None
+    if os.getenv("PREFER_IPV4", "1") == "1":
         try:
             parts = urlsplit(database_url)
             host = parts.hostname
-            port = parts.port or 5432
             if host and not host.replace('.', '').isdigit():
-                # Resolve A record (IPv4)
-                infos = socket.getaddrinfo(host, port, socket.AF_INET, socket.SOCK_STREAM)
-                if infos:
-                    ipv4_addr = infos[0][4][0]
-                    # Rebuild netloc with credentials if any
-                    userinfo = ''
-                    if parts.username:
-                        userinfo += parts.username
-                        if parts.password:
-                            userinfo += f':{parts.password}'
-                        userinfo += '@'
-                    netloc = f"{userinfo}{ipv4_addr}:{port}"
-                    database_url = urlunsplit((parts.scheme, netloc, parts.path, parts.query, parts.fragment))
-        except Exception as e:
-            # Best-effort: keep original URL on any failure
+                ipv4_key = (host, parts.port or 5432)
+                ipv4_addr = await _resolve_ipv4(*ipv4_key)
+        except Exception:
+            # Best-effort: keep original host on any failure
             pass
 
-    # Log minimal sans fuite de secrets
     try:
-        parts = urlsplit(database_url)
-        logging.info(f"[db] Connecting to {parts.hostname}:{parts.port or 5432} (sslmode=require)")
+        database_url = _build_dsn(database_url, ipv4_addr)
     except Exception:
         pass
 
+    # Seul l'hôte est journalisé (aucun identifiant), et seulement si INFO est actif
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            "Connexion à la base de données",
+            extra=with_context(host=urlsplit(database_url).hostname),
+        )
+
     try:
-        # Compatibilité pgbouncer (transaction pooler): pas de prepared statements
+        # Compatibilité pgbouncer (PGBOUNCER_MODE=transaction): ni cache ni préparation
+        prepared = settings.prepared_statements_enabled
         return await asyncio.wait_for(
-            asyncpg.create_pool(dsn=database_url, statement_cache_size=0),
+            asyncpg.create_pool(
+                dsn=database_url,
+                min_size=settings.db_pool_min,
+                max_size=settings.db_pool_max,
+                max_inactive_connection_lifetime=settings.db_max_inactive_connection_lifetime,
+                max_queries=settings.db_max_queries,
+                command_timeout=settings.db_command_timeout,
+                statement_cache_size=settings.db_statement_cache_size if prepared else 0,
+                record_class=Row,
+                init=_prepare_hot_statements if prepared else None,
+                server_settings=_server_settings(),
+            ),
             timeout=timeout,
         )
     except Exception as e:
+        # L'adresse en cache est peut-être périmée: la prochaine tentative
+        # refait la résolution DNS
+        if ipv4_key is not None:
+            _ipv4_cache.pop(ipv4_key, None)
         if optional:
-            logging.warning(f"[db] Impossible de créer le pool (mode optionnel activé): {e}")
+            logger.warning(
+                "Impossible de créer le pool (mode optionnel activé)",
+                extra=with_context(error=str(e)),
+            )
             return None
         raise
 
-def ensure_pool(pool: Optional[asyncpg.Pool]):
+# Au-delà de ce taux de connexions occupées, le pool est proche de la saturation
+# (les acquire suivants attendent): on le signale, au plus une fois par intervalle.
+POOL_SATURATION_WARN_RATIO: Final[float] = 0.9
+_POOL_SATURATION_WARN_INTERVAL: Final[float] = 60.0
+_last_saturation_warning: float = 0.0
+
+
+def ensure_pool(pool: Optional[asyncpg.Pool]) -> asyncpg.Pool:
+    """Valide le pool une fois par requête (dépendance get_db_pool des routers).
+
+    Les fonctions de ce module se contentent d'un `assert pool is not None`,
+    supprimé sous `python -O`.
+    """
     if pool is None:
         raise RuntimeError("Base de données non initialisée (pool None). Activez DB_OPTIONAL=1 seulement pour les endpoints qui ne requièrent pas le stockage.")
+    _check_pool_saturation(pool)
+    return pool
+
+
+def _check_pool_saturation(pool: asyncpg.Pool) -> None:
+    global _last_saturation_warning
+    max_size = pool.get_max_size()
+    in_use = pool.get_size() - pool.get_idle_size()
+    if not max_size or in_use / max_size < POOL_SATURATION_WARN_RATIO:
+        return
+    now = time.monotonic()
+    if now - _last_saturation_warning < _POOL_SATURATION_WARN_INTERVAL:
+        return
+    _last_saturation_warning = now
+    logger.warning(
+        "Pool de connexions proche de la saturation",
+        extra=with_context(in_use=in_use, max_size=max_size),
+    )
+
+
+# Requêtes préparées, indexées par connexion physique: le pool fournit un
+# nouveau proxy à chaque acquire mais la connexion sous-jacente est réutilisée.
+_prepared_statements: "weakref.WeakKeyDictionary[asyncpg.Connection, Dict[str, Any]]" = weakref.WeakKeyDictionary()
+
+
+class _UnpreparedStatement:
+    """Même interface qu'un PreparedStatement, sans préparation côté serveur.
+
+    Utilisé quand le cache est désactivé (pgbouncer en mode transaction), où une
+    requête nommée préparée sur un backend n'existe pas forcément sur le suivant.
+    """
+
+    __slots__ = ("_conn", "_sql")
+
+    def __init__(self, conn, sql: str):
+        self._conn = conn
+        self._sql = sql
+
+    async def fetch(self, *args, timeout=None):
+        return await self._conn.fetch(self._sql, *args, timeout=timeout)
+
+    async def fetchrow(self, *args, timeout=None):
+        return await self._conn.fetchrow(self._sql, *args, timeout=timeout)
+
+    async def fetchval(self, *args, column=0, timeout=None):
+        return await self._conn.fetchval(self._sql, *args, column=column, timeout=timeout)
+
+    def cursor(self, *args, prefetch=None, timeout=None):
+        return self._conn.cursor(self._sql, *args, prefetch=prefetch, timeout=timeout)
+
+
+async def _prepared(conn, key: str, sql: str):
+    """Retourne la requête préparée `key` pour cette connexion (préparée une seule fois)."""
+    if not settings.prepared_statements_enabled:
+        return _UnpreparedStatement(conn, sql)
+
+    raw_conn = getattr(conn, "_con", conn)  # PoolConnectionProxy -> Connection
+    statements = _prepared_statements.get(raw_conn)
+    if statements is None:
+        statements = _prepared_statements[raw_conn] = {}
+
+    stmt = statements.get(key)
+    if stmt is None:
+        stmt = statements[key] = await conn.prepare(sql)
+    return stmt
+
+
+async def _prepare_hot_statements(conn: asyncpg.Connection) -> None:
+    """Hook `init` du pool: prépare les requêtes fréquentes à l'ouverture de la connexion.
+
+    Les appels suivants à `_prepared` trouvent la requête déjà en cache et
+    s'exécutent sans phase de parse côté serveur.
+    """
+    statements = _prepared_statements.setdefault(conn, {})
+    for key, sql in _HOT_STATEMENTS.items():
+        statements[key] = await conn.prepare(sql)
 
 
 # ============================================================================
 # USER CRUD
 # ============================================================================
 
+_SQL_INSERT_USER: Final[str] = """
+    WITH ins AS (
+        INSERT INTO public.users (email, full_name, hashed_password, created_at, updated_at, is_active)
+        VALUES ($1, $2, $3, NOW(), NOW(), TRUE)
+        ON CONFLICT (email) DO NOTHING
+        RETURNING id, email, full_name, created_at, updated_at, email_confirmed_at, is_active
+    )
+    SELECT * FROM ins
+    UNION ALL
+    -- Email déjà présent: ligne existante relue, sans nouvelle version ni trigger UPDATE
+    SELECT id, email, full_name, created_at, updated_at, email_confirmed_at, is_active
+    FROM public.users
+    WHERE email = $1 AND NOT EXISTS (SELECT 1 FROM ins)
+"""
+
+
 async def create_user(
     pool: asyncpg.Pool,
     email: str,
@@ -98,75 +304,60 @@ async def create_user(
     full_name: Optional[str] = None
 ) -> Dict[str, Any]:
     """Créer un nouvel utilisateur. hashed_password peut être None pour les utilisateurs invités."""
-    ensure_pool(pool)
-    async with pool.acquire() as conn:
-        # Utiliser la partie locale de l'email comme full_name si non fourni
-        effective_full_name = full_name if full_name else email.split('@')[0]
-        
-        # La colonne id dans public.users est synchronisée depuis auth.users.id
-        # Si nous créons un utilisateur directement ici, il n'aura pas d'entrée auth.users
-        # Cela pourrait être problématique. Idéalement, l'invitation créerait l'utilisateur via Supabase Auth.
-        # Pour cette implémentation, nous allons insérer dans public.users,
-        # mais il faut être conscient de cette potentielle désynchronisation ou de la nécessité
-        # d'un processus d'invitation plus robuste via Supabase.
-
-        # Supposons que la table users (public.users) a une colonne pour le mot de passe haché
-        # et qu'elle est nullable. Le nom de la colonne peut varier (ex: hashed_password, encrypted_password)
-        # Je vais utiliser hashed_password comme dans la signature.
-        # La colonne id doit être gérée correctement, gen_random_uuid() est utilisé ici.
-        
-        user_id = await conn.fetchval(
-            """
-            INSERT INTO public.users (email, full_name, hashed_password, created_at, updated_at, is_active)
-            VALUES ($1, $2, $3, NOW(), NOW(), TRUE)
-            ON CONFLICT (email) DO NOTHING  -- Pour éviter les erreurs si l'email existe déjà, bien que get_user_by_email devrait le gérer
-            RETURNING id
-            """,
-            email,
-            effective_full_name,
-            hashed_password  # Peut être NULL
-        )
-
-        if not user_id: # Si ON CONFLICT DO NOTHING a été déclenché et rien n'a été inséré
-            existing_user = await conn.fetchrow("SELECT id FROM public.users WHERE email = $1", email)
-            if existing_user:
-                user_id = existing_user['id']
-            else:
-                # Cela ne devrait pas arriver si l'email existe et que ON CONFLICT est bien géré
-                raise Exception(f"Impossible de créer ou de récupérer l'utilisateur avec l'email {email}")
+    assert pool is not None, "pool not initialized"
+    # Utiliser la partie locale de l'email comme full_name si non fourni
+    effective_full_name = full_name if full_name else email.split('@')[0]
+    
+    # La colonne id dans public.users est synchronisée depuis auth.users.id
+    # Si nous créons un utilisateur directement ici, il n'aura pas d'entrée auth.users
+    # Cela pourrait être problématique. Idéalement, l'invitation créerait l'utilisateur via Supabase Auth.
+    # Pour cette implémentation, nous allons insérer dans public.users,
+    # mais il faut être conscient de cette potentielle désynchronisation ou de la nécessité
+    # d'un processus d'invitation plus robuste via Supabase.
+
+    # Supposons que la table users (public.users) a une colonne pour le mot de passe haché
+    # et qu'elle est nullable. Le nom de la colonne peut varier (ex: hashed_password, encrypted_password)
+    # Je vais utiliser hashed_password comme dans la signature.
+    # La colonne id doit être gérée correctement, gen_random_uuid() est utilisé ici.
+    
+    user_data = await pool.fetchrow(
+        _SQL_INSERT_USER,
+        email,
+        effective_full_name,
+        hashed_password  # Peut être NULL
+    )
+    # Note: hashed_password n'est pas retourné pour des raisons de sécurité.
+    return dict(user_data) if user_data else None
 
 
-        user_data = await conn.fetchrow(
-            """
-            SELECT id, email, full_name, created_at, updated_at, email_confirmed_at, is_active
-            FROM public.users
-            WHERE id = $1
-            """,
-            user_id
-        )
-        # Note: hashed_password n'est pas retourné pour des raisons de sécurité.
-        return dict(user_data) if user_data else None
+_SQL_GET_USER_BY_EMAIL: Final[str] = """
+    SELECT id, email, full_name, created_at, updated_at, email_confirmed_at, is_active
+    FROM public.users 
+    WHERE email = $1
+"""
 
 
 async def get_user_by_email(pool: asyncpg.Pool, email: str) -> Optional[Dict[str, Any]]:
     """Récupérer un utilisateur par son adresse e-mail."""
-    ensure_pool(pool)
-    async with pool.acquire() as conn:
-        user_data = await conn.fetchrow(
-            """
-            SELECT id, email, full_name, created_at, updated_at, email_confirmed_at, is_active
-            FROM public.users 
-            WHERE email = $1
-            """,
-            email,
-        )
-        return dict(user_data) if user_data else None
+    assert pool is not None, "pool not initialized"
+    user_data = await pool.fetchrow(_SQL_GET_USER_BY_EMAIL, email)
+    return dict(user_data) if user_data else None
 
 
 # ============================================================================
 # TASK DEFINITIONS CRUD
 # ============================================================================
 
+_SQL_CREATE_TASK_DEFINITION: Final[str] = """
+    INSERT INTO task_definitions 
+        (title, description, recurrence_rule, estimated_minutes, 
+         room_id, household_id, is_catalog, created_by, created_at)
+    VALUES ($1, $2, $3, $4, $5, $6, $7, $8, NOW())
+    RETURNING id, title, description, recurrence_rule, estimated_minutes,
+              room_id, household_id, is_catalog, created_by, created_at
+"""
+
+
 async def create_task_definition(
     pool: asyncpg.Pool,
     title: str,
@@ -195,32 +386,67 @@ async def create_task_definition(
     Returns:
         Dict contenant les données de la définition créée
     """
-    ensure_pool(pool)
-    async with pool.acquire() as conn:
-        task_def_id = await conn.fetchval(
-            """
-            INSERT INTO task_definitions 
-                (title, description, recurrence_rule, estimated_minutes, 
-                 room_id, household_id, is_catalog, created_by, created_at)
-            VALUES ($1, $2, $3, $4, $5, $6, $7, $8, NOW())
-            RETURNING id
-            """,
-            title, description, recurrence_rule, estimated_minutes,
-            room_id, household_id, is_catalog, created_by
-        )
-        
-        # Récupérer la définition complète
-        task_def = await conn.fetchrow(
-            """
-            SELECT id, title, description, recurrence_rule, estimated_minutes,
-                   room_id, household_id, is_catalog, created_by, created_at
-            FROM task_definitions
-            WHERE id = $1
-            """,
-            task_def_id
-        )
-        
-        return dict(task_def)
+    assert pool is not None, "pool not initialized"
+    task_def = await pool.fetchrow(
+        _SQL_CREATE_TASK_DEFINITION,
+        title, description, recurrence_rule, estimated_minutes,
+        room_id, household_id, is_catalog, created_by
+    )
+    
+    return dict(task_def)
+
+
+# Colonnes attendues (dans cet ordre) par create_task_definitions_bulk
+TASK_DEFINITION_BULK_COLUMNS: Final[tuple] = (
+    "title",
+    "description",
+    "recurrence_rule",
+    "estimated_minutes",
+    "room_id",
+    "household_id",
+    "is_catalog",
+    "created_by",
+)
+
+
+async def create_task_definitions_bulk(
+    pool: asyncpg.Pool,
+    rows: List[tuple]
+) -> int:
+    """
+    Créer plusieurs définitions de tâches via COPY (seed du catalogue, onboarding).
+    
+    Args:
+        pool: Pool de connexions
+        rows: Tuples dans l'ordre de TASK_DEFINITION_BULK_COLUMNS
+    
+    Returns:
+        Nombre de définitions créées
+    
+    COPY en protocole binaire: un seul aller-retour, sans parse/bind par ligne.
+    Les colonnes absentes (id, created_at, ...) prennent leur valeur par défaut.
+    """
+    if not rows:
+        return 0
+    assert pool is not None, "pool not initialized"
+    result = await pool.copy_records_to_table(
+        "task_definitions",
+        records=rows,
+        columns=TASK_DEFINITION_BULK_COLUMNS,
+    )
+    return int(result.rpartition(" ")[2])
+
+
+_SQL_GET_TASK_DEFINITIONS: Final[str] = """
+    SELECT td.*, r.name as room_name
+    FROM task_definitions td
+    LEFT JOIN rooms r ON td.room_id = r.id
+    WHERE ($1::uuid IS NULL OR td.household_id = $1)
+      AND ($2::boolean IS NULL OR td.is_catalog = $2)
+      AND ($3::uuid IS NULL OR td.room_id = $3)
+      AND ($4::uuid IS NULL OR td.created_by = $4)
+    ORDER BY td.title
+"""
 
 
 async def get_task_definitions(
@@ -229,7 +455,7 @@ async def get_task_definitions(
     is_catalog: Optional[bool] = None,
     room_id: Optional[UUID] = None,
     created_by: Optional[UUID] = None
-) -> List[Dict[str, Any]]:
+) -> List[Row]:
     """
     Récupérer les définitions de tâches selon les filtres.
     
@@ -243,42 +469,19 @@ async def get_task_definitions(
     Returns:
         Liste des définitions de tâches
     """
-    ensure_pool(pool)
-    async with pool.acquire() as conn:
-        # Construire la requête dynamiquement
-        query = """
-            SELECT td.*, r.name as room_name
-            FROM task_definitions td
-            LEFT JOIN rooms r ON td.room_id = r.id
-            WHERE 1=1
-        """
-        params = []
-        param_count = 0
-        
-        if household_id is not None:
-            param_count += 1
-            query += f" AND td.household_id = ${param_count}"
-            params.append(household_id)
-        
-        if is_catalog is not None:
-            param_count += 1
-            query += f" AND td.is_catalog = ${param_count}"
-            params.append(is_catalog)
-        
-        if room_id is not None:
-            param_count += 1
-            query += f" AND td.room_id = ${param_count}"
-            params.append(room_id)
-        
-        if created_by is not None:
-            param_count += 1
-            query += f" AND td.created_by = ${param_count}"
-            params.append(created_by)
-        
-        query += " ORDER BY td.title"
-        
-        rows = await conn.fetch(query, *params)
-        return [dict(row) for row in rows]
+    assert pool is not None, "pool not initialized"
+    # Texte fixe (filtres absents passés à NULL): un seul plan en cache
+    return await pool.fetch(
+        _SQL_GET_TASK_DEFINITIONS, household_id, is_catalog, room_id, created_by
+    )
+
+
+_SQL_GET_TASK_DEFINITION: Final[str] = """
+    SELECT td.*, r.name as room_name
+    FROM task_definitions td
+    LEFT JOIN rooms r ON td.room_id = r.id
+    WHERE td.id = $1
+"""
 
 
 async def get_task_definition(
@@ -295,21 +498,72 @@ async def get_task_definition(
     Returns:
         Dict avec les données ou None si non trouvée
     """
-    ensure_pool(pool)
+    assert pool is not None, "pool not initialized"
     async with pool.acquire() as conn:
-        row = await conn.fetchrow(
-            """
-            SELECT td.*, r.name as room_name
-            FROM task_definitions td
-            LEFT JOIN rooms r ON td.room_id = r.id
-            WHERE td.id = $1
-            """,
-            task_def_id
+        stmt = await _prepared(
+            conn,
+            "get_task_definition",
+            _SQL_GET_TASK_DEFINITION,
         )
+        row = await stmt.fetchrow(task_def_id)
         
         return dict(row) if row else None
 
 
+_SQL_GET_TASK_DEFINITIONS_BY_IDS: Final[str] = """
+    SELECT td.*, r.name as room_name
+    FROM task_definitions td
+    LEFT JOIN rooms r ON td.room_id = r.id
+    WHERE td.id = ANY($1::uuid[])
+"""
+
+
+async def get_task_definitions_by_ids(
+    pool: asyncpg.Pool,
+    task_def_ids: Sequence[UUID]
+) -> Dict[UUID, Row]:
+    """
+    Récupérer plusieurs définitions de tâches en une seule requête.
+    
+    Args:
+        pool: Pool de connexions
+        task_def_ids: IDs des définitions
+    
+    Returns:
+        Dict id -> ligne (les IDs introuvables sont absents)
+    """
+    assert pool is not None, "pool not initialized"
+    rows = await pool.fetch(_SQL_GET_TASK_DEFINITIONS_BY_IDS, list(task_def_ids))
+    return {row["id"]: row for row in rows}
+
+
+_TASK_DEFINITION_UPDATABLE_FIELDS: Final[tuple] = (
+    'title',
+    'description',
+    'recurrence_rule',
+    'estimated_minutes',
+    'room_id',
+    'start_date',
+    'priority',
+)
+
+
+@lru_cache(maxsize=None)
+def _update_task_definition_sql(fields: tuple) -> str:
+    """Texte de l'UPDATE pour une combinaison de champs (ordre canonique).
+
+    Le même texte est réutilisé d'une requête à l'autre, ce qui permet au
+    cache de requêtes préparées d'asyncpg de le retrouver.
+    """
+    assignments = ", ".join(f"{field} = ${i}" for i, field in enumerate(fields, start=2))
+    return f"""
+        UPDATE task_definitions
+        SET {assignments}
+        WHERE id = $1
+        RETURNING *
+    """
+
+
 async def update_task_definition(
     pool: asyncpg.Pool,
     task_def_id: UUID,
@@ -326,42 +580,25 @@ async def update_task_definition(
     Returns:
         Dict avec les données mises à jour
     """
-    ensure_pool(pool)
-    async with pool.acquire() as conn:
-        # Construire la requête UPDATE dynamiquement
-        update_fields = []
-        params = [task_def_id]
-        param_count = 1
-
-        allowed_fields = [
-            'title',
-            'description',
-            'recurrence_rule',
-            'estimated_minutes',
-            'room_id',
-            'start_date',
-            'priority',
-        ]
+    assert pool is not None, "pool not initialized"
+    fields = tuple(
+        field for field in _TASK_DEFINITION_UPDATABLE_FIELDS
+        if kwargs.get(field) is not None
+    )
 
-        for field, value in kwargs.items():
-            if field in allowed_fields and value is not None:
-                param_count += 1
-                update_fields.append(f"{field} = ${param_count}")
-                params.append(value)
-        
-        if not update_fields:
-            # Rien à mettre à jour
-            return await get_task_definition(pool, task_def_id)
-        
-        query = f"""
-            UPDATE task_definitions
-            SET {', '.join(update_fields)}
-            WHERE id = $1
-            RETURNING *
-        """
-        
-        row = await conn.fetchrow(query, *params)
-        return dict(row) if row else None
+    if not fields:
+        # Rien à mettre à jour
+        return await get_task_definition(pool, task_def_id)
+
+    query = _update_task_definition_sql(fields)
+    params = [kwargs[field] for field in fields]
+
+    row = await pool.fetchrow(query, task_def_id, *params)
+    occurrences_view_refresher.request_refresh()
+    return dict(row) if row else None
+
+
+_SQL_DELETE_TASK_DEFINITION: Final[str] = "DELETE FROM task_definitions WHERE id = $1 RETURNING 1"
 
 
 async def delete_task_definition(
@@ -379,13 +616,21 @@ async def delete_task_definition(
     Returns:
         True si supprimée, False sinon
     """
-    ensure_pool(pool)
-    async with pool.acquire() as conn:
-        result = await conn.execute(
-            "DELETE FROM task_definitions WHERE id = $1",
-            task_def_id
-        )
-        return "DELETE 1" in result
+    assert pool is not None, "pool not initialized"
+    deleted = await pool.fetchval(
+        _SQL_DELETE_TASK_DEFINITION,
+        task_def_id
+    )
+    occurrences_view_refresher.request_refresh()
+    return deleted is not None
+
+
+_SQL_DELETE_STALE_OCCURRENCES: Final[str] = """
+    DELETE FROM task_occurrences
+    WHERE task_id = $1
+      AND scheduled_date < $2
+      AND status IN ('pending','snoozed','overdue')
+"""
 
 
 async def delete_future_today_occurrence_if_needed(
@@ -397,24 +642,50 @@ async def delete_future_today_occurrence_if_needed(
     Si on décale la start_date dans le futur, supprimer l'occurrence d'aujourd'hui
     (et celles antérieures) qui ne devraient plus exister si elles ne sont pas DONE/SKIPPED.
     """
-    ensure_pool(pool)
-    async with pool.acquire() as conn:
-        await conn.execute(
-            """
-            DELETE FROM task_occurrences
-            WHERE task_id = $1
-              AND scheduled_date < $2
-              AND status IN ('pending','snoozed','overdue')
-            """,
-            task_def_id,
-            new_start_date,
-        )
+    assert pool is not None, "pool not initialized"
+    await pool.execute(
+        _SQL_DELETE_STALE_OCCURRENCES,
+        task_def_id,
+        new_start_date,
+    )
+    occurrences_view_refresher.request_refresh()
 
 
 # ============================================================================
 # TASK OCCURRENCES CRUD
 # ============================================================================
 
+_SQL_INSERT_TASK_OCCURRENCE: Final[str] = """
+    WITH inserted AS (
+        INSERT INTO task_occurrences 
+            (task_id, scheduled_date, due_at, status, assigned_to, created_at)
+        VALUES ($1, $2, $3, $4, $5, NOW())
+        ON CONFLICT (task_id, scheduled_date) DO NOTHING
+        RETURNING *
+    ), occ AS (
+        -- Occurrence déjà présente pour cette tâche à cette date: on la retourne
+        SELECT * FROM inserted
+        UNION ALL
+        SELECT * FROM task_occurrences
+        WHERE task_id = $1 AND scheduled_date = $2
+    )
+    SELECT 
+        o.*,
+        td.title as task_title,
+        td.description as task_description,
+        td.estimated_minutes,
+        td.room_id,
+        td.priority as definition_priority,
+        r.name as room_name,
+        u.email as assigned_user_email
+    FROM occ o
+    JOIN task_definitions td ON o.task_id = td.id
+    LEFT JOIN rooms r ON td.room_id = r.id
+    LEFT JOIN auth.users u ON o.assigned_to = u.id
+    LIMIT 1
+"""
+
+
 async def create_task_occurrence(
     pool: asyncpg.Pool,
     task_id: UUID,
@@ -433,33 +704,57 @@ async def create_task_occurrence(
         assigned_to: ID de l'utilisateur assigné
     
     Returns:
-        Dict avec les données de l'occurrence créée
+        Dict avec les données de l'occurrence créée (mêmes colonnes que get_task_occurrence)
     """
-    ensure_pool(pool)
-    async with pool.acquire() as conn:
-        try:
-            occurrence_id = await conn.fetchval(
-                """
-                INSERT INTO task_occurrences 
-                    (task_id, scheduled_date, due_at, status, assigned_to, created_at)
-                VALUES ($1, $2, $3, $4, $5, NOW())
-                RETURNING id
-                """,
-                task_id, scheduled_date, due_at, TaskStatus.PENDING.value, assigned_to
-            )
-            
-            return await get_task_occurrence(pool, occurrence_id)
-            
-        except asyncpg.UniqueViolationError:
-            # Une occurrence existe déjà pour cette tâche à cette date
-            existing = await conn.fetchrow(
-                """
-                SELECT * FROM task_occurrences
-                WHERE task_id = $1 AND scheduled_date = $2
-                """,
-                task_id, scheduled_date
-            )
-            return dict(existing) if existing else None
+    assert pool is not None, "pool not initialized"
+    # INSERT (ou occurrence existante) et jointures de détail en une seule requête
+    row = await pool.fetchrow(
+        _SQL_INSERT_TASK_OCCURRENCE,
+        task_id, scheduled_date, due_at, _STATUS_PENDING, assigned_to
+    )
+    occurrences_view_refresher.request_refresh()
+    return dict(row) if row else None
+
+
+_SQL_GET_TASK_OCCURRENCES: Final[str] = """
+    SELECT 
+        o.*,
+        td.title as task_title,
+        td.description as task_description,
+        td.estimated_minutes,
+        td.room_id,
+        td.priority as definition_priority,
+        r.name as room_name,
+        u.email as assigned_user_email
+    FROM task_occurrences o
+    JOIN task_definitions td ON o.task_id = td.id
+    LEFT JOIN rooms r ON td.room_id = r.id
+    LEFT JOIN auth.users u ON o.assigned_to = u.id
+    WHERE ($1::uuid IS NULL OR o.household_id = $1)
+      AND ($2::date IS NULL OR o.scheduled_date >= $2)
+      AND ($3::date IS NULL OR o.scheduled_date <= $3)
+      AND ($4::task_status IS NULL OR o.status = $4)
+      AND ($5::uuid IS NULL OR o.assigned_to = $5)
+      AND ($6::uuid IS NULL OR td.room_id = $6)
+      -- Pagination par clé (due_at, id): page suivant le curseur $7/$8
+      AND ($7::timestamptz IS NULL OR (o.due_at, o.id) > ($7, $8::uuid))
+    ORDER BY o.due_at, o.id
+    LIMIT $9::int
+"""
+# Même requête sur la vue matérialisée (colonnes de jointure déjà présentes)
+_SQL_GET_TASK_OCCURRENCES_FROM_VIEW: Final[str] = f"""
+    SELECT o.*
+    FROM {OCCURRENCES_VIEW} o
+    WHERE ($1::uuid IS NULL OR o.household_id = $1)
+      AND ($2::date IS NULL OR o.scheduled_date >= $2)
+      AND ($3::date IS NULL OR o.scheduled_date <= $3)
+      AND ($4::task_status IS NULL OR o.status = $4)
+      AND ($5::uuid IS NULL OR o.assigned_to = $5)
+      AND ($6::uuid IS NULL OR o.room_id = $6)
+      AND ($7::timestamptz IS NULL OR (o.due_at, o.id) > ($7, $8::uuid))
+    ORDER BY o.due_at, o.id
+    LIMIT $9::int
+"""
 
 
 async def get_task_occurrences(
@@ -469,8 +764,11 @@ async def get_task_occurrences(
     end_date: Optional[date] = None,
     status: Optional[TaskStatus] = None,
     assigned_to: Optional[UUID] = None,
-    room_id: Optional[UUID] = None
-) -> List[Dict[str, Any]]:
+    room_id: Optional[UUID] = None,
+    after: Optional[Tuple[datetime, UUID]] = None,
+    limit: Optional[int] = None,
+    fresh: bool = False,
+) -> List[Row]:
     """
     Récupérer les occurrences de tâches selon les filtres.
     
@@ -482,65 +780,98 @@ async def get_task_occurrences(
         status: Filtrer par statut
         assigned_to: Filtrer par assignation
         room_id: Filtrer par pièce
+        after: Curseur (due_at, id) de la dernière occurrence de la page précédente
+        limit: Taille de page (None: toutes les occurrences)
+        fresh: Lire les tables même si la vue matérialisée est activée
     
     Returns:
-        Liste des occurrences avec les infos de définition
+        Liste des occurrences avec les infos de définition, triées par (due_at, id).
+        Le curseur de la page suivante est occurrence_cursor(dernière ligne).
+    
+    Avec OCCURRENCES_VIEW_ENABLED, la lecture se fait sur la vue matérialisée
+    pré-jointe, rafraîchie quelques secondes après chaque mutation: passer
+    `fresh=True` juste après une écriture pour la voir dans le résultat.
     """
-    ensure_pool(pool)
+    assert pool is not None, "pool not initialized"
+    status_value = status.value if hasattr(status, 'value') else status
+    after_due_at, after_id = after if after is not None else (None, None)
     async with pool.acquire() as conn:
-        query = """
-            SELECT 
-                o.*,
-                td.title as task_title,
-                td.description as task_description,
-                td.estimated_minutes,
-                td.room_id,
-                td.priority as definition_priority,
-                r.name as room_name,
-                u.email as assigned_user_email
-            FROM task_occurrences o
-            JOIN task_definitions td ON o.task_id = td.id
-            LEFT JOIN rooms r ON td.room_id = r.id
-            LEFT JOIN auth.users u ON o.assigned_to = u.id
-            WHERE 1=1
-        """
-        params = []
-        param_count = 0
-        
-        if household_id is not None:
-            param_count += 1
-            query += f" AND td.household_id = ${param_count}"
-            params.append(household_id)
-        
-        if start_date is not None:
-            param_count += 1
-            query += f" AND o.scheduled_date >= ${param_count}"
-            params.append(start_date)
-        
-        if end_date is not None:
-            param_count += 1
-            query += f" AND o.scheduled_date <= ${param_count}"
-            params.append(end_date)
-        
-        if status is not None:
-            param_count += 1
-            query += f" AND o.status = ${param_count}"
-            params.append(status.value if hasattr(status, 'value') else status)
-        
-        if assigned_to is not None:
-            param_count += 1
-            query += f" AND o.assigned_to = ${param_count}"
-            params.append(assigned_to)
-        
-        if room_id is not None:
-            param_count += 1
-            query += f" AND td.room_id = ${param_count}"
-            params.append(room_id)
-        
-        query += " ORDER BY o.due_at"
-        
-        rows = await conn.fetch(query, *params)
-        return [dict(row) for row in rows]
+        stmt = await _task_occurrences_statement(conn, fresh)
+        return await stmt.fetch(
+            household_id, start_date, end_date, status_value, assigned_to, room_id,
+            after_due_at, after_id, limit
+        )
+
+
+async def iter_task_occurrences(
+    pool: asyncpg.Pool,
+    household_id: Optional[UUID] = None,
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    status: Optional[TaskStatus] = None,
+    assigned_to: Optional[UUID] = None,
+    room_id: Optional[UUID] = None,
+    prefetch: int = 500,
+    fresh: bool = False,
+) -> AsyncIterator[Row]:
+    """
+    Parcourir les occurrences (mêmes filtres et ordre que get_task_occurrences)
+    via un curseur serveur, `prefetch` lignes à la fois.
+    
+    La mémoire reste bornée quel que soit le nombre de lignes. La connexion est
+    conservée (dans une transaction) jusqu'à la fin du parcours.
+    """
+    assert pool is not None, "pool not initialized"
+    status_value = status.value if hasattr(status, 'value') else status
+    async with pool.acquire() as conn:
+        async with conn.transaction():
+            stmt = await _task_occurrences_statement(conn, fresh)
+            async for row in stmt.cursor(
+                household_id, start_date, end_date, status_value, assigned_to, room_id,
+                None, None, None,
+                prefetch=prefetch,
+            ):
+                yield row
+
+
+async def _task_occurrences_statement(conn, fresh: bool = False):
+    """Requête de liste des occurrences (tables ou vue matérialisée), préparée."""
+    # Requête unique (filtres NULL-tolérants): un seul plan préparé pour
+    # toutes les combinaisons de filtres
+    if settings.occurrences_view_enabled and not fresh:
+        return await _prepared(
+            conn,
+            "get_task_occurrences_from_view",
+            _SQL_GET_TASK_OCCURRENCES_FROM_VIEW,
+        )
+    return await _prepared(
+        conn,
+        "get_task_occurrences",
+        _SQL_GET_TASK_OCCURRENCES,
+    )
+
+
+def occurrence_cursor(occurrence) -> Tuple[datetime, UUID]:
+    """Curseur de pagination (due_at, id) d'une occurrence, pour `after`."""
+    return occurrence["due_at"], occurrence["id"]
+
+
+_SQL_GET_TASK_OCCURRENCE: Final[str] = """
+    SELECT 
+        o.*,
+        td.title as task_title,
+        td.description as task_description,
+        td.estimated_minutes,
+        td.room_id,
+        td.priority as definition_priority,
+        r.name as room_name,
+        u.email as assigned_user_email
+    FROM task_occurrences o
+    JOIN task_definitions td ON o.task_id = td.id
+    LEFT JOIN rooms r ON td.room_id = r.id
+    LEFT JOIN auth.users u ON o.assigned_to = u.id
+    WHERE o.id = $1
+"""
 
 
 async def get_task_occurrence(
@@ -551,30 +882,57 @@ async def get_task_occurrence(
     Récupérer une occurrence spécifique avec ses détails.
     """
     async with pool.acquire() as conn:
-        row = await conn.fetchrow(
-            """
-            SELECT 
-                o.*,
-                td.title as task_title,
-                td.description as task_description,
-                td.estimated_minutes,
-                td.room_id,
-                td.household_id,
-                td.priority as definition_priority,
-                r.name as room_name,
-                u.email as assigned_user_email
-            FROM task_occurrences o
-            JOIN task_definitions td ON o.task_id = td.id
-            LEFT JOIN rooms r ON td.room_id = r.id
-            LEFT JOIN auth.users u ON o.assigned_to = u.id
-            WHERE o.id = $1
-            """,
-            occurrence_id
+        stmt = await _prepared(
+            conn,
+            "get_task_occurrence",
+            _SQL_GET_TASK_OCCURRENCE,
         )
+        row = await stmt.fetchrow(occurrence_id)
         
         return dict(row) if row else None
 
 
+_SQL_GET_TASK_OCCURRENCES_BY_IDS: Final[str] = """
+    SELECT 
+        o.*,
+        td.title as task_title,
+        td.description as task_description,
+        td.estimated_minutes,
+        td.room_id,
+        td.priority as definition_priority,
+        r.name as room_name,
+        u.email as assigned_user_email
+    FROM task_occurrences o
+    JOIN task_definitions td ON o.task_id = td.id
+    LEFT JOIN rooms r ON td.room_id = r.id
+    LEFT JOIN auth.users u ON o.assigned_to = u.id
+    WHERE o.id = ANY($1::uuid[])
+"""
+
+
+async def get_task_occurrences_by_ids(
+    pool: asyncpg.Pool,
+    occurrence_ids: Sequence[UUID]
+) -> Dict[UUID, Row]:
+    """
+    Récupérer plusieurs occurrences (mêmes colonnes que get_task_occurrence)
+    en une seule requête.
+    
+    Returns:
+        Dict id -> ligne (les IDs introuvables sont absents)
+    """
+    assert pool is not None, "pool not initialized"
+    rows = await pool.fetch(_SQL_GET_TASK_OCCURRENCES_BY_IDS, list(occurrence_ids))
+    return {row["id"]: row for row in rows}
+
+
+_SQL_DELETE_TASK_OCCURRENCE: Final[str] = """
+    DELETE FROM task_occurrences
+    WHERE id = $1
+    RETURNING 1
+"""
+
+
 async def delete_task_occurrence(
     pool: asyncpg.Pool,
     occurrence_id: UUID
@@ -584,16 +942,44 @@ async def delete_task_occurrence(
 
     Retourne True si une ligne a été supprimée, False sinon.
     """
-    ensure_pool(pool)
-    async with pool.acquire() as conn:
-        result = await conn.execute(
-            """
-            DELETE FROM task_occurrences
-            WHERE id = $1
-            """,
-            occurrence_id,
-        )
-        return "DELETE 1" in result
+    assert pool is not None, "pool not initialized"
+    deleted = await pool.fetchval(
+        _SQL_DELETE_TASK_OCCURRENCE,
+        occurrence_id,
+    )
+    occurrences_view_refresher.request_refresh()
+    return deleted is not None
+
+
+_SQL_UPDATE_TASK_OCCURRENCE_STATUS: Final[str] = """
+    WITH upd AS (
+        UPDATE task_occurrences
+        SET status = $2::task_status,
+            -- $3: assigned_to fourni (NULL = désassigner)
+            assigned_to = CASE WHEN $3::boolean THEN $4::uuid ELSE assigned_to END,
+            -- Hors SNOOZED, snoozed_until est effacé; $5: snoozed_until fourni
+            snoozed_until = CASE
+                WHEN $2::task_status <> 'snoozed' THEN NULL
+                WHEN $5::boolean THEN $6::timestamptz
+                ELSE snoozed_until
+            END
+        WHERE id = $1
+        RETURNING *
+    )
+    SELECT 
+        o.*,
+        td.title as task_title,
+        td.description as task_description,
+        td.estimated_minutes,
+        td.room_id,
+        td.priority as definition_priority,
+        r.name as room_name,
+        u.email as assigned_user_email
+    FROM upd o
+    JOIN task_definitions td ON o.task_id = td.id
+    LEFT JOIN rooms r ON td.room_id = r.id
+    LEFT JOIN auth.users u ON o.assigned_to = u.id
+"""
 
 
 async def update_task_occurrence_status(
@@ -612,36 +998,38 @@ async def update_task_occurrence_status(
         **kwargs: Champs additionnels (assigned_to, snoozed_until)
     
     Returns:
-        Dict avec les données mises à jour
+        Dict avec les données mises à jour (mêmes colonnes que get_task_occurrence)
     """
-    async with pool.acquire() as conn:
-        # Construire la requête UPDATE
-        update_fields = ["status = $2"]
-        params = [occurrence_id, status.value]
-        param_count = 2
-        
-        if 'assigned_to' in kwargs:
-            param_count += 1
-            update_fields.append(f"assigned_to = ${param_count}")
-            params.append(kwargs['assigned_to'])
-        
-        if 'snoozed_until' in kwargs and status == TaskStatus.SNOOZED:
-            param_count += 1
-            update_fields.append(f"snoozed_until = ${param_count}")
-            params.append(kwargs['snoozed_until'])
-        elif status != TaskStatus.SNOOZED:
-            # Effacer snoozed_until si le statut n'est pas SNOOZED
-            update_fields.append("snoozed_until = NULL")
-        
-        query = f"""
-            UPDATE task_occurrences
-            SET {', '.join(update_fields)}
-            WHERE id = $1
-            RETURNING *
-        """
-        
-        await conn.execute(query, *params)
-        return await get_task_occurrence(pool, occurrence_id)
+    assert pool is not None, "pool not initialized"
+    # Une seule requête pour toutes les combinaisons de champs: les champs
+    # absents sont signalés par un booléen plutôt que par une variante de SQL
+    row = await pool.fetchrow(
+        _SQL_UPDATE_TASK_OCCURRENCE_STATUS,
+        occurrence_id,
+        status.value,
+        'assigned_to' in kwargs,
+        kwargs.get('assigned_to'),
+        'snoozed_until' in kwargs,
+        kwargs.get('snoozed_until'),
+    )
+    occurrences_view_refresher.request_refresh()
+    return dict(row) if row else None
+
+
+_SQL_COMPLETE_TASK_OCCURRENCE: Final[str] = """
+    WITH upd AS (
+        UPDATE task_occurrences
+        SET status = $1, snoozed_until = NULL
+        WHERE id = $2
+        RETURNING id
+    )
+    INSERT INTO task_completions
+        (occurrence_id, completed_by, completed_at, 
+         duration_minutes, comment, photo_url, created_at)
+    SELECT upd.id, $3, NOW(), $4, $5, $6, NOW()
+    FROM upd
+    RETURNING *
+"""
 
 
 async def complete_task_occurrence(
@@ -664,39 +1052,221 @@ async def complete_task_occurrence(
         photo_url: URL de photo optionnelle
     
     Returns:
-        Dict avec les données de complétion
+        Dict avec les données de complétion, ou None si l'occurrence n'existe pas
     """
-    async with pool.acquire() as conn:
-        async with conn.transaction():
-            # Mettre à jour le statut de l'occurrence
-            await conn.execute(
-                """
-                UPDATE task_occurrences
-                SET status = $1, snoozed_until = NULL
-                WHERE id = $2
-                """,
-                TaskStatus.DONE.value, occurrence_id
-            )
-            
-            # Créer l'enregistrement de complétion
-            completion = await conn.fetchrow(
-                """
-                INSERT INTO task_completions
-                    (occurrence_id, completed_by, completed_at, 
-                     duration_minutes, comment, photo_url, created_at)
-                VALUES ($1, $2, NOW(), $3, $4, $5, NOW())
-                RETURNING *
-                """,
-                occurrence_id, completed_by, duration_minutes, comment, photo_url
-            )
-            
-            return dict(completion)
+    assert pool is not None, "pool not initialized"
+    # Mise à jour du statut et création de la complétion en une seule
+    # instruction (atomique sans transaction explicite). Aucune complétion
+    # n'est créée si l'occurrence n'existe pas.
+    completion = await pool.fetchrow(
+        _SQL_COMPLETE_TASK_OCCURRENCE,
+        _STATUS_DONE, occurrence_id,
+        completed_by, duration_minutes, comment, photo_url
+    )
+    occurrences_view_refresher.request_refresh()
+    return dict(completion) if completion else None
 
 
 # ============================================================================
 # GÉNÉRATION D'OCCURRENCES
 # ============================================================================
 
+_SQL_GET_TASK_DEFINITION_ROW: Final[str] = "SELECT * FROM task_definitions WHERE id = $1"
+_SQL_INSERT_TASK_OCCURRENCES_BULK: Final[str] = """
+    WITH ins AS (
+        INSERT INTO task_occurrences
+            (task_id, scheduled_date, due_at, status, created_at)
+        SELECT t.task_id, t.scheduled_date, t.due_at, $4::task_status, NOW()
+        FROM unnest($1::uuid[], $2::date[], $3::timestamptz[])
+            AS t(task_id, scheduled_date, due_at)
+        ON CONFLICT (task_id, scheduled_date) DO NOTHING
+        RETURNING *
+    ), occ AS (
+        -- Les lignes insérées ne sont visibles que via RETURNING: on y ajoute
+        -- les occurrences qui existaient déjà pour les mêmes (tâche, date)
+        SELECT * FROM ins
+        UNION ALL
+        SELECT o.*
+        FROM task_occurrences o
+        JOIN unnest($1::uuid[], $2::date[]) AS t(task_id, scheduled_date)
+          ON o.task_id = t.task_id AND o.scheduled_date = t.scheduled_date
+    )
+    SELECT 
+        o.*,
+        td.title as task_title,
+        td.description as task_description,
+        td.estimated_minutes,
+        td.room_id,
+        td.priority as definition_priority,
+        r.name as room_name,
+        u.email as assigned_user_email
+    FROM occ o
+    JOIN task_definitions td ON o.task_id = td.id
+    LEFT JOIN rooms r ON td.room_id = r.id
+    LEFT JOIN auth.users u ON o.assigned_to = u.id
+    ORDER BY o.task_id, o.scheduled_date
+"""
+
+# Gros volumes (génération d'un ménage entier): COPY binaire dans une table
+# temporaire, puis un seul INSERT ... SELECT pour appliquer la contrainte unique.
+_OCCURRENCES_COPY_THRESHOLD: Final[int] = 500
+_OCCURRENCES_STAGING_TABLE: Final[str] = "task_occurrences_staging"
+_OCCURRENCES_STAGING_COLUMNS: Final[Tuple[str, ...]] = ("task_id", "scheduled_date", "due_at")
+_SQL_CREATE_OCCURRENCES_STAGING: Final[str] = f"""
+    CREATE TEMP TABLE {_OCCURRENCES_STAGING_TABLE} (
+        task_id uuid NOT NULL,
+        scheduled_date date NOT NULL,
+        due_at timestamptz NOT NULL
+    ) ON COMMIT DROP
+"""
+_SQL_INSERT_TASK_OCCURRENCES_FROM_STAGING: Final[str] = f"""
+    WITH ins AS (
+        INSERT INTO task_occurrences
+            (task_id, scheduled_date, due_at, status, created_at)
+        SELECT t.task_id, t.scheduled_date, t.due_at, $1::task_status, NOW()
+        FROM {_OCCURRENCES_STAGING_TABLE} t
+        ON CONFLICT (task_id, scheduled_date) DO NOTHING
+        RETURNING *
+    ), occ AS (
+        SELECT * FROM ins
+        UNION ALL
+        SELECT o.*
+        FROM task_occurrences o
+        JOIN {_OCCURRENCES_STAGING_TABLE} t
+          ON o.task_id = t.task_id AND o.scheduled_date = t.scheduled_date
+    )
+    SELECT 
+        o.*,
+        td.title as task_title,
+        td.description as task_description,
+        td.estimated_minutes,
+        td.room_id,
+        td.priority as definition_priority,
+        r.name as room_name,
+        u.email as assigned_user_email
+    FROM occ o
+    JOIN task_definitions td ON o.task_id = td.id
+    LEFT JOIN rooms r ON td.room_id = r.id
+    LEFT JOIN auth.users u ON o.assigned_to = u.id
+    ORDER BY o.task_id, o.scheduled_date
+"""
+
+
+@lru_cache(maxsize=2048)
+def _parse_rrule(rule: str, anchor_date: date):
+    """
+    Parser une RRULE ancrée à minuit du jour donné.
+    
+    Mémoïsé: les mêmes règles sont re-parsées à chaque génération (une par
+    définition, à chaque passage). Les objets rrule ne sont pas modifiés par
+    between/after/before, ils peuvent donc être partagés.
+    """
+    return rrulestr(rule, dtstart=datetime.combine(anchor_date, datetime.min.time()))
+
+
+def _parse_definition_rrule(task_def, start_date: date, end_date: date):
+    """
+    Préparer la règle de récurrence d'une définition pour une fenêtre de génération.
+    
+    Returns:
+        (rrule, range_start_dt, end_datetime), ou None si la règle est invalide
+    """
+    try:
+        # Convertir les dates en datetime pour rrule
+        # Ancrer la RRULE sur la start_date de la tâche si définie (semantique d'ancrage),
+        # mais générer sur la plage effective [max(start_date, task_start_date), end_date]
+        task_start_date = task_def.get('start_date')
+
+        # Ancrage (dtstart) pour la RRULE
+        anchor_date = task_start_date if (task_start_date and isinstance(task_start_date, date)) else start_date
+
+        # Plage effective de génération
+        if task_start_date and isinstance(task_start_date, date):
+            range_start_date = max(start_date, task_start_date)
+        else:
+            range_start_date = start_date
+
+        range_start_dt = datetime.combine(range_start_date, datetime.min.time())
+        end_datetime = datetime.combine(end_date, datetime.max.time())
+
+        rrule = _parse_rrule(task_def['recurrence_rule'], anchor_date)
+    except Exception:
+        # Si la règle est invalide, ne pas générer d'occurrences
+        return None
+    return rrule, range_start_dt, end_datetime
+
+
+def _occurrence_dates(
+    rrule,
+    range_start_dt: datetime,
+    end_datetime: datetime,
+    max_occurrences: int,
+) -> List[date]:
+    """
+    Dates d'occurrence dans [range_start_dt, end_datetime], au plus max_occurrences.
+    
+    Parcours paresseux (xafter): on s'arrête au plafond ou à la fin de la
+    fenêtre, sans matérialiser toutes les occurrences comme between().
+    """
+    dates = []
+    for occurrence_date in islice(rrule.xafter(range_start_dt, inc=True), max_occurrences):
+        if occurrence_date > end_datetime:
+            break
+        dates.append(occurrence_date.date())
+    return dates
+
+
+def _virtual_occurrence(task_def_id: UUID, scheduled_date: date, due_at: datetime) -> Dict[str, Any]:
+    """Occurrence non persistée (prévisualisation / dry-run)."""
+    return {
+        'id': uuid4(),
+        'task_id': task_def_id,
+        'scheduled_date': scheduled_date,
+        'due_at': due_at,
+        'status': _STATUS_PENDING,
+        'assigned_to': None,
+        'snoozed_until': None,
+        'created_at': datetime.utcnow(),
+    }
+
+
+async def _insert_task_occurrences_bulk(
+    pool: asyncpg.Pool,
+    task_ids: List[UUID],
+    scheduled_dates: List[date],
+) -> List[Row]:
+    """
+    Créer en une seule requête les occurrences (task_ids[i], scheduled_dates[i]).
+    
+    Les occurrences déjà existantes sont conservées telles quelles et retournées
+    avec les nouvelles (même comportement que create_task_occurrence).
+    Au-delà de _OCCURRENCES_COPY_THRESHOLD lignes, les données passent par COPY.
+    """
+    if not task_ids:
+        return []
+    due_ats = [datetime.combine(d, datetime.max.time()) for d in scheduled_dates]
+    if len(task_ids) >= _OCCURRENCES_COPY_THRESHOLD:
+        async with pool.acquire() as conn:
+            async with conn.transaction():
+                await conn.execute(_SQL_CREATE_OCCURRENCES_STAGING)
+                await conn.copy_records_to_table(
+                    _OCCURRENCES_STAGING_TABLE,
+                    records=zip(task_ids, scheduled_dates, due_ats),
+                    columns=_OCCURRENCES_STAGING_COLUMNS,
+                )
+                rows = await conn.fetch(
+                    _SQL_INSERT_TASK_OCCURRENCES_FROM_STAGING,
+                    _STATUS_PENDING
+                )
+    else:
+        rows = await pool.fetch(
+            _SQL_INSERT_TASK_OCCURRENCES_BULK,
+            task_ids, scheduled_dates, due_ats, _STATUS_PENDING
+        )
+    occurrences_view_refresher.request_refresh()
+    return rows
+
+
 async def generate_occurrences_for_definition(
     pool: asyncpg.Pool,
     task_def_id: UUID,
@@ -718,139 +1288,76 @@ async def generate_occurrences_for_definition(
     Returns:
         Liste des occurrences créées
     """
-    async with pool.acquire() as conn:
-        # Récupérer la définition
-        task_def = await conn.fetchrow(
-            "SELECT * FROM task_definitions WHERE id = $1",
-            task_def_id
-        )
-        
-        if not task_def:
-            return []
-        # Convertir en dict pour utiliser .get sans erreur
-        task_def = dict(task_def)
-        
-        # Parser la règle de récurrence
-        try:
-            # Convertir les dates en datetime pour rrule
-            # Ancrer la RRULE sur la start_date de la tâche si définie (semantique d'ancrage),
-            # mais générer sur la plage effective [max(start_date, task_start_date), end_date]
-            task_start_date = task_def.get('start_date')
-
-            # Ancrage (dtstart) pour la RRULE
-            anchor_date = task_start_date if (task_start_date and isinstance(task_start_date, date)) else start_date
-            dtstart_anchor = datetime.combine(anchor_date, datetime.min.time())
-
-            # Plage effective de génération
-            if task_start_date and isinstance(task_start_date, date):
-                range_start_date = max(start_date, task_start_date)
-            else:
-                range_start_date = start_date
-
-            range_start_dt = datetime.combine(range_start_date, datetime.min.time())
-            end_datetime = datetime.combine(end_date, datetime.max.time())
-
-            rrule = rrulestr(task_def['recurrence_rule'], dtstart=dtstart_anchor)
-        except Exception:
-            # Si la règle est invalide, ne pas générer d'occurrences
-            return []
-        
-        created_occurrences = []
+    # Récupérer la définition
+    task_def = await pool.fetchrow(
+        _SQL_GET_TASK_DEFINITION_ROW,
+        task_def_id
+    )
+    
+    if not task_def:
+        return []
+    
+    parsed = _parse_definition_rrule(task_def, start_date, end_date)
+    if parsed is None:
+        return []
+    rrule, range_start_dt, end_datetime = parsed
+    
+    created_occurrences = []
 
-        # Cas particulier: si on cherche au plus une occurrence sur une petite fenêtre (ex: aujourd'hui),
-        # utiliser rrule.after avec inc=True pour inclure l'événement à dtstart lorsque pertinent.
-    from datetime import timedelta as _td
-    is_single_day_window = (end_datetime - range_start_dt) <= _td(days=1)
+    # Cas particulier: si on cherche au plus une occurrence sur une petite fenêtre (ex: aujourd'hui),
+    # utiliser rrule.after avec inc=True pour inclure l'événement à dtstart lorsque pertinent.
+    is_single_day_window = (end_datetime - range_start_dt) <= timedelta(days=1)
     if max_occurrences == 1 and is_single_day_window:
-            # 1) Essayer l'occurrence d'aujourd'hui (>= range_start_dt)
-            candidate = rrule.after(range_start_dt - _td(seconds=1), inc=True)
-            if candidate and candidate <= end_datetime:
-                scheduled_date = candidate.date()
-                due_at = datetime.combine(scheduled_date, datetime.max.time())
-                if dry_run:
-                    import uuid
-                    occurrence = {
-                        'id': uuid.uuid4(),
-                        'task_id': task_def_id,
-                        'scheduled_date': scheduled_date,
-                        'due_at': due_at,
-                        'status': TaskStatus.PENDING.value,
-                        'assigned_to': None,
-                        'snoozed_until': None,
-                        'created_at': datetime.utcnow(),
-                    }
-                else:
-                    occurrence = await create_task_occurrence(pool, task_def_id, scheduled_date, due_at)
-                if occurrence:
-                    created_occurrences.append(occurrence)
-                return created_occurrences
-
-            # 2) Sinon, backfill: créer au plus UNE occurrence passée (<= today) pour la considérer en retard
-            prev = rrule.before(end_datetime + _td(seconds=1), inc=True)
-            if prev and prev <= end_datetime:
-                # Respecter la start_date de la tâche: backfill seulement si la start_date <= prev.date()
-                task_start_date = task_def.get('start_date')
-                if task_start_date and isinstance(task_start_date, date) and task_start_date > prev.date():
-                    return created_occurrences
-                scheduled_date = prev.date()
-                due_at = datetime.combine(scheduled_date, datetime.max.time())
-                if dry_run:
-                    import uuid
-                    occurrence = {
-                        'id': uuid.uuid4(),
-                        'task_id': task_def_id,
-                        'scheduled_date': scheduled_date,
-                        'due_at': due_at,
-                        'status': TaskStatus.PENDING.value,
-                        'assigned_to': None,
-                        'snoozed_until': None,
-                        'created_at': datetime.utcnow(),
-                    }
-                else:
-                    occurrence = await create_task_occurrence(pool, task_def_id, scheduled_date, due_at)
-                    # Mise à jour immédiate en OVERDUE si la date est passée
-                    try:
-                        if scheduled_date < date.today() and occurrence and occurrence.get('status') == TaskStatus.PENDING.value:
-                            await update_task_occurrence_status(pool, occurrence['id'], TaskStatus.OVERDUE)
-                    except Exception:
-                        pass
-                if occurrence:
-                    created_occurrences.append(occurrence)
+        # 1) Essayer l'occurrence d'aujourd'hui (>= range_start_dt)
+        candidate = rrule.after(range_start_dt - timedelta(seconds=1), inc=True)
+        if candidate and candidate <= end_datetime:
+            scheduled_date = candidate.date()
+            due_at = datetime.combine(scheduled_date, datetime.max.time())
+            if dry_run:
+                occurrence = _virtual_occurrence(task_def_id, scheduled_date, due_at)
+            else:
+                occurrence = await create_task_occurrence(pool, task_def_id, scheduled_date, due_at)
+            if occurrence:
+                created_occurrences.append(occurrence)
             return created_occurrences
 
-    # Générer les dates selon la règle (fenêtre multi-jours)
-    for occurrence_date in rrule.between(range_start_dt, end_datetime, inc=True):
-            if len(created_occurrences) >= max_occurrences:
-                break
-            
-            scheduled_date = occurrence_date.date()
-            
-            # Calculer l'heure d'échéance (par défaut à 23:59)
+        # 2) Sinon, backfill: créer au plus UNE occurrence passée (<= today) pour la considérer en retard
+        prev = rrule.before(end_datetime + timedelta(seconds=1), inc=True)
+        if prev and prev <= end_datetime:
+            # Respecter la start_date de la tâche: backfill seulement si la start_date <= prev.date()
+            task_start_date = task_def.get('start_date')
+            if task_start_date and isinstance(task_start_date, date) and task_start_date > prev.date():
+                return created_occurrences
+            scheduled_date = prev.date()
             due_at = datetime.combine(scheduled_date, datetime.max.time())
-            
             if dry_run:
-                # Occurrence virtuelle (non persistée)
-                import uuid
-                occurrence = {
-                    'id': uuid.uuid4(),
-                    'task_id': task_def_id,
-                    'scheduled_date': scheduled_date,
-                    'due_at': due_at,
-                    'status': TaskStatus.PENDING.value,
-                    'assigned_to': None,
-                    'snoozed_until': None,
-                    'created_at': datetime.utcnow(),
-                }
+                occurrence = _virtual_occurrence(task_def_id, scheduled_date, due_at)
             else:
-                # Créer l'occurrence persistée
-                occurrence = await create_task_occurrence(
-                    pool, task_def_id, scheduled_date, due_at
-                )
-            
+                occurrence = await create_task_occurrence(pool, task_def_id, scheduled_date, due_at)
+                # Mise à jour immédiate en OVERDUE si la date est passée
+                try:
+                    if scheduled_date < date.today() and occurrence and occurrence.get('status') == _STATUS_PENDING:
+                        await update_task_occurrence_status(pool, occurrence['id'], TaskStatus.OVERDUE)
+                except Exception:
+                    pass
             if occurrence:
                 created_occurrences.append(occurrence)
-        
-    return created_occurrences
+        return created_occurrences
+
+    # Générer les dates selon la règle (fenêtre multi-jours)
+    scheduled_dates = _occurrence_dates(rrule, range_start_dt, end_datetime, max_occurrences)
+
+    if dry_run:
+        # Occurrences virtuelles (non persistées)
+        return [
+            _virtual_occurrence(task_def_id, d, datetime.combine(d, datetime.max.time()))
+            for d in scheduled_dates
+        ]
+
+    # Une seule requête pour toutes les dates (au lieu d'un INSERT + SELECT par date)
+    return await _insert_task_occurrences_bulk(
+        pool, [task_def_id] * len(scheduled_dates), scheduled_dates
+    )
 
 
 async def generate_occurrences_for_household(
@@ -868,22 +1375,42 @@ async def generate_occurrences_for_household(
     
     Returns:
         Liste de toutes les occurrences créées
+    
+    Deux requêtes au total, quel que soit le nombre de définitions: lecture
+    des définitions puis insertion groupée de toutes les occurrences.
     """
     start_date = date.today()
     end_date = start_date + timedelta(days=days_ahead)
+    max_occurrences = 100  # Par définition, comme generate_occurrences_for_definition
     
     # Récupérer toutes les définitions actives du ménage
     task_defs = await get_task_definitions(pool, household_id=household_id)
     
-    all_occurrences = []
+    task_ids: List[UUID] = []
+    scheduled_dates: List[date] = []
+    # Dates déjà calculées dans ce passage: les définitions de même règle et
+    # même ancrage partagent l'objet rrule mémoïsé (clé par identité)
+    dates_by_rule: Dict[Tuple[Any, datetime], List[date]] = {}
     
     for task_def in task_defs:
-        occurrences = await generate_occurrences_for_definition(
-            pool, task_def['id'], start_date, end_date
-        )
-        all_occurrences.extend(occurrences)
+        parsed = _parse_definition_rrule(task_def, start_date, end_date)
+        if parsed is None:
+            continue
+        rrule, range_start_dt, end_datetime = parsed
+        dates = dates_by_rule.get((rrule, range_start_dt))
+        if dates is None:
+            dates = dates_by_rule[(rrule, range_start_dt)] = _occurrence_dates(
+                rrule, range_start_dt, end_datetime, max_occurrences
+            )
+        task_ids.extend([task_def['id']] * len(dates))
+        scheduled_dates.extend(dates)
     
-    return all_occurrences
+    return await _insert_task_occurrences_bulk(pool, task_ids, scheduled_dates)
+
+
+# Fonction PL/pgSQL (migration 20251016_add_overdue_partial_index), appuyée sur
+# l'index partiel des occurrences 'pending'
+_SQL_UPDATE_OVERDUE: Final[str] = "SELECT update_overdue_occurrences($1::uuid)"
 
 
 async def check_and_update_overdue_occurrences(
@@ -900,130 +1427,238 @@ async def check_and_update_overdue_occurrences(
     Returns:
         Nombre d'occurrences mises à jour
     """
-    async with pool.acquire() as conn:
-        query = """
-            UPDATE task_occurrences o
-            SET status = $1
-            FROM task_definitions td
-            WHERE o.task_id = td.id
-              AND o.status = $2
-              AND o.due_at < NOW()
-        """
-        params = [TaskStatus.OVERDUE.value, TaskStatus.PENDING.value]
-        
-        if household_id:
-            query += " AND td.household_id = $3"
-            params.append(household_id)
-        
-        result = await conn.execute(query, *params)
-        
-        # Extraire le nombre de lignes mises à jour
-        count = int(result.split()[-1]) if result else 0
-        return count
+    count = await pool.fetchval(_SQL_UPDATE_OVERDUE, household_id) or 0
+    if count:
+        occurrences_view_refresher.request_refresh()
+    return count
+
+
+_SQL_MARK_OVERDUE: Final[str] = """
+    UPDATE task_occurrences o
+    SET status = $1
+    WHERE o.id IN (
+        SELECT id FROM task_occurrences
+        WHERE status = $2
+          AND due_at < NOW()
+        LIMIT $3
+        FOR UPDATE SKIP LOCKED
+    )
+    RETURNING o.id, o.task_id, o.assigned_to
+"""
+
+
+async def mark_overdue(
+    pool: asyncpg.Pool,
+    limit: int = 1000
+) -> List[Row]:
+    """
+    Passer en OVERDUE un lot d'occurrences échues, en une seule requête.
+
+    Le lot est borné par `limit` (UPDATE n'accepte pas LIMIT, d'où la
+    sous-requête) et SKIP LOCKED évite de bloquer sur des lignes en cours de
+    modification. L'appelant répète l'appel tant qu'un lot complet est retourné.
+
+    Returns:
+        Les occurrences mises à jour (id, task_id, assigned_to)
+    """
+    assert pool is not None, "pool not initialized"
+    rows = await pool.fetch(
+        _SQL_MARK_OVERDUE,
+        _STATUS_OVERDUE, _STATUS_PENDING, limit
+    )
+    if rows:
+        occurrences_view_refresher.request_refresh()
+    return rows
 
 
 # ============================================================================
 # FONCTIONS EXISTANTES (Households, Members, Rooms)
 # ============================================================================
 
+_SQL_CREATE_HOUSEHOLD: Final[str] = """
+    WITH h AS (
+        INSERT INTO households (name, created_at)
+        VALUES ($1, NOW())
+        RETURNING id, name, created_at
+    ), m AS (
+        INSERT INTO household_members (household_id, user_id, role)
+        -- Jointure sur l'utilisateur: aucun membre si $2 est NULL ou inconnu
+        SELECT h.id, u.id, 'admin'
+        FROM h
+        JOIN auth.users u ON u.id = $2::uuid
+        RETURNING 1
+    )
+    SELECT id, name, created_at FROM h
+"""
+
+
 async def create_household(
     pool: asyncpg.Pool, 
     name: str, 
-    created_by_user_id: Optional[UUID] = None
+    created_by_user_id: Optional[UUID] = None,
 ) -> Dict[str, Any]:
-    """Créer un nouveau ménage"""
-    async with pool.acquire() as conn:
-        async with conn.transaction():
-            household_id = await conn.fetchval(
-                """
-                INSERT INTO households (name, created_at) 
-                VALUES ($1, NOW()) 
-                RETURNING id
-                """,
-                name,
-            )
+    """Créer un nouveau ménage.
 
-            if created_by_user_id:
-                # Supabase stocke les utilisateurs dans la table auth.users
-                user_exists = await conn.fetchval(
-                    "SELECT 1 FROM auth.users WHERE id = $1",
-                    created_by_user_id,
-                )
+    Une seule requête: le ménage et, si l'utilisateur existe dans auth.users,
+    son adhésion en tant qu'admin sont insérés atomiquement via une CTE.
+    """
+    household_data = await pool.fetchrow(
+        _SQL_CREATE_HOUSEHOLD,
+        name,
+        created_by_user_id,
+    )
+
+    return dict(household_data)
+
+
+_SQL_CREATE_ROOMS_BULK: Final[str] = """
+    INSERT INTO rooms (name, household_id, icon, created_at)
+    SELECT r.name, $1, r.icon, NOW()
+    FROM unnest($2::text[], $3::text[]) AS r(name, icon)
+    RETURNING id, name, household_id, icon, created_at
+"""
+
+
+async def create_household_with_rooms(
+    pool: asyncpg.Pool,
+    name: str,
+    created_by_user_id: Optional[UUID],
+    rooms: Sequence[Tuple[str, Optional[str]]],
+) -> Dict[str, Any]:
+    """Créer un ménage et ses pièces, atomiquement.
 
-                if user_exists:
-                    await conn.execute(
-                        """
-                        INSERT INTO household_members (household_id, user_id, role) 
-                        VALUES ($1, $2, 'admin')
-                        """,
-                        household_id,
-                        created_by_user_id,
-                    )
+    Le ménage (avec l'adhésion admin) puis toutes les pièces, en un INSERT
+    sur unnest, sont écrits sur la même connexion dans une transaction:
+    un échec sur une pièce annule aussi le ménage.
 
+    Args:
+        rooms: Tuples (nom, icône)
+
+    Returns:
+        Le ménage, avec la liste de ses pièces sous la clé "rooms"
+    """
+    async with pool.acquire() as conn:
+        async with conn.transaction():
             household_data = await conn.fetchrow(
-                """
-                SELECT id, name, created_at
-                FROM households 
-                WHERE id = $1
-                """,
-                household_id,
+                _SQL_CREATE_HOUSEHOLD,
+                name,
+                created_by_user_id,
+            )
+            room_rows = await conn.fetch(
+                _SQL_CREATE_ROOMS_BULK,
+                household_data["id"],
+                [room_name for room_name, _ in rooms],
+                [icon for _, icon in rooms],
             )
 
-            return dict(household_data)
+    household = dict(household_data)
+    household["rooms"] = [dict(room) for room in room_rows]
+    return household
+
+
+_SQL_GET_HOUSEHOLDS_FOR_USER: Final[str] = """
+    SELECT h.id, h.name, h.created_at
+    FROM households h
+    JOIN household_members hm ON h.id = hm.household_id
+    WHERE hm.user_id = $1
+      -- Pagination par clé (name, id): ménages suivant le ménage curseur $2
+      AND ($2::uuid IS NULL OR (h.name, h.id) > (
+        SELECT c.name, c.id FROM households c WHERE c.id = $2
+      ))
+    ORDER BY h.name, h.id
+    LIMIT $3::int
+"""
+_SQL_GET_HOUSEHOLDS: Final[str] = """
+    SELECT id, name, created_at
+    FROM households
+    ORDER BY name
+"""
+_SQL_HOUSEHOLD_EXISTS: Final[str] = """
+    SELECT EXISTS (SELECT 1 FROM households WHERE id = $1)
+"""
 
 
 async def get_households(
     pool: asyncpg.Pool, 
-    user_id: Optional[UUID] = None
-) -> List[Dict[str, Any]]:
-    """Récupérer la liste des ménages"""
+    user_id: Optional[UUID] = None,
+    after_id: Optional[UUID] = None,
+    limit: Optional[int] = None,
+) -> List[Row]:
+    """Récupérer la liste des ménages
+
+    Avec `user_id`, la liste se pagine par clé: `after_id` est l'id du dernier
+    ménage de la page précédente, `limit` la taille de page (None: tous).
+
+    Raises:
+        ValueError: si le ménage curseur `after_id` n'existe plus (la page
+            serait vide sans que la liste soit finie)
+    """
     async with pool.acquire() as conn:
         if user_id:
-            households = await conn.fetch(
-                """
-                SELECT h.id, h.name, h.created_at
-                FROM households h
-                JOIN household_members hm ON h.id = hm.household_id
-                WHERE hm.user_id = $1
-                ORDER BY h.name
-                """,
-                user_id,
+            stmt = await _prepared(
+                conn,
+                "get_households_for_user",
+                _SQL_GET_HOUSEHOLDS_FOR_USER,
             )
+            households = await stmt.fetch(user_id, after_id, limit)
+            # Page vide: distinguer la fin de liste d'un curseur supprimé
+            # (vérification faite uniquement dans ce cas)
+            if not households and after_id is not None:
+                if not await conn.fetchval(_SQL_HOUSEHOLD_EXISTS, after_id):
+                    raise ValueError(f"Ménage curseur introuvable: {after_id}")
         else:
-            households = await conn.fetch(
-                """
-                SELECT id, name, created_at
-                FROM households
-                ORDER BY name
-                """
+            stmt = await _prepared(
+                conn,
+                "get_households",
+                _SQL_GET_HOUSEHOLDS,
             )
+            households = await stmt.fetch()
+        return households
+
 
-        return [dict(household) for household in households]
+_SQL_GET_HOUSEHOLD_MEMBERS: Final[str] = """
+        SELECT 
+            hm.id, 
+            hm.household_id, 
+            hm.user_id, 
+            hm.role, 
+            hm.joined_at,
+    COALESCE(u.raw_user_meta_data->>'full_name', u.email, '') AS user_full_name,
+            u.email AS user_email
+        FROM household_members hm
+        JOIN auth.users u ON hm.user_id = u.id
+        WHERE hm.household_id = $1
+"""
 
 
 async def get_household_members(
     pool: asyncpg.Pool, 
-    household_id: UUID
-) -> List[Dict[str, Any]]:
+    household_id: UUID,
+) -> List[Row]:
     """Récupérer tous les membres d'un ménage avec leurs détails utilisateur."""
     async with pool.acquire() as conn:
-        rows = await conn.fetch(
-            """
-            SELECT 
-                hm.id, 
-                hm.household_id, 
-                hm.user_id, 
-                hm.role, 
-                hm.joined_at,
-        COALESCE(u.raw_user_meta_data->>'full_name', u.email, '') AS user_full_name,
-                u.email AS user_email
-            FROM household_members hm
-            JOIN auth.users u ON hm.user_id = u.id
-            WHERE hm.household_id = $1
-            """,
-            household_id,
+        stmt = await _prepared(
+            conn,
+            "get_household_members",
+            _SQL_GET_HOUSEHOLD_MEMBERS,
         )
-        return [dict(row) for row in rows]
+        rows = await stmt.fetch(household_id)
+        return rows
+
+
+_SQL_GET_HOUSEHOLD_MEMBER: Final[str] = """
+        SELECT 
+            hm.id, 
+            hm.household_id, 
+            hm.user_id, 
+            hm.role, 
+            hm.joined_at,
+    COALESCE(u.raw_user_meta_data->>'full_name', u.email, '') AS user_full_name,
+            u.email AS user_email
+        FROM household_members hm
+        JOIN auth.users u ON hm.user_id = u.id
+        WHERE hm.household_id = $1 AND hm.id = $2
+"""
 
 
 async def get_household_member(
@@ -1033,68 +1668,114 @@ async def get_household_member(
 ) -> Optional[Dict[str, Any]]:
     """Récupérer un membre spécifique d'un ménage avec ses détails utilisateur."""
     async with pool.acquire() as conn:
-        row = await conn.fetchrow(
-            """
-            SELECT 
-                hm.id, 
-                hm.household_id, 
-                hm.user_id, 
-                hm.role, 
-                hm.joined_at,
-        COALESCE(u.raw_user_meta_data->>'full_name', u.email, '') AS user_full_name,
-                u.email AS user_email
-            FROM household_members hm
-            JOIN auth.users u ON hm.user_id = u.id
-            WHERE hm.household_id = $1 AND hm.id = $2
-            """,
-            household_id,
-            member_id,
+        stmt = await _prepared(
+            conn,
+            "get_household_member",
+            _SQL_GET_HOUSEHOLD_MEMBER,
         )
+        row = await stmt.fetchrow(household_id, member_id)
         return dict(row) if row else None
 
 
+_SQL_GET_HOUSEHOLD_MEMBERS_BY_IDS: Final[str] = """
+        SELECT 
+            hm.id, 
+            hm.household_id, 
+            hm.user_id, 
+            hm.role, 
+            hm.joined_at,
+    COALESCE(u.raw_user_meta_data->>'full_name', u.email, '') AS user_full_name,
+            u.email AS user_email
+        FROM household_members hm
+        JOIN auth.users u ON hm.user_id = u.id
+        WHERE hm.household_id = $1 AND hm.id = ANY($2::uuid[])
+"""
+
+
+async def get_household_members_by_ids(
+    pool: asyncpg.Pool, 
+    household_id: UUID, 
+    member_ids: Sequence[UUID]
+) -> Dict[UUID, Row]:
+    """Récupérer plusieurs membres d'un ménage en une seule requête (id -> ligne)."""
+    rows = await pool.fetch(
+        _SQL_GET_HOUSEHOLD_MEMBERS_BY_IDS,
+        household_id,
+        list(member_ids),
+    )
+    return {row["id"]: row for row in rows}
+
+
+_SQL_CREATE_HOUSEHOLD_MEMBER: Final[str] = """
+    INSERT INTO household_members (household_id, user_id, role, joined_at)
+    VALUES ($1, $2, $3, NOW())
+    ON CONFLICT (household_id, user_id) DO NOTHING
+    RETURNING id, household_id, user_id, role, joined_at
+"""
+
+
 async def create_household_member(
     pool: asyncpg.Pool, 
     household_id: UUID, 
     user_id: UUID, 
     role: str = "member"
 ) -> Dict[str, Any]:
-    """Ajouter un membre à un ménage"""
-    async with pool.acquire() as conn:
-        existing_member = await conn.fetchval(
-            """
-            SELECT id
-            FROM household_members
-            WHERE household_id = $1 AND user_id = $2
-            """,
-            household_id,
-            user_id,
-        )
+    """Ajouter un membre à un ménage.
 
-        if existing_member:
-            raise ValueError("Cet utilisateur est déjà membre de ce ménage")
+    Une seule requête: la contrainte unique (household_id, user_id) détecte
+    les doublons de façon atomique (pas de SELECT préalable ni de course).
+    """
+    member_data = await pool.fetchrow(
+        _SQL_CREATE_HOUSEHOLD_MEMBER,
+        household_id,
+        user_id,
+        role,
+    )
 
-        member_id = await conn.fetchval(
-            """
-            INSERT INTO household_members (household_id, user_id, role, joined_at)
-            VALUES ($1, $2, $3, NOW())
-            RETURNING id
-            """,
-            household_id,
-            user_id,
-            role,
-        )
+    if member_data is None:
+        raise ValueError("Cet utilisateur est déjà membre de ce ménage")
+
+    return dict(member_data)
+
+
+_SQL_CREATE_HOUSEHOLD_MEMBERS_BULK: Final[str] = """
+    INSERT INTO household_members (household_id, user_id, role, joined_at)
+    VALUES ($1, $2, $3, NOW())
+    ON CONFLICT (household_id, user_id) DO NOTHING
+"""
+
+
+async def create_household_members_bulk(
+    pool: asyncpg.Pool,
+    household_id: UUID,
+    members: List[tuple]
+) -> None:
+    """
+    Ajouter plusieurs membres à un ménage en un seul aller-retour.
+
+    Args:
+        pool: Pool de connexions
+        household_id: ID du ménage
+        members: Liste de tuples (user_id, role)
+
+    Les utilisateurs déjà membres sont ignorés (ON CONFLICT DO NOTHING).
+    """
+    if not members:
+        return
+    async with pool.acquire() as conn:
+        async with conn.transaction():
+            await conn.executemany(
+                _SQL_CREATE_HOUSEHOLD_MEMBERS_BULK,
+                [(household_id, user_id, role) for user_id, role in members],
+            )
 
-        member_data = await conn.fetchrow(
-            """
-            SELECT id, household_id, user_id, role, joined_at
-            FROM household_members
-            WHERE id = $1
-            """,
-            member_id,
-        )
 
-        return dict(member_data)
+_SQL_UPDATE_MEMBER_ROLE: Final[str] = """
+    UPDATE household_members
+    SET role = $1
+    WHERE household_id = $2 AND id = $3
+    RETURNING id, household_id, user_id, role, joined_at
+"""
 
 
 async def update_household_member(
@@ -1104,41 +1785,25 @@ async def update_household_member(
     role: str
 ) -> Dict[str, Any]:
     """Mettre à jour le rôle d'un membre"""
-    async with pool.acquire() as conn:
-        existing_member = await conn.fetchval(
-            """
-            SELECT id
-            FROM household_members
-            WHERE household_id = $1 AND id = $2
-            """,
-            household_id,
-            member_id,
-        )
+    member_data = await pool.fetchrow(
+        _SQL_UPDATE_MEMBER_ROLE,
+        role,
+        household_id,
+        member_id,
+    )
 
-        if not existing_member:
-            raise ValueError("Ce membre n'existe pas dans ce ménage")
+    # Aucune ligne modifiée: le membre n'appartient pas à ce ménage
+    if member_data is None:
+        raise ValueError("Ce membre n'existe pas dans ce ménage")
 
-        await conn.execute(
-            """
-            UPDATE household_members
-            SET role = $1
-            WHERE household_id = $2 AND id = $3
-            """,
-            role,
-            household_id,
-            member_id,
-        )
+    return dict(member_data)
 
-        member_data = await conn.fetchrow(
-            """
-            SELECT id, household_id, user_id, role, joined_at
-            FROM household_members
-            WHERE id = $1
-            """,
-            member_id,
-        )
 
-        return dict(member_data)
+_SQL_DELETE_HOUSEHOLD_MEMBER: Final[str] = """
+    DELETE FROM household_members
+    WHERE household_id = $1 AND id = $2
+    RETURNING 1
+"""
 
 
 async def delete_household_member(
@@ -1147,49 +1812,43 @@ async def delete_household_member(
     member_id: UUID
 ) -> bool:
     """Supprimer un membre d'un ménage"""
-    async with pool.acquire() as conn:
-        existing_member = await conn.fetchval(
-            """
-            SELECT id
-            FROM household_members
-            WHERE household_id = $1 AND id = $2
-            """,
-            household_id,
-            member_id,
-        )
+    deleted = await pool.fetchval(
+        _SQL_DELETE_HOUSEHOLD_MEMBER,
+        household_id,
+        member_id,
+    )
 
-        if not existing_member:
-            return False
+    return deleted is not None
 
-        rows_deleted = await conn.execute(
-            """
-            DELETE FROM household_members
-            WHERE household_id = $1 AND id = $2
-            """,
-            household_id,
-            member_id,
-        )
 
-        return "DELETE 1" in rows_deleted
+_SQL_GET_ROOMS: Final[str] = """
+    SELECT id, name, household_id, icon, created_at
+    FROM rooms
+    WHERE household_id = $1
+    ORDER BY name
+"""
 
 
 async def get_rooms(
     pool: asyncpg.Pool, 
-    household_id: UUID
-) -> List[Dict[str, Any]]:
+    household_id: UUID,
+) -> List[Row]:
     """Récupérer la liste des pièces d'un ménage"""
     async with pool.acquire() as conn:
-        rooms = await conn.fetch(
-            """
-            SELECT id, name, household_id, icon, created_at
-            FROM rooms
-            WHERE household_id = $1
-            ORDER BY name
-            """,
-            household_id,
+        stmt = await _prepared(
+            conn,
+            "get_rooms",
+            _SQL_GET_ROOMS,
         )
+        rooms = await stmt.fetch(household_id)
+        return rooms
+
 
-        return [dict(room) for room in rooms]
+_SQL_GET_ROOM: Final[str] = """
+    SELECT id, name, household_id, icon, created_at
+    FROM rooms
+    WHERE id = $1
+"""
 
 
 async def get_room(
@@ -1198,49 +1857,69 @@ async def get_room(
 ) -> Optional[Dict[str, Any]]:
     """Récupérer une pièce spécifique"""
     async with pool.acquire() as conn:
-        room = await conn.fetchrow(
-            """
-            SELECT id, name, household_id, icon, created_at
-            FROM rooms
-            WHERE id = $1
-            """,
-            room_id,
+        stmt = await _prepared(
+            conn,
+            "get_room",
+            _SQL_GET_ROOM,
         )
+        room = await stmt.fetchrow(room_id)
 
         return dict(room) if room else None
 
 
+_SQL_GET_ROOMS_BY_IDS: Final[str] = """
+    SELECT id, name, household_id, icon, created_at
+    FROM rooms
+    WHERE id = ANY($1::uuid[])
+"""
+
+
+async def get_rooms_by_ids(
+    pool: asyncpg.Pool, 
+    room_ids: Sequence[UUID]
+) -> Dict[UUID, Row]:
+    """Récupérer plusieurs pièces en une seule requête (id -> ligne)."""
+    rows = await pool.fetch(_SQL_GET_ROOMS_BY_IDS, list(room_ids))
+    return {row["id"]: row for row in rows}
+
+
+_SQL_CREATE_ROOM: Final[str] = """
+    INSERT INTO rooms (name, household_id, icon, created_at)
+    VALUES ($1, $2, $3, NOW())
+    RETURNING id, name, household_id, icon, created_at
+"""
+
+
 async def create_room(
     pool: asyncpg.Pool, 
     name: str, 
     household_id: UUID, 
-    icon: Optional[str] = None
+    icon: Optional[str] = None,
 ) -> Dict[str, Any]:
     """Créer une nouvelle pièce"""
     async with pool.acquire() as conn:
-        room_id = await conn.fetchval(
-            """
-            INSERT INTO rooms (name, household_id, icon, created_at)
-            VALUES ($1, $2, $3, NOW())
-            RETURNING id
-            """,
+        room_data = await conn.fetchrow(
+            _SQL_CREATE_ROOM,
             name,
             household_id,
             icon,
         )
 
-        room_data = await conn.fetchrow(
-            """
-            SELECT id, name, household_id, icon, created_at
-            FROM rooms
-            WHERE id = $1
-            """,
-            room_id,
-        )
-
         return dict(room_data)
 
 
+_SQL_GET_HOUSEHOLD_ROOM: Final[str] = """
+    SELECT id, name, household_id, icon, created_at
+    FROM rooms
+    WHERE id = $1 AND household_id = $2
+"""
+_SQL_DELETE_ROOM: Final[str] = """
+    DELETE FROM rooms
+    WHERE id = $1 AND household_id = $2
+    RETURNING 1
+"""
+
+
 async def delete_room(
     pool: asyncpg.Pool,
     household_id: UUID,
@@ -1253,27 +1932,38 @@ async def delete_room(
     Peut lever asyncpg.ForeignKeyViolationError si des enregistrements référencent cette pièce
     (ex: task_definitions.room_id), auquel cas l'API doit retourner 409.
     """
-    async with pool.acquire() as conn:
-        # Vérifier l'existence et l'appartenance au ménage
-        existing = await conn.fetchval(
-            """
-            SELECT 1 FROM rooms WHERE id = $1 AND household_id = $2
-            """,
-            room_id,
-            household_id,
-        )
-        if not existing:
-            return False
-
-        result = await conn.execute(
-            """
-            DELETE FROM rooms
-            WHERE id = $1 AND household_id = $2
-            """,
-            room_id,
-            household_id,
-        )
-        return "DELETE 1" in result
+    assert pool is not None, "pool not initialized"
+    # Existence, appartenance au ménage et suppression en une seule requête
+    deleted = await pool.fetchval(
+        _SQL_DELETE_ROOM,
+        room_id,
+        household_id,
+    )
+    return deleted is not None
+
+
+def _update_room_sql(has_name: bool, has_icon: bool) -> str:
+    """Texte de l'UPDATE de pièce pour une combinaison de champs fournis."""
+    update_fields = []
+    if has_name:
+        update_fields.append(f"name = ${len(update_fields) + 1}")
+    if has_icon:
+        update_fields.append(f"icon = ${len(update_fields) + 1}")
+    n = len(update_fields)
+    return f"""
+        UPDATE rooms
+        SET {', '.join(update_fields)}
+        WHERE id = ${n + 1} AND household_id = ${n + 2}
+        RETURNING id, name, household_id, icon, created_at
+    """
+
+
+# Variantes de l'UPDATE, construites à l'import et indexées par (name fourni, icon fourni)
+_SQL_UPDATE_ROOM: Final[Dict[Tuple[bool, bool], str]] = {
+    key: _update_room_sql(*key)
+    for key in product((False, True), repeat=2)
+    if any(key)
+}
 
 
 async def update_room(
@@ -1288,41 +1978,26 @@ async def update_room(
 
     Retourne None si la pièce n'existe pas dans ce ménage.
     """
-    ensure_pool(pool)
+    assert pool is not None, "pool not initialized"
     # Rien à mettre à jour
     if name is None and icon is None:
         # Retourner l'état actuel si existant
-        existing = await get_room(pool, room_id)
-        if not existing or existing.get("household_id") != household_id:
-            return None
-        return existing
-
-    async with pool.acquire() as conn:
-        # Vérifier l'existence et l'appartenance
-        exists = await conn.fetchval(
-            """
-            SELECT 1 FROM rooms WHERE id = $1 AND household_id = $2
-            """,
-            room_id,
-            household_id,
-        )
-        if not exists:
-            return None
+        row = await pool.fetchrow(_SQL_GET_HOUSEHOLD_ROOM, room_id, household_id)
+        return dict(row) if row else None
 
-        update_fields = []
-        params = []
-        if name is not None:
-            update_fields.append("name = $" + str(len(params) + 1))
-            params.append(name)
-        if icon is not None:
-            update_fields.append("icon = $" + str(len(params) + 1))
-            params.append(icon)
-
-        query = f"""
-            UPDATE rooms
-            SET {', '.join(update_fields)}
-            WHERE id = ${len(params) + 1} AND household_id = ${len(params) + 2}
-            RETURNING id, name, household_id, icon, created_at
-        """
-        row = await conn.fetchrow(query, *params, room_id, household_id)
-        return dict(row) if row else None
\ No newline at end of file
+    # Aucune ligne retournée: la pièce n'existe pas dans ce ménage
+    query = _SQL_UPDATE_ROOM[(name is not None, icon is not None)]
+    params = [value for value in (name, icon) if value is not None]
+    row = await pool.fetchrow(query, *params, room_id, household_id)
+    return dict(row) if row else None
+
+
+# Requêtes préparées dès l'ouverture de chaque connexion (voir _prepare_hot_statements)
+_HOT_STATEMENTS: Final[Dict[str, str]] = {
+    "get_households_for_user": _SQL_GET_HOUSEHOLDS_FOR_USER,
+    "get_household_members": _SQL_GET_HOUSEHOLD_MEMBERS,
+    "get_rooms": _SQL_GET_ROOMS,
+    "get_task_definition": _SQL_GET_TASK_DEFINITION,
+    "get_task_occurrence": _SQL_GET_TASK_OCCURRENCE,
+    "get_task_occurrences": _SQL_GET_TASK_OCCURRENCES,
+}
@@ -11,43 +11,50 @@ import logging
 
 from app.core.exceptions import BaseApplicationException, get_http_status_from_exception
 from app.core.logging import get_logger, with_context
+from app.core.serialization import RecordJSONResponse
 
 logger = get_logger(__name__)
 
+# Sévérités journalisées en ERROR (les autres en WARNING)
+_ERROR_SEVERITIES = frozenset(("high", "critical"))
+
 
 async def application_exception_handler(
     request: Request, exc: BaseApplicationException
 ) -> JSONResponse:
     """Gestionnaire pour les exceptions personnalisées de l'application"""
 
-    # Log de l'exception avec le contexte approprié
-    log_level = (
-        logging.ERROR if exc.severity.value in ["high", "critical"] else logging.WARNING
-    )
-
-    logger.log(
-        log_level,
-        f"Exception métier: {exc.error_code}",
-        extra=with_context(
-            error_code=exc.error_code,
-            severity=exc.severity.value,
-            user_message=exc.user_message,
-            technical_message=exc.technical_message,
-            metadata=exc.metadata,
-            http_status=exc.http_status.value,
-            path=request.url.path,
-            method=request.method,
-        ),
-        exc_info=exc.severity.value == "critical",
-    )
-
-    return JSONResponse(
-        status_code=exc.http_status.value,
+    severity = exc.severity.value
+    status_code = exc.http_status.value
+
+    # Log de l'exception avec le contexte approprié. Le message technique
+    # (formaté à la première lecture) n'est construit que si le log est émis
+    log_level = logging.ERROR if severity in _ERROR_SEVERITIES else logging.WARNING
+
+    if logger.isEnabledFor(log_level):
+        logger.log(
+            log_level,
+            f"Exception métier: {exc.error_code}",
+            extra=with_context(
+                error_code=exc.error_code,
+                severity=severity,
+                user_message=exc.user_message,
+                technical_message=exc.technical_message,
+                metadata=exc.metadata,
+                http_status=status_code,
+                path=request.url.path,
+                method=request.method,
+            ),
+            exc_info=severity == "critical",
+        )
+
+    return RecordJSONResponse(
+        status_code=status_code,
         content={
             "error": {
                 "code": exc.error_code,
                 "message": exc.user_message,
-                "severity": exc.severity.value,
+                "severity": severity,
                 "metadata": exc.metadata,
             }
         },
@@ -69,7 +76,7 @@ async def http_exception_handler(
         ),
     )
 
-    return JSONResponse(
+    return RecordJSONResponse(
         status_code=exc.status_code,
         content={
             "error": {
@@ -86,10 +93,7 @@ async def validation_exception_handler(
 ) -> JSONResponse:
     """Gestionnaire pour les erreurs de validation Pydantic"""
 
-    errors = {}
-    for error in exc.errors():
-        field_path = ".".join(str(x) for x in error["loc"])
-        errors[field_path] = error["msg"]
+    errors = {".".join(map(str, error["loc"])): error["msg"] for error in exc.errors()}
 
     logger.warning(
         "Erreur de validation des données",
@@ -100,7 +104,7 @@ async def validation_exception_handler(
         ),
     )
 
-    return JSONResponse(
+    return RecordJSONResponse(
         status_code=422,
         content={
             "error": {
@@ -116,7 +120,7 @@ async def validation_exception_handler(
 async def generic_exception_handler(request: Request, exc: Exception) -> JSONResponse:
     """Gestionnaire pour toutes les autres exceptions non gérées"""
 
-    http_status = get_http_status_from_exception(exc)
+    status_code = get_http_status_from_exception(exc).value
 
     logger.error(
         "Exception non gérée",
@@ -125,13 +129,13 @@ async def generic_exception_handler(request: Request, exc: Exception) -> JSONRes
             exception_message=str(exc),
             path=request.url.path,
             method=request.method,
-            http_status=http_status.value,
+            http_status=status_code,
         ),
         exc_info=True,
     )
 
-    return JSONResponse(
-        status_code=http_status.value,
+    return RecordJSONResponse(
+        status_code=status_code,
         content={
             "error": {
                 "code": "INTERNAL_SERVER_ERROR",
@@ -1,5 +1,5 @@
 from enum import Enum
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 from http import HTTPStatus
 
 
@@ -15,6 +15,18 @@ class ErrorSeverity(Enum):
 class BaseApplicationException(Exception):
     """Exception de base pour l'application"""
 
+    # Attributs en slots (le __dict__ d'Exception reste disponible mais vide)
+    __slots__ = (
+        "error_code",
+        "user_message",
+        "_technical_message",
+        "_technical_message_args",
+        "_formatted_technical_message",
+        "severity",
+        "metadata",
+        "http_status",
+    )
+
     def __init__(
         self,
         error_code: str,
@@ -23,15 +35,46 @@ class BaseApplicationException(Exception):
         severity: ErrorSeverity = ErrorSeverity.MEDIUM,
         metadata: Optional[Dict[str, Any]] = None,
         http_status: HTTPStatus = HTTPStatus.INTERNAL_SERVER_ERROR,
+        technical_message_args: Tuple[Any, ...] = (),
     ):
         self.error_code = error_code
         self.user_message = user_message
-        self.technical_message = technical_message or user_message
+        # Avec technical_message_args, technical_message est un gabarit `%`
+        # formaté au premier accès (comme les arguments du module logging)
+        self._technical_message = technical_message or user_message
+        self._technical_message_args = technical_message_args
+        self._formatted_technical_message = None
         self.severity = severity
         self.metadata = metadata or {}
         self.http_status = http_status
 
-        super().__init__(self.technical_message)
+        super().__init__(self._technical_message, *technical_message_args)
+
+    @property
+    def technical_message(self) -> str:
+        # Gabarit et arguments restent intacts; le résultat est mis en cache
+        # à la première lecture
+        if self._formatted_technical_message is None:
+            if self._technical_message_args:
+                self._formatted_technical_message = (
+                    self._technical_message % self._technical_message_args
+                )
+            else:
+                self._formatted_technical_message = self._technical_message
+        return self._formatted_technical_message
+
+    def __str__(self) -> str:
+        return self.technical_message
+
+    def __reduce__(self):
+        # Les sous-classes n'acceptent pas `args` (gabarit + arguments) en
+        # paramètres: copy/pickle restaurent l'instance attribut par attribut
+        state = {name: getattr(self, name) for name in BaseApplicationException.__slots__}
+        return (
+            _restore_application_exception,
+            (type(self), self.args, state),
+            self.__dict__ or None,
+        )
 
     def to_dict(self) -> Dict[str, Any]:
         """Convertit l'exception en dictionnaire pour la sérialisation"""
@@ -45,6 +88,16 @@ class BaseApplicationException(Exception):
         }
 
 
+def _restore_application_exception(
+    cls: type, args: Tuple[Any, ...], state: Dict[str, Any]
+) -> BaseApplicationException:
+    """Reconstruit une exception de l'application sans rappeler son __init__."""
+    exception = cls.__new__(cls, *args)
+    for name, value in state.items():
+        setattr(exception, name, value)
+    return exception
+
+
 # =============================================================================
 # EXCEPTIONS MÉTIER
 # =============================================================================
@@ -53,102 +106,169 @@ class BaseApplicationException(Exception):
 class BusinessException(BaseApplicationException):
     """Exception de base pour les erreurs métier"""
 
+    __slots__ = ()
+
     def __init__(self, error_code: str, user_message: str, **kwargs):
         kwargs.setdefault("severity", ErrorSeverity.MEDIUM)
         super().__init__(error_code, user_message, **kwargs)
 
 
-class HouseholdNotFound(BusinessException):
+class _ResourceNotFound(BusinessException):
+    """Base des exceptions « ressource introuvable » à message constant.
+
+    Chaque sous-classe n'est qu'une ligne de table: gabarits, code d'erreur et
+    clé de métadonnée sont des attributs de classe. Une levée ne coûte qu'une
+    interpolation `%` (le message technique n'est formaté qu'à la lecture).
+    """
+
+    __slots__ = ()
+
+    _ERROR_CODE: str
+    _HTTP_STATUS = HTTPStatus.NOT_FOUND
+    _ID_FIELD: str
+    _USER_TMPL: str
+    _TECH_TMPL: str
+
+    def __init__(
+        self,
+        resource_id: str,
+        severity: ErrorSeverity = ErrorSeverity.MEDIUM,
+        metadata: Optional[Dict[str, Any]] = None,
+        http_status: Optional[HTTPStatus] = None,
+        **kwargs,
+    ):
+        args = (resource_id,)
+        merged_metadata = {self._ID_FIELD: resource_id}
+        if metadata:
+            merged_metadata.update(metadata)
+        if http_status is None:
+            http_status = self._HTTP_STATUS
+        if kwargs:
+            # Autres options (message technique personnalisé...): chaîne complète
+            if "technical_message" not in kwargs:
+                kwargs["technical_message"] = self._TECH_TMPL
+                kwargs["technical_message_args"] = args
+            BusinessException.__init__(
+                self,
+                self._ERROR_CODE,
+                self._USER_TMPL % args,
+                severity=severity,
+                metadata=merged_metadata,
+                http_status=http_status,
+                **kwargs,
+            )
+            return
+        # Cas courant: initialisation directe depuis les attributs de classe,
+        # sans remonter la chaîne BusinessException -> BaseApplicationException
+        # (mêmes attributs que BaseApplicationException.__init__)
+        self.error_code = self._ERROR_CODE
+        self.user_message = self._USER_TMPL % args
+        self._technical_message = self._TECH_TMPL
+        self._technical_message_args = args
+        self._formatted_technical_message = None
+        self.severity = severity
+        self.metadata = merged_metadata
+        self.http_status = http_status
+        Exception.__init__(self, self._TECH_TMPL, resource_id)
+
+
+class HouseholdNotFound(_ResourceNotFound):
     """Exception levée quand un ménage n'est pas trouvé"""
 
+    __slots__ = ()
+
+    _ERROR_CODE = "HOUSEHOLD_NOT_FOUND"
+    _ID_FIELD = "household_id"
+    _USER_TMPL = "Le ménage avec l'ID %s n'existe pas"
+    _TECH_TMPL = "Household not found: %s"
+
     def __init__(self, household_id: str, **kwargs):
-        super().__init__(
-            error_code="HOUSEHOLD_NOT_FOUND",
-            user_message=f"Le ménage avec l'ID {household_id} n'existe pas",
-            technical_message=f"Household not found: {household_id}",
-            http_status=HTTPStatus.NOT_FOUND,
-            metadata={"household_id": household_id},
-            **kwargs,
-        )
+        super().__init__(household_id, **kwargs)
 
 
-class UserNotFound(BusinessException):
+class UserNotFound(_ResourceNotFound):
     """Exception levée quand un utilisateur n'est pas trouvé"""
 
+    __slots__ = ()
+
+    _ERROR_CODE = "USER_NOT_FOUND"
+    _ID_FIELD = "user_id"
+    _USER_TMPL = "L'utilisateur avec l'ID %s n'existe pas"
+    _TECH_TMPL = "User not found: %s"
+
     def __init__(self, user_id: str, **kwargs):
-        super().__init__(
-            error_code="USER_NOT_FOUND",
-            user_message=f"L'utilisateur avec l'ID {user_id} n'existe pas",
-            technical_message=f"User not found: {user_id}",
-            http_status=HTTPStatus.NOT_FOUND,
-            metadata={"user_id": user_id},
-            **kwargs,
-        )
+        super().__init__(user_id, **kwargs)
 
 
-class TaskNotFound(BusinessException):
+class TaskNotFound(_ResourceNotFound):
     """Exception levée quand une tâche n'est pas trouvée"""
 
+    __slots__ = ()
+
+    _ERROR_CODE = "TASK_NOT_FOUND"
+    _ID_FIELD = "task_id"
+    _USER_TMPL = "La tâche avec l'ID %s n'existe pas"
+    _TECH_TMPL = "Task not found: %s"
+
     def __init__(self, task_id: str, **kwargs):
-        super().__init__(
-            error_code="TASK_NOT_FOUND",
-            user_message=f"La tâche avec l'ID {task_id} n'existe pas",
-            technical_message=f"Task not found: {task_id}",
-            http_status=HTTPStatus.NOT_FOUND,
-            metadata={"task_id": task_id},
-            **kwargs,
-        )
+        super().__init__(task_id, **kwargs)
 
 
-class OccurrenceNotFound(BusinessException):
+class OccurrenceNotFound(_ResourceNotFound):
     """Exception levée quand une occurrence n'est pas trouvée"""
 
+    __slots__ = ()
+
+    _ERROR_CODE = "OCCURRENCE_NOT_FOUND"
+    _ID_FIELD = "occurrence_id"
+    _USER_TMPL = "L'occurrence avec l'ID %s n'existe pas"
+    _TECH_TMPL = "Occurrence not found: %s"
+
     def __init__(self, occurrence_id: str, **kwargs):
-        super().__init__(
-            error_code="OCCURRENCE_NOT_FOUND",
-            user_message=f"L'occurrence avec l'ID {occurrence_id} n'existe pas",
-            technical_message=f"Occurrence not found: {occurrence_id}",
-            http_status=HTTPStatus.NOT_FOUND,
-            metadata={"occurrence_id": occurrence_id},
-            **kwargs,
-        )
+        super().__init__(occurrence_id, **kwargs)
 
 
 class TaskNotInHousehold(BusinessException):
     """Exception levée quand une tâche n'appartient pas au ménage spécifié"""
 
+    __slots__ = ()
+
     def __init__(self, task_id: str, household_id: str, **kwargs):
         super().__init__(
             error_code="TASK_NOT_IN_HOUSEHOLD",
             user_message="La tâche demandée n'existe pas dans ce ménage",
-            technical_message=f"Task {task_id} does not belong to household {household_id}",
+            technical_message="Task %s does not belong to household %s",
+            technical_message_args=(task_id, household_id),
             http_status=HTTPStatus.NOT_FOUND,
             metadata={"task_id": task_id, "household_id": household_id},
             **kwargs,
         )
 
 
-class RoomNotFound(BusinessException):
+class RoomNotFound(_ResourceNotFound):
     """Exception levée quand une pièce n'est pas trouvée"""
 
+    __slots__ = ()
+
+    _ERROR_CODE = "ROOM_NOT_FOUND"
+    _ID_FIELD = "room_id"
+    _USER_TMPL = "La pièce avec l'ID %s n'existe pas"
+    _TECH_TMPL = "Room not found: %s"
+
     def __init__(self, room_id: str, **kwargs):
-        super().__init__(
-            error_code="ROOM_NOT_FOUND",
-            user_message=f"La pièce avec l'ID {room_id} n'existe pas",
-            technical_message=f"Room not found: {room_id}",
-            http_status=HTTPStatus.NOT_FOUND,
-            metadata={"room_id": room_id},
-            **kwargs,
-        )
+        super().__init__(room_id, **kwargs)
 
 class UnauthorizedAccess(BusinessException):
     """Exception levée pour les accès non autorisés"""
 
+    __slots__ = ()
+
     def __init__(self, resource: str, action: str, **kwargs):
         super().__init__(
             error_code="UNAUTHORIZED_ACCESS",
             user_message="Vous n'êtes pas autorisé à effectuer cette action",
-            technical_message=f"Unauthorized access to {resource} for action {action}",
+            technical_message="Unauthorized access to %s for action %s",
+            technical_message_args=(resource, action),
             http_status=HTTPStatus.FORBIDDEN,
             severity=ErrorSeverity.HIGH,
             metadata={"resource": resource, "action": action},
@@ -159,11 +279,14 @@ class UnauthorizedAccess(BusinessException):
 class InsufficientPermissions(BusinessException):
     """Exception levée quand l'utilisateur n'a pas les permissions suffisantes"""
 
+    __slots__ = ()
+
     def __init__(self, required_role: str, current_role: str, **kwargs):
         super().__init__(
             error_code="INSUFFICIENT_PERMISSIONS",
             user_message=f"Cette action nécessite le rôle '{required_role}' mais vous avez le rôle '{current_role}'",
-            technical_message=f"Insufficient permissions: required {required_role}, has {current_role}",
+            technical_message="Insufficient permissions: required %s, has %s",
+            technical_message_args=(required_role, current_role),
             http_status=HTTPStatus.FORBIDDEN,
             severity=ErrorSeverity.HIGH,
             metadata={"required_role": required_role, "current_role": current_role},
@@ -174,11 +297,14 @@ class InsufficientPermissions(BusinessException):
 class BusinessRuleViolation(BusinessException):
     """Exception levée quand une règle métier est violée"""
 
+    __slots__ = ()
+
     def __init__(self, rule: str, details: str, **kwargs):
         super().__init__(
             error_code="BUSINESS_RULE_VIOLATION",
             user_message=f"Règle métier violée: {details}",
-            technical_message=f"Business rule violation: {rule} - {details}",
+            technical_message="Business rule violation: %s - %s",
+            technical_message_args=(rule, details),
             http_status=HTTPStatus.CONFLICT,
             metadata={"rule": rule, "details": details},
             **kwargs,
@@ -188,11 +314,14 @@ class BusinessRuleViolation(BusinessException):
 class DuplicateResource(BusinessException):
     """Exception levée lors de création de ressources dupliquées"""
 
+    __slots__ = ()
+
     def __init__(self, resource_type: str, identifier: str, **kwargs):
         super().__init__(
             error_code="DUPLICATE_RESOURCE",
             user_message=f"Une ressource {resource_type} avec l'identifiant {identifier} existe déjà",
-            technical_message=f"Duplicate {resource_type}: {identifier}",
+            technical_message="Duplicate %s: %s",
+            technical_message_args=(resource_type, identifier),
             http_status=HTTPStatus.CONFLICT,
             metadata={"resource_type": resource_type, "identifier": identifier},
             **kwargs,
@@ -207,6 +336,8 @@ class DuplicateResource(BusinessException):
 class TechnicalException(BaseApplicationException):
     """Exception de base pour les erreurs techniques"""
 
+    __slots__ = ()
+
     def __init__(self, error_code: str, user_message: str, **kwargs):
         kwargs.setdefault("severity", ErrorSeverity.HIGH)
         kwargs.setdefault("http_status", HTTPStatus.INTERNAL_SERVER_ERROR)
@@ -216,11 +347,14 @@ class TechnicalException(BaseApplicationException):
 class DatabaseError(TechnicalException):
     """Exception levée pour les erreurs de base de données"""
 
+    __slots__ = ()
+
     def __init__(self, operation: str, details: str, **kwargs):
         super().__init__(
             error_code="DATABASE_ERROR",
             user_message="Une erreur technique est survenue. Veuillez réessayer plus tard",
-            technical_message=f"Database error during {operation}: {details}",
+            technical_message="Database error during %s: %s",
+            technical_message_args=(operation, details),
             severity=ErrorSeverity.CRITICAL,
             metadata={"operation": operation, "details": details},
             **kwargs,
@@ -230,11 +364,14 @@ class DatabaseError(TechnicalException):
 class ExternalServiceError(TechnicalException):
     """Exception levée pour les erreurs de services externes"""
 
+    __slots__ = ()
+
     def __init__(self, service_name: str, details: str, **kwargs):
         super().__init__(
             error_code="EXTERNAL_SERVICE_ERROR",
             user_message="Un service externe est temporairement indisponible",
-            technical_message=f"External service error from {service_name}: {details}",
+            technical_message="External service error from %s: %s",
+            technical_message_args=(service_name, details),
             metadata={"service_name": service_name, "details": details},
             **kwargs,
         )
@@ -243,11 +380,14 @@ class ExternalServiceError(TechnicalException):
 class ConfigurationError(TechnicalException):
     """Exception levée pour les erreurs de configuration"""
 
+    __slots__ = ()
+
     def __init__(self, parameter: str, details: str, **kwargs):
         super().__init__(
             error_code="CONFIGURATION_ERROR",
             user_message="Erreur de configuration du système",
-            technical_message=f"Configuration error for {parameter}: {details}",
+            technical_message="Configuration error for %s: %s",
+            technical_message_args=(parameter, details),
             severity=ErrorSeverity.CRITICAL,
             metadata={"parameter": parameter, "details": details},
             **kwargs,
@@ -262,6 +402,8 @@ class ConfigurationError(TechnicalException):
 class ValidationException(BaseApplicationException):
     """Exception de base pour les erreurs de validation"""
 
+    __slots__ = ()
+
     def __init__(self, error_code: str, user_message: str, **kwargs):
         kwargs.setdefault("severity", ErrorSeverity.LOW)
         kwargs.setdefault("http_status", HTTPStatus.BAD_REQUEST)
@@ -271,11 +413,14 @@ class ValidationException(BaseApplicationException):
 class InvalidInput(ValidationException):
     """Exception levée pour les entrées invalides"""
 
+    __slots__ = ()
+
     def __init__(self, field: str, value: Any, reason: str, **kwargs):
         super().__init__(
             error_code="INVALID_INPUT",
             user_message=f"Valeur invalide pour le champ '{field}': {reason}",
-            technical_message=f"Invalid input for field {field} with value {value}: {reason}",
+            technical_message="Invalid input for field %s with value %s: %s",
+            technical_message_args=(field, value, reason),
             metadata={"field": field, "value": str(value), "reason": reason},
             **kwargs,
         )
@@ -284,11 +429,14 @@ class InvalidInput(ValidationException):
 class MissingRequiredField(ValidationException):
     """Exception levée pour les champs requis manquants"""
 
+    __slots__ = ()
+
     def __init__(self, field: str, **kwargs):
         super().__init__(
             error_code="MISSING_REQUIRED_FIELD",
             user_message=f"Le champ '{field}' est requis",
-            technical_message=f"Missing required field: {field}",
+            technical_message="Missing required field: %s",
+            technical_message_args=(field,),
             metadata={"field": field},
             **kwargs,
         )
@@ -297,6 +445,8 @@ class MissingRequiredField(ValidationException):
 class InvalidCredentials(ValidationException):
     """Exception levée pour les identifiants invalides"""
 
+    __slots__ = ()
+
     def __init__(self, technical_message: str = None, **kwargs):
         final_technical_message = (
             technical_message or "Invalid authentication credentials"
@@ -314,11 +464,14 @@ class InvalidCredentials(ValidationException):
 class TokenExpired(ValidationException):
     """Exception levée pour les tokens expirés"""
 
+    __slots__ = ()
+
     def __init__(self, token_type: str = "access", **kwargs):
         super().__init__(
             error_code="TOKEN_EXPIRED",
             user_message="Votre session a expiré. Veuillez vous reconnecter",
-            technical_message=f"Expired {token_type} token",
+            technical_message="Expired %s token",
+            technical_message_args=(token_type,),
             http_status=HTTPStatus.UNAUTHORIZED,
             metadata={"token_type": token_type},
             **kwargs,
@@ -328,12 +481,15 @@ class TokenExpired(ValidationException):
 class ValidationError(ValidationException):
     """Exception levée pour les erreurs de validation de schéma"""
 
+    __slots__ = ()
+
     def __init__(self, errors: Dict[str, str], **kwargs):
-        error_messages = [f"{field}: {message}" for field, message in errors.items()]
+        # Une seule jointure, partagée par les deux messages (pas de repr du dict)
+        details = "; ".join(f"{field}: {message}" for field, message in errors.items())
         super().__init__(
             error_code="VALIDATION_ERROR",
-            user_message=f"Erreurs de validation: {'; '.join(error_messages)}",
-            technical_message=f"Schema validation failed: {errors}",
+            user_message=f"Erreurs de validation: {details}",
+            technical_message=f"Schema validation failed: {details}",
             metadata={"validation_errors": errors},
             **kwargs,
         )
@@ -344,23 +500,26 @@ class ValidationError(ValidationException):
 # =============================================================================
 
 
+# Mapping par défaut pour les exceptions Python standard
+_EXCEPTION_HTTP_STATUS: Dict[type, HTTPStatus] = {
+    ValueError: HTTPStatus.BAD_REQUEST,
+    KeyError: HTTPStatus.NOT_FOUND,
+    PermissionError: HTTPStatus.FORBIDDEN,
+    FileNotFoundError: HTTPStatus.NOT_FOUND,
+    ConnectionError: HTTPStatus.SERVICE_UNAVAILABLE,
+    TimeoutError: HTTPStatus.REQUEST_TIMEOUT,
+}
+
+
 def get_http_status_from_exception(exception: Exception) -> HTTPStatus:
     """Retourne le code HTTP approprié pour une exception"""
     if isinstance(exception, BaseApplicationException):
         return exception.http_status
 
-    # Mapping par défaut pour les exceptions Python standard
-    exception_mapping = {
-        ValueError: HTTPStatus.BAD_REQUEST,
-        KeyError: HTTPStatus.NOT_FOUND,
-        PermissionError: HTTPStatus.FORBIDDEN,
-        FileNotFoundError: HTTPStatus.NOT_FOUND,
-        ConnectionError: HTTPStatus.SERVICE_UNAVAILABLE,
-        TimeoutError: HTTPStatus.REQUEST_TIMEOUT,
-    }
-
-    for exc_type, status in exception_mapping.items():
-        if isinstance(exception, exc_type):
+    # Recherche par type puis le long du MRO: la classe la plus spécifique l'emporte
+    for exc_type in type(exception).__mro__:
+        status = _EXCEPTION_HTTP_STATUS.get(exc_type)
+        if status is not None:
             return status
 
     return HTTPStatus.INTERNAL_SERVER_ERROR
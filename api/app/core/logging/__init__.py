@@ -26,7 +26,4 @@ def with_context(**kwargs) -> Dict[str, Any]:
     return {"extra_data": kwargs}
 
 
-# Initialiser le logging au chargement du module
-init_logging()
-
 __all__ = ["get_logger", "init_logging", "log_config", "with_context"]
@@ -1,13 +1,21 @@
 import logging
 import logging.handlers
 import sys
+import threading
+import time
+from dataclasses import MISSING, dataclass, fields
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Dict
-from datetime import datetime
+from typing import Optional, Dict, List, Set
 import json
 
 from app.config import settings
 
+try:  # Dépendance du projet; repli sur json de la stdlib s'il est absent
+    import orjson
+except ImportError:  # pragma: no cover - dépend de l'environnement
+    orjson = None
+
 
 class ColoredFormatter(logging.Formatter):
     """Formatter qui ajoute des couleurs pour la console"""
@@ -33,55 +41,130 @@ class ColoredFormatter(logging.Formatter):
         return super().format(record)
 
 
+# Chaîne JSON entre guillemets, non-ASCII conservé (équivaut à ensure_ascii=False)
+_escape_json = json.encoder.encode_basestring
+
+
+def _dumps_log(log_data: Dict) -> str:
+    """Sérialise un enregistrement; les valeurs non sérialisables passent par str()."""
+    if orjson is not None:
+        return orjson.dumps(log_data, default=str).decode()
+    return json.dumps(log_data, ensure_ascii=False, separators=(",", ":"), default=str)
+
+
+@lru_cache(maxsize=2)
+def _format_utc_second(second: int) -> str:
+    return time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(second))
+
+
 class JSONFormatter(logging.Formatter):
     """Formatter pour sortie JSON structurée"""
 
+    _CONTEXT_KEYS = ("request_id", "user_id", "household_id")
+    _OPTIONAL_KEYS = frozenset(_CONTEXT_KEYS + ("extra_data",))
+
+    @staticmethod
+    def _fmt_ts(created: float) -> str:
+        """Horodatage ISO 8601 (UTC) de record.created, la partie en secondes
+        n'étant formatée qu'une fois par seconde."""
+        second = int(created)
+        micros = min(round((created - second) * 1e6), 999_999)
+        return "%s.%06d" % (_format_utc_second(second), micros)
+
     def format(self, record: logging.LogRecord) -> str:
+        attrs = record.__dict__
+        timestamp = self._fmt_ts(record.created)
+        message = record.getMessage()
+
+        # Cas courant (ni contexte, ni exception, ni extra): gabarit précompilé,
+        # sans dict intermédiaire ni parcours générique par l'encodeur JSON
+        if not record.exc_info and attrs.keys().isdisjoint(self._OPTIONAL_KEYS):
+            function = record.funcName
+            return (
+                f'{{"timestamp":"{timestamp}",'
+                f'"level":{_escape_json(record.levelname)},'
+                f'"logger":{_escape_json(record.name)},'
+                f'"module":{_escape_json(record.module)},'
+                f'"function":{"null" if function is None else _escape_json(function)},'
+                f'"line":{record.lineno:d},'
+                f'"message":{_escape_json(message)}}}'
+            )
+
         log_data = {
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": timestamp,
             "level": record.levelname,
             "logger": record.name,
             "module": record.module,
             "function": record.funcName,
             "line": record.lineno,
-            "message": record.getMessage(),
+            "message": message,
         }
 
         # Ajouter les attributs personnalisés (contexte)
-        if hasattr(record, "request_id"):
-            log_data["request_id"] = record.request_id
-
-        if hasattr(record, "user_id"):
-            log_data["user_id"] = record.user_id
-
-        if hasattr(record, "household_id"):
-            log_data["household_id"] = record.household_id
+        for key in self._CONTEXT_KEYS:
+            if key in attrs:
+                log_data[key] = attrs[key]
 
         # Ajouter l'exception si présente
         if record.exc_info:
             log_data["exception"] = self.formatException(record.exc_info)
 
         # Ajouter des données supplémentaires si présentes
-        if hasattr(record, "extra_data"):
-            log_data["extra"] = record.extra_data
+        if "extra_data" in attrs:
+            log_data["extra"] = attrs["extra_data"]
+
+        return _dumps_log(log_data)
+
+
+# Fichiers de log dont le répertoire a déjà été créé dans ce processus
+_CREATED_LOG_PATHS: Set[str] = set()
+
 
-        return json.dumps(log_data, ensure_ascii=False)
+@dataclass(frozen=True, slots=True)
+class _LogSettings:
+    """Paramètres de logging, lus une seule fois dans la configuration"""
+
+    log_level: str = "INFO"
+    log_format: str = "json"
+    log_file_path: Optional[str] = "logs/app.log"
+    log_max_bytes: int = 10 * 1024 * 1024
+    log_backup_count: int = 5
+    environment: str = "development"
+
+    @classmethod
+    def from_settings(cls, source: object) -> "_LogSettings":
+        """Reprend les champs présents sur `source`, les défauts sinon"""
+        values = {}
+        for f in fields(cls):
+            value = getattr(source, f.name, MISSING)
+            if value is not MISSING:
+                values[f.name] = value
+        return cls(**values)
 
 
 class LogConfig:
     """Configuration centralisée pour le système de logging"""
 
     def __init__(self):
-        self.log_level = getattr(settings, "log_level", "INFO").upper()
-        self.log_format = getattr(settings, "log_format", "json")  # 'json' ou 'text'
-        self.log_file_path = getattr(settings, "log_file_path", "logs/app.log")
-        self.log_max_bytes = getattr(settings, "log_max_bytes", 10 * 1024 * 1024)
-        self.log_backup_count = getattr(settings, "log_backup_count", 5)
-        self.environment = getattr(settings, "environment", "development")
-
-        # Créer le répertoire de logs s'il n'existe pas
-        if self.log_file_path:
+        log_settings = _LogSettings.from_settings(settings)
+        self.log_level = log_settings.log_level.upper()
+        self.log_format = log_settings.log_format  # 'json' ou 'text'
+        self.log_file_path = log_settings.log_file_path
+        self.log_max_bytes = log_settings.log_max_bytes
+        self.log_backup_count = log_settings.log_backup_count
+        self.environment = log_settings.environment
+
+        # Loggers déjà passés par setup_logger (get_logger est appelé à l'import
+        # de chaque module: un accès dict évite de remonter la hiérarchie)
+        self._configured: Dict[str, logging.Logger] = {}
+
+        # Handlers partagés par tous les loggers configurés (un seul fichier ouvert)
+        self._handlers: Optional[List[logging.Handler]] = None
+
+        # Créer le répertoire de logs s'il n'existe pas (une fois par processus)
+        if self.log_file_path and self.log_file_path not in _CREATED_LOG_PATHS:
             Path(self.log_file_path).parent.mkdir(parents=True, exist_ok=True)
+            _CREATED_LOG_PATHS.add(self.log_file_path)
 
     def get_console_handler(self) -> logging.StreamHandler:
         """Configure le handler pour la console"""
@@ -105,11 +188,13 @@ class LogConfig:
         if not self.log_file_path:
             return None
 
+        # delay=True: le fichier n'est ouvert qu'au premier enregistrement émis
         file_handler = logging.handlers.RotatingFileHandler(
             filename=self.log_file_path,
             maxBytes=self.log_max_bytes,
             backupCount=self.log_backup_count,
             encoding="utf-8",
+            delay=True,
         )
 
         # Toujours utiliser JSON pour les fichiers (facilite le parsing)
@@ -118,6 +203,17 @@ class LogConfig:
 
         return file_handler
 
+    def get_shared_handlers(self) -> List[logging.Handler]:
+        """Construit une seule fois les handlers console et fichier"""
+        if self._handlers is None:
+            level = getattr(logging, self.log_level)
+            handlers = [self.get_console_handler(), self.get_file_handler()]
+            self._handlers = [h for h in handlers if h is not None]
+            # Handler.handle écarte les enregistrements filtrés avant le formatter
+            for handler in self._handlers:
+                handler.setLevel(level)
+        return self._handlers
+
     def setup_logger(
         self,
         name: str,
@@ -132,24 +228,24 @@ class LogConfig:
             level: Niveau de log spécifique (override la config globale)
             extra_handlers: Handlers supplémentaires à ajouter
         """
+        cached = self._configured.get(name)
+        if cached is not None:
+            return cached
+
         logger = logging.getLogger(name)
 
         # Éviter la duplication des handlers
         if logger.hasHandlers():
+            self._configured[name] = logger
             return logger
 
         # Définir le niveau
         log_level = getattr(logging, level or self.log_level)
         logger.setLevel(log_level)
 
-        # Ajouter les handlers
-        console_handler = self.get_console_handler()
-        if console_handler:
-            logger.addHandler(console_handler)
-
-        file_handler = self.get_file_handler()
-        if file_handler:
-            logger.addHandler(file_handler)
+        # Ajouter les handlers partagés
+        for handler in self.get_shared_handlers():
+            logger.addHandler(handler)
 
         # Ajouter les handlers supplémentaires
         if extra_handlers:
@@ -159,6 +255,18 @@ class LogConfig:
         # Empêcher la propagation vers le logger root
         logger.propagate = False
 
+        self._configured[name] = logger
+        return logger
+
+    def setup_child_logger(self, name: str, level: Optional[str] = None) -> logging.Logger:
+        """
+        Configure un logger enfant de "app": il n'a pas de handler propre et
+        propage ses enregistrements vers les handlers partagés de "app".
+        """
+        logger = logging.getLogger(name)
+        logger.setLevel(getattr(logging, level or self.log_level))
+        logger.propagate = True
+        self._configured[name] = logger
         return logger
 
     def setup_app_loggers(self) -> Dict[str, logging.Logger]:
@@ -168,18 +276,18 @@ class LogConfig:
         # Logger principal de l'application
         loggers["app"] = self.setup_logger("app")
 
-        # Loggers spécialisés
-        loggers["auth"] = self.setup_logger("app.auth")
-        loggers["database"] = self.setup_logger("app.database")
-        loggers["api"] = self.setup_logger("app.api")
-        loggers["celery"] = self.setup_logger("app.celery")
-        loggers["external"] = self.setup_logger("app.external")  # Pour Supabase, etc.
+        # Loggers spécialisés: sans handler propre, ils propagent vers "app"
+        loggers["auth"] = self.setup_child_logger("app.auth")
+        loggers["database"] = self.setup_child_logger("app.database")
+        loggers["api"] = self.setup_child_logger("app.api")
+        loggers["celery"] = self.setup_child_logger("app.celery")
+        loggers["external"] = self.setup_child_logger("app.external")  # Pour Supabase, etc.
 
         # Logger pour les requêtes HTTP (peut être plus verbeux en dev)
         if self.environment == "development":
-            loggers["http"] = self.setup_logger("app.http", level="DEBUG")
+            loggers["http"] = self.setup_child_logger("app.http", level="DEBUG")
         else:
-            loggers["http"] = self.setup_logger("app.http", level="INFO")
+            loggers["http"] = self.setup_child_logger("app.http", level="INFO")
 
         # Configurer les loggers tiers
         self._configure_third_party_loggers()
@@ -203,6 +311,10 @@ class LogConfig:
 # Instance globale de configuration
 log_config = LogConfig()
 
+# Initialisation différée au premier get_logger (voir init_logging)
+_initialized = False
+_init_lock = threading.Lock()
+
 
 # Fonction helper pour obtenir un logger
 def get_logger(name: str) -> logging.Logger:
@@ -213,12 +325,26 @@ def get_logger(name: str) -> logging.Logger:
         from app.core.logging import get_logger
         logger = get_logger(__name__)
     """
+    if not _initialized:
+        with _init_lock:
+            if not _initialized:
+                init_logging()
     return log_config.setup_logger(name)
 
 
-# Configuration automatique au chargement du module
 def init_logging():
-    """Initialise le système de logging de l'application"""
+    """Initialise le système de logging de l'application.
+
+    Appelée automatiquement par le premier get_logger: importer le module
+    n'ouvre aucun handler.
+    """
+    global _initialized
+    _initialized = True
+
+    if log_config.environment == "production":
+        # Pas de traceback sur stderr si un handler échoue à émettre
+        logging.raiseExceptions = False
+
     loggers = log_config.setup_app_loggers()
 
     # Log de démarrage
@@ -0,0 +1,80 @@
+"""
+Rafraîchissement différé de la vue matérialisée des occurrences
+"""
+
+import asyncio
+from typing import Optional
+
+import asyncpg
+
+from app.config import settings
+from app.core.logging import get_logger, with_context
+
+logger = get_logger(__name__)
+
+OCCURRENCES_VIEW = "mv_task_occurrences_enriched"
+
+_SQL_REFRESH_OCCURRENCES_VIEW = f"REFRESH MATERIALIZED VIEW CONCURRENTLY {OCCURRENCES_VIEW}"
+
+
+async def refresh_occurrences_view(pool: asyncpg.Pool) -> None:
+    """Rafraîchit la vue sans bloquer les lectures (index unique sur id requis)."""
+    await pool.execute(_SQL_REFRESH_OCCURRENCES_VIEW)
+
+
+class OccurrencesViewRefresher:
+    """Regroupe les demandes de rafraîchissement de la vue des occurrences.
+
+    Les mutations appellent `request_refresh()`, qui ne fait que lever un
+    drapeau: une tâche de fond attend `delay` secondes puis lance un seul
+    REFRESH pour toutes les mutations survenues entre-temps. La latence des
+    requêtes n'est donc pas affectée. Sans `start()` (vue désactivée, worker
+    Celery, tests), `request_refresh()` ne fait rien: le worker appelle
+    directement `refresh_occurrences_view()` après ses écritures.
+    """
+
+    def __init__(self):
+        self._pending = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def request_refresh(self) -> None:
+        if self.running:
+            self._pending.set()
+
+    def start(self, pool: asyncpg.Pool, delay: Optional[float] = None) -> None:
+        if self.running:
+            return
+        if delay is None:
+            delay = settings.occurrences_view_refresh_delay
+        self._task = asyncio.create_task(self._run(pool, delay))
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _run(self, pool: asyncpg.Pool, delay: float) -> None:
+        while True:
+            await self._pending.wait()
+            # Fenêtre de regroupement: les demandes suivantes sont absorbées
+            await asyncio.sleep(delay)
+            self._pending.clear()
+            try:
+                await refresh_occurrences_view(pool)
+            except Exception as e:
+                logger.warning(
+                    "Échec du rafraîchissement de la vue des occurrences",
+                    extra=with_context(view=OCCURRENCES_VIEW, error=str(e)),
+                )
+
+
+occurrences_view_refresher = OccurrencesViewRefresher()
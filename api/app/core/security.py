@@ -1,57 +1,133 @@
-from passlib.context import CryptContext
+import time
+import bcrypt
 from datetime import datetime, timedelta, timezone  # Ajout de timezone
 from jose import JWTError, jwt
 from fastapi import HTTPException, status, Depends
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from typing import Optional
-from app.config import settings
+from functools import lru_cache
+from typing import Annotated, Dict, List, NamedTuple, Optional, Tuple
+from uuid import UUID
+from app.config import Settings, get_settings
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 security = HTTPBearer()
 
 
+class _JWTConfig(NamedTuple):
+    secret: bytes
+    algorithm: str
+    algorithms: List[str]
+    access_token_lifetime: timedelta
+    refresh_token_lifetime: timedelta
+
+
+_jwt_config_cache: Optional[Tuple[Settings, _JWTConfig]] = None
+
+
+def _jwt_config() -> _JWTConfig:
+    """Paramètres JWT (clé encodée, algorithmes, durées de vie), calculés une fois
+    par instance de paramètres.
+
+    Lus à l'usage et non à l'import: après get_settings.cache_clear() (tests,
+    rotation de SECRET_KEY), les tokens sont signés et vérifiés avec la
+    nouvelle clé, et le cache des tokens vérifiés est vidé.
+    """
+    global _jwt_config_cache
+    current = get_settings()
+    cached = _jwt_config_cache
+    if cached is not None and cached[0] is current:
+        return cached[1]
+    config = _JWTConfig(
+        secret=current.secret_key.encode("utf-8"),
+        algorithm=current.jwt_algorithm,
+        algorithms=[current.jwt_algorithm],
+        access_token_lifetime=timedelta(minutes=current.access_token_expire_minutes),
+        refresh_token_lifetime=timedelta(days=current.refresh_token_expire_days),
+    )
+    _verified_tokens.clear()
+    _jwt_config_cache = (current, config)
+    return config
+
+# bcrypt ne considère que les 72 premiers octets (troncature comme passlib)
+_BCRYPT_MAX_BYTES = 72
+
+
+def _bcrypt_secret(password: str) -> bytes:
+    return password.encode("utf-8")[:_BCRYPT_MAX_BYTES]
+
+
 def verify_password(plain_password: str, hashed_password: str) -> bool:
-    return pwd_context.verify(plain_password, hashed_password)
+    return bcrypt.checkpw(_bcrypt_secret(plain_password), hashed_password.encode("utf-8"))
 
 
 def get_password_hash(password: str) -> str:
-    return pwd_context.hash(password)
+    return bcrypt.hashpw(_bcrypt_secret(password), bcrypt.gensalt()).decode("ascii")
 
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
+    config = _jwt_config()
     to_encode = data.copy()
-    if expires_delta:
-        expire = datetime.now(timezone.utc) + expires_delta  # Modification ici
-    else:
-        expire = datetime.now(timezone.utc) + timedelta(  # Modification ici
-            minutes=settings.access_token_expire_minutes
-        )
-    to_encode.update({"exp": expire})
-    return jwt.encode(to_encode, settings.secret_key, algorithm=settings.jwt_algorithm)
+    expire = datetime.now(timezone.utc) + (expires_delta or config.access_token_lifetime)
+    to_encode["exp"] = expire
+    return jwt.encode(to_encode, config.secret, algorithm=config.algorithm)
 
 
 def create_refresh_token(data: dict) -> str:
+    config = _jwt_config()
     to_encode = data.copy()
-    expire = datetime.now(timezone.utc) + timedelta(
-        days=settings.refresh_token_expire_days
-    )  # Modification ici
-    to_encode.update({"exp": expire})
-    return jwt.encode(to_encode, settings.secret_key, algorithm=settings.jwt_algorithm)
+    to_encode["exp"] = datetime.now(timezone.utc) + config.refresh_token_lifetime
+    return jwt.encode(to_encode, config.secret, algorithm=config.algorithm)
+
+
+# Tokens récemment vérifiés: token -> (payload, valide jusqu'à). Une rafale de
+# requêtes avec le même token ne refait ni la vérification HMAC ni le parsing.
+_TOKEN_CACHE_TTL = 30.0
+_TOKEN_CACHE_MAX_SIZE = 4096
+_verified_tokens: Dict[str, Tuple[dict, float]] = {}
+
+
+def _cache_verified_token(token: str, payload: dict, now: float) -> None:
+    cached_until = now + _TOKEN_CACHE_TTL
+    exp = payload.get("exp")
+    if isinstance(exp, (int, float)):
+        # Ne jamais servir un token au-delà de son expiration
+        cached_until = min(cached_until, exp)
+    if len(_verified_tokens) >= _TOKEN_CACHE_MAX_SIZE:
+        # Éviction de l'entrée la plus ancienne (ordre d'insertion)
+        _verified_tokens.pop(next(iter(_verified_tokens)), None)
+    _verified_tokens[token] = (payload, cached_until)
+
+
+# En-tête commun aux réponses 401 (lu sans être modifié par les handlers)
+_WWW_AUTHENTICATE_BEARER = {"WWW-Authenticate": "Bearer"}
+
+
+def _invalid_token(detail: str = "Token invalide") -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail=detail,
+        headers=_WWW_AUTHENTICATE_BEARER,
+    )
 
 
 def verify_token(token: str) -> dict:
     """Vérifie un token JWT et retourne les données décodées"""
+    config = _jwt_config()
+    now = time.time()
+    cached = _verified_tokens.get(token)
+    if cached is not None:
+        payload, cached_until = cached
+        if cached_until > now:
+            return dict(payload)
+        _verified_tokens.pop(token, None)
+
     try:
         payload = jwt.decode(
-            token, settings.secret_key, algorithms=[settings.jwt_algorithm]
+            token, config.secret, algorithms=config.algorithms
         )
-        return payload
+        _cache_verified_token(token, payload, now)
+        return dict(payload)
     except JWTError:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Token invalide",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
+        raise _invalid_token()
 
 
 async def get_current_user(
@@ -65,11 +141,7 @@ async def get_current_user(
         email = payload.get("email")
 
         if user_id is None or email is None:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Token invalide",
-                headers={"WWW-Authenticate": "Bearer"},
-            )
+            raise _invalid_token()
 
         # Créer un objet utilisateur simplifié à partir du payload
         return {
@@ -83,11 +155,22 @@ async def get_current_user(
     except HTTPException:
         raise
     except Exception:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Token invalide ou expiré",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
+        raise _invalid_token("Token invalide ou expiré")
+
+
+# sub JWT -> UUID: un même utilisateur enchaîne les requêtes avec le même token
+parse_user_id = lru_cache(maxsize=4096)(UUID)
+
+
+async def get_current_user_id(current_user: dict = Depends(get_current_user)) -> UUID:
+    """Dépendance: identifiant de l'utilisateur courant, validé une fois en UUID"""
+    try:
+        return parse_user_id(current_user["id"])
+    except ValueError:
+        raise _invalid_token()
+
+
+CurrentUserId = Annotated[UUID, Depends(get_current_user_id)]
 
 
 async def get_current_user_optional(
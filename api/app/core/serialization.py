@@ -0,0 +1,114 @@
+"""
+Sérialisation JSON des lignes de base de données
+"""
+
+import json
+from functools import lru_cache
+from typing import Any, AsyncIterable, AsyncIterator, Callable, Optional
+
+import asyncpg
+from fastapi.responses import JSONResponse
+from pydantic import TypeAdapter
+
+try:  # Dépendance du projet; repli sur json de la stdlib s'il est absent
+    import orjson
+except ImportError:  # pragma: no cover - dépend de l'environnement
+    orjson = None
+
+
+def json_default(obj: Any) -> Any:
+    """Fonction `default` pour orjson: les Records asyncpg sont sérialisés comme des dicts.
+
+    orjson gère nativement UUID, datetime, date et Enum; seuls les Records
+    (lignes retournées telles quelles par la couche database) nécessitent ce hook.
+    """
+    if isinstance(obj, asyncpg.Record):
+        return dict(obj.items())
+    raise TypeError(f"Type non sérialisable en JSON: {type(obj).__name__}")
+
+
+def _stdlib_default(obj: Any) -> Any:
+    """Équivalent de `json_default` pour le module json (UUID, dates, Enum inclus)."""
+    if isinstance(obj, asyncpg.Record):
+        return dict(obj.items())
+    if hasattr(obj, "isoformat"):
+        return obj.isoformat()
+    if hasattr(obj, "value"):
+        return obj.value
+    return str(obj)
+
+
+def dumps(content: Any) -> bytes:
+    """Sérialise `content` en JSON (bytes), Records asyncpg compris."""
+    if orjson is not None:
+        return orjson.dumps(content, default=json_default)
+    # allow_nan=False comme JSONResponse: NaN/Infinity lèvent au lieu de
+    # produire un JSON invalide
+    return json.dumps(
+        content,
+        default=_stdlib_default,
+        ensure_ascii=False,
+        allow_nan=False,
+        separators=(",", ":"),
+    ).encode("utf-8")
+
+
+class RecordJSONResponse(JSONResponse):
+    """Réponse JSON rendue via orjson, acceptant directement des Records asyncpg.
+
+    Sans schéma: réservée aux contenus déjà mis en forme (réponse par défaut
+    de l'application, erreurs). Les listes de lignes passent par
+    ModelJSONResponse pour rester conformes à leur response_model.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+@lru_cache(maxsize=None)
+def _type_adapter(response_type: Any) -> TypeAdapter:
+    return TypeAdapter(response_type)
+
+
+def _dump_model_json(adapter: TypeAdapter, content: Any) -> bytes:
+    # from_attributes: les Rows (accès par attribut) sont validées sans copie
+    return adapter.dump_json(adapter.validate_python(content, from_attributes=True))
+
+
+class ModelJSONResponse(JSONResponse):
+    """Réponse JSON validée et sérialisée par pydantic selon `response_type`.
+
+    Même sortie que le response_model de la route (colonnes filtrées, types
+    vérifiés, dates au format pydantic), en une seule passe pydantic-core
+    depuis les lignes, sans l'encodage générique de FastAPI.
+    """
+
+    def __init__(self, content: Any, response_type: Any, **kwargs):
+        self._adapter = _type_adapter(response_type)
+        super().__init__(content, **kwargs)
+
+    def render(self, content: Any) -> bytes:
+        return _dump_model_json(self._adapter, content)
+
+
+async def iter_json_array(
+    items: AsyncIterable[Any],
+    item_type: Any,
+    transform: Optional[Callable[[Any], Any]] = None,
+) -> AsyncIterator[bytes]:
+    """Sérialise un flux d'éléments en tableau JSON, élément par élément.
+
+    Chaque élément est validé et sérialisé selon `item_type`, comme dans
+    ModelJSONResponse. Pour StreamingResponse: le début de la réponse part dès
+    la première ligne et la mémoire reste bornée à un élément.
+    """
+    adapter = _type_adapter(item_type)
+    yield b"["
+    first = True
+    async for item in items:
+        if transform is not None:
+            item = transform(item)
+        data = _dump_model_json(adapter, item)
+        yield data if first else b"," + data
+        first = False
+    yield b"]"
@@ -1,9 +1,12 @@
-from fastapi import APIRouter, Depends, Request, status, HTTPException
+from fastapi import APIRouter, Depends, Query, Request, status, HTTPException
 from app.schemas.household import HouseholdCreate, Household
-from app.core.database import get_households, create_household
-from app.core.exceptions import DatabaseError, UnauthorizedAccess, HouseholdNotFound
-from app.core.security import get_current_user
+from app.core.database import ensure_pool, get_households, create_household
+from app.core.exceptions import DatabaseError, UnauthorizedAccess, HouseholdNotFound, InvalidInput
+from app.core.serialization import ModelJSONResponse
+from app.core.security import CurrentUserId, get_current_user, parse_user_id
+from app.services.household_service import create_household_with_default_rooms
 import asyncpg
+from typing import Optional, Union
 from uuid import UUID
 from app.schemas.auth import UserResponse
 
@@ -11,22 +14,39 @@ router = APIRouter()
 
 
 async def get_db_pool(request: Request) -> asyncpg.Pool:
-    """Récupère le pool de connexions à la DB depuis l'état de l'application."""
-    return request.app.state.db_pool
+    """Récupère le pool de connexions à la DB depuis l'état de l'application.
+
+    Vérifié une seule fois par requête (pool initialisé, saturation).
+    """
+    return ensure_pool(request.app.state.db_pool)
 
 
 @router.get("/", response_model=list[Household])
 async def list_households(
+    user_id: CurrentUserId,
     db_pool: asyncpg.Pool = Depends(get_db_pool),
-    current_user: dict = Depends(get_current_user),
+    limit: Optional[int] = Query(None, ge=1, le=500, description="Taille de page (tous par défaut)"),
+    after_id: Optional[UUID] = Query(None, description="Curseur: id du dernier ménage reçu"),
 ):
     """
     Récupère la liste des ménages de l'utilisateur authentifié.
+
+    Pagination par clé (nom, id): avec `limit`, l'en-tête X-Next-After-Id donne
+    le curseur de la page suivante. Un curseur dont le ménage a été supprimé
+    est refusé (400): reprendre depuis la première page.
     """
     try:
-        user_id = current_user["id"]
-        households = await get_households(db_pool, user_id)
-        return households
+        households = await get_households(
+            db_pool, user_id, after_id=after_id, limit=limit
+        )
+        headers = None
+        if limit is not None and len(households) == limit:
+            headers = {"X-Next-After-Id": str(households[-1]["id"])}
+        return ModelJSONResponse(
+            content=households, response_type=list[Household], headers=headers
+        )
+    except ValueError as e:
+        raise InvalidInput(field="after_id", value=after_id, reason=str(e))
     except Exception as e:
         raise DatabaseError(
             operation="récupération des ménages",
@@ -45,6 +65,10 @@ async def create_new_household(
     """
     try:
         requesting_user_id = current_user["id"]
+        if household.with_default_rooms:
+            return await create_household_with_default_rooms(
+                db_pool, household.name, requesting_user_id
+            )
         # Le user_id est maintenant obligatoire et passé à create_household
         new_household = await create_household(
             db_pool, household.name, requesting_user_id
@@ -67,30 +91,51 @@ async def get_household(
     Récupère les détails d'un ménage spécifique.
     """
     try:
-        # Vérifier d'abord si l'utilisateur a accès à ce ménage
         if user_id:
-            has_access = await check_household_access(db_pool, household_id, user_id)
-            if not has_access:
+            # Contrôle d'accès et lecture du ménage en un seul aller-retour
+            try:
+                user_uuid = parse_user_id(user_id)
+            except ValueError:
+                user_uuid = None
+            household_data = None
+            if user_uuid is not None:
+                household_data = await db_pool.fetchrow(
+                    """
+                    SELECT h.id, h.name, h.created_at
+                    FROM households h
+                    WHERE h.id = $1
+                      AND EXISTS (
+                        SELECT 1 FROM household_members m
+                        WHERE m.household_id = h.id AND m.user_id = $2
+                      )
+                    """,
+                    household_id,
+                    user_uuid,
+                )
+            # Ménage inexistant ou utilisateur non membre: accès refusé (comme
+            # check_household_access)
+            if household_data is None:
                 raise UnauthorizedAccess(
                     resource="ménage",
                     action="read",  # MODIFIED: Added missing 'action' argument
                 )
+            # Row validée directement par Household (from_attributes), sans copie
+            return household_data
 
         # Récupérer les détails du ménage
-        async with db_pool.acquire() as conn:
-            household_data = await conn.fetchrow(
-                """
-                SELECT id, name, created_at
-                FROM households
-                WHERE id = $1
-                """,
-                household_id,
-            )
+        household_data = await db_pool.fetchrow(
+            """
+            SELECT id, name, created_at
+            FROM households
+            WHERE id = $1
+            """,
+            household_id,
+        )
 
-            if not household_data:
-                raise HouseholdNotFound(household_id=str(household_id))
+        if not household_data:
+            raise HouseholdNotFound(household_id=str(household_id))
 
-            return dict(household_data)
+        return household_data
     except (UnauthorizedAccess, HouseholdNotFound):
         raise
     except Exception as e:
@@ -103,14 +148,13 @@ async def get_household(
 @router.post("/{household_id}/leave", status_code=status.HTTP_204_NO_CONTENT)
 async def leave_household(
     household_id: UUID,
+    user_id: CurrentUserId,
     db_pool: asyncpg.Pool = Depends(get_db_pool),
-    current_user: dict = Depends(get_current_user),
 ):
     """
     Permet à l'utilisateur courant de quitter un foyer.
     Si le foyer devient vide, il est supprimé (cascade sur les entités liées).
     """
-    user_id = current_user["id"]
     async with db_pool.acquire() as conn:
         tr = conn.transaction()
         await tr.start()
@@ -163,54 +207,53 @@ async def leave_household(
 @router.delete("/{household_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_household_endpoint(
     household_id: UUID,
+    user_id: CurrentUserId,
     db_pool: asyncpg.Pool = Depends(get_db_pool),
-    current_user: dict = Depends(get_current_user),
 ):
     """
     Supprime un foyer et toutes ses données liées (cascade). Réservé aux administrateurs du foyer.
     """
-    user_id = current_user["id"]
     # Vérifier le rôle
     role = await get_user_role_in_household(db_pool, household_id, user_id)
     if role != "admin":
         raise HTTPException(status_code=403, detail="Seul un administrateur peut supprimer ce foyer")
 
     async with db_pool.acquire() as conn:
-        result = await conn.execute(
+        deleted = await conn.fetchval(
             """
-            DELETE FROM households WHERE id = $1
+            DELETE FROM households WHERE id = $1 RETURNING 1
             """,
             household_id,
         )
-        # result est de type 'DELETE X'
-        if not result or result.split()[-1] == '0':
+        if deleted is None:
             raise HTTPException(status_code=404, detail="Foyer introuvable")
     return
 
 
 async def check_household_access(
-    pool: asyncpg.Pool, household_id: UUID, user_id: str
+    pool: asyncpg.Pool, household_id: UUID, user_id: Union[UUID, str]
 ) -> bool:
     """
     Vérifie si un utilisateur a accès à un ménage.
     """
-    # Convertir user_id de string vers UUID si nécessaire
-    try:
-        user_uuid = UUID(user_id) if isinstance(user_id, str) else user_id
-    except ValueError:
-        return False
-        
-    async with pool.acquire() as conn:
-        member = await conn.fetchval(
-            """
-            SELECT id
-            FROM household_members
-            WHERE household_id = $1 AND user_id = $2
-            """,
-            household_id,
-            user_uuid,
-        )
-        return member is not None
+    # Les routes passant par CurrentUserId fournissent déjà un UUID; les
+    # chaînes (sub JWT, paramètres) passent par le cache de parse_user_id
+    if not isinstance(user_id, UUID):
+        try:
+            user_id = parse_user_id(user_id)
+        except (TypeError, ValueError):
+            return False
+
+    member = await pool.fetchval(
+        """
+        SELECT id
+        FROM household_members
+        WHERE household_id = $1 AND user_id = $2
+        """,
+        household_id,
+        user_id,
+    )
+    return member is not None
 
 
 async def get_user_role_in_household(
@@ -235,6 +278,21 @@ async def get_user_role_in_household(
         return role
 
 
+# Permissions par rôle
+_ROLE_PERMISSIONS = {
+    "admin": ("add_members", "manage_members", "delete_members"),
+    "member": (),  # Les membres ordinaires ne peuvent pas ajouter d'autres membres
+    "guest": (),  # Les invités ne peuvent rien faire
+}
+
+# Index inverse: permission -> rôles qui l'accordent
+_PERMISSION_ROLES = {
+    permission: [role for role, granted in _ROLE_PERMISSIONS.items() if permission in granted]
+    for permissions in _ROLE_PERMISSIONS.values()
+    for permission in permissions
+}
+
+
 async def check_member_permissions(
     pool: asyncpg.Pool, household_id: UUID, user_id: UUID, required_permission: str
 ) -> bool:
@@ -250,16 +308,20 @@ async def check_member_permissions(
     Returns:
         True si l'utilisateur a les permissions, False sinon
     """
-    user_role = await get_user_role_in_household(pool, household_id, user_id)
-
-    if not user_role:
+    # Rôles accordant la permission: le contrôle se fait dans une seule requête
+    granting_roles = _PERMISSION_ROLES.get(required_permission)
+    if not granting_roles:
         return False
 
-    # Définir les permissions par rôle
-    permissions = {
-        "admin": ["add_members", "manage_members", "delete_members"],
-        "member": [],  # Les membres ordinaires ne peuvent pas ajouter d'autres membres
-        "guest": [],  # Les invités ne peuvent rien faire
-    }
-
-    return required_permission in permissions.get(user_role, [])
+    return await pool.fetchval(
+        """
+        SELECT EXISTS (
+            SELECT 1
+            FROM household_members
+            WHERE household_id = $1 AND user_id = $2 AND role = ANY($3::text[])
+        )
+        """,
+        household_id,
+        user_id,
+        granting_roles,
+    )
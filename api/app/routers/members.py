@@ -12,6 +12,7 @@ from app.core.database import (
 import asyncpg
 from app.routers.households import get_db_pool, check_household_access, check_member_permissions
 from app.core.security import get_current_user
+from app.core.serialization import ModelJSONResponse
 from typing import List
 from uuid import UUID
 
@@ -39,7 +40,7 @@ async def list_household_members(
             )
 
         members = await get_household_members(db_pool, household_id)
-        return members
+        return ModelJSONResponse(content=members, response_type=List[HouseholdMember])
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -9,6 +9,7 @@ from app.core.database import (
 )
 import asyncpg
 from app.routers.households import get_db_pool, check_household_access
+from app.core.serialization import ModelJSONResponse
 from typing import List
 from uuid import UUID
 
@@ -35,7 +36,7 @@ async def list_rooms(
                 )
 
         rooms = await get_rooms(db_pool, household_id)
-        return rooms
+        return ModelJSONResponse(content=rooms, response_type=List[Room])
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -116,7 +117,9 @@ async def add_room(
                     detail="Vous n'avez pas accès à ce ménage",
                 )
 
-        new_room = await create_room(db_pool, room.name, household_id, room.icon)
+        new_room = await create_room(
+            db_pool, room.name, household_id, room.icon
+        )
         return new_room
     except HTTPException:
         raise
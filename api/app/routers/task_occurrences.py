@@ -1,7 +1,9 @@
+import asyncio
 from fastapi import APIRouter, Depends, Query, Body
+from fastapi.responses import StreamingResponse
 from typing import List, Optional
 from uuid import UUID
-from datetime import date
+from datetime import date, datetime
 
 from app.schemas.task import (
     TaskOccurrence,
@@ -15,6 +17,8 @@ from app.schemas.task import (
 from app.core.database import (
     get_task_occurrences,
     get_task_occurrence,
+    iter_task_occurrences,
+    occurrence_cursor,
     delete_task_occurrence,
     update_task_occurrence_status,
     complete_task_occurrence,
@@ -31,12 +35,37 @@ from app.core.exceptions import (
 )
 from app.core.security import get_current_user
 from app.core.logging import get_logger, with_context
+from app.core.serialization import ModelJSONResponse, iter_json_array
 import asyncpg
 
 router = APIRouter()
 household_router = APIRouter()  # Nouveau router pour les routes de ménage
 logger = get_logger(__name__)
 
+# Champs de TaskOccurrenceWithDefinition -> colonnes retournées par get_task_occurrences
+_OCCURRENCE_WITH_DEFINITION_COLUMNS = (
+    ("id", "id"),
+    ("task_id", "task_id"),
+    ("scheduled_date", "scheduled_date"),
+    ("due_at", "due_at"),
+    ("status", "status"),
+    ("assigned_to", "assigned_to"),
+    ("snoozed_until", "snoozed_until"),
+    ("created_at", "created_at"),
+    ("definition_title", "task_title"),
+    ("definition_description", "task_description"),
+    ("room_name", "room_name"),
+    ("assigned_user_name", "assigned_user_email"),
+    ("definition_priority", "definition_priority"),
+)
+
+
+def _occurrence_with_definition(occ) -> dict:
+    """Ligne de get_task_occurrences au format TaskOccurrenceWithDefinition."""
+    data = {field: occ[column] for field, column in _OCCURRENCE_WITH_DEFINITION_COLUMNS}
+    data["task_definition"] = None
+    return data
+
 
 @household_router.get("/{household_id}/occurrences", response_model=List[TaskOccurrenceWithDefinition])
 async def list_household_occurrences(
@@ -47,13 +76,34 @@ async def list_household_occurrences(
     end_date: Optional[date] = Query(None, description="Date de fin (incluse)"),
     status: Optional[TaskStatus] = Query(None, description="Filtrer par statut"),
     assigned_to: Optional[UUID] = Query(None, description="Filtrer par assignation"),
-    room_id: Optional[UUID] = Query(None, description="Filtrer par pièce")
+    room_id: Optional[UUID] = Query(None, description="Filtrer par pièce"),
+    limit: Optional[int] = Query(None, ge=1, le=500, description="Taille de page (toutes par défaut)"),
+    after_due_at: Optional[datetime] = Query(None, description="Curseur: due_at de la dernière occurrence reçue"),
+    after_id: Optional[UUID] = Query(None, description="Curseur: id de la dernière occurrence reçue"),
+    stream: bool = Query(False, description="Réponse en flux, sans pagination (exports volumineux)"),
 ):
     """
     Récupérer les occurrences de tâches d'un ménage.
     
     Idéal pour afficher le calendrier des tâches.
+    
+    Pagination par clé (due_at, id): avec `limit`, les en-têtes X-Next-After-Due-At
+    et X-Next-After-Id donnent le curseur de la page suivante. Les occurrences en
+    retard antérieures à la fenêtre ne sont ajoutées qu'à la première page.
+    
+    Avec `stream=true` (sans `limit`), la réponse est envoyée au fil d'un curseur
+    serveur: une erreur en cours de flux ne peut plus changer le statut 200 et
+    tronque le JSON. Réservé aux exports; la réponse complète reste le défaut.
     """
+    # Curseur (due_at, id): les deux paramètres ensemble ou aucun
+    if (after_due_at is None) != (after_id is None):
+        raise InvalidInput(
+            field="after_due_at" if after_due_at is None else "after_id",
+            value=None,
+            reason="after_due_at et after_id doivent être fournis ensemble",
+        )
+    after = (after_due_at, after_id) if after_due_at is not None else None
+
     try:
         # Vérifier l'accès au ménage
         has_access = await check_household_access(
@@ -74,9 +124,14 @@ async def list_household_occurrences(
         today = date.today()
         window_start = start_date or today
         window_end = end_date or today
+        # Retards tout juste écrits: lus sur les tables, la vue matérialisée
+        # n'étant rafraîchie qu'après quelques secondes
+        fresh = False
         if window_start <= today <= window_end:
             try:
-                await check_and_update_overdue_occurrences(db_pool, household_id=household_id)
+                fresh = await check_and_update_overdue_occurrences(
+                    db_pool, household_id=household_id
+                ) > 0
             except Exception as e:
                 logger.warning(
                     "Échec check_overdue (continuation)",
@@ -84,53 +139,83 @@ async def list_household_occurrences(
                 )
 
         # Récupérer les occurrences de la fenêtre demandée
-        occurrences = await get_task_occurrences(
-            db_pool,
+        window_filters = dict(
             household_id=household_id,
             start_date=start_date,
             end_date=end_date,
             status=status,
             assigned_to=assigned_to,
-            room_id=room_id
+            room_id=room_id,
+            fresh=fresh,
         )
 
         # Si la fenêtre couvre aujourd'hui et aucun filtre de statut n'est imposé,
         # ajouter aussi les occurrences OVERDUE antérieures à aujourd'hui
-        if window_start <= today <= window_end and status is None:
+        overdue_filters = None
+        first_page = after is None
+        if window_start <= today <= window_end and status is None and first_page:
             from datetime import timedelta as _td
-            overdue_until_yesterday = await get_task_occurrences(
-                db_pool,
+            overdue_filters = dict(
                 household_id=household_id,
                 start_date=None,
                 end_date=today - _td(days=1),
                 status=TaskStatus.OVERDUE,
                 assigned_to=assigned_to,
-                room_id=room_id
+                room_id=room_id,
+                fresh=fresh,
             )
-            # Concaténer; pas de doublons attendus car fenêtres disjointes
-            occurrences.extend(overdue_until_yesterday)
-        
-        # Transformer en TaskOccurrenceWithDefinition
-        enriched_occurrences = []
-        for occ in occurrences:
-            enriched = TaskOccurrenceWithDefinition(
-                id=occ["id"],
-                task_id=occ["task_id"],
-                scheduled_date=occ["scheduled_date"],
-                due_at=occ["due_at"],
-                status=occ["status"],
-                assigned_to=occ.get("assigned_to"),
-                snoozed_until=occ.get("snoozed_until"),
-                created_at=occ["created_at"],
-                definition_title=occ["task_title"],
-                definition_description=occ.get("task_description"),
-                room_name=occ.get("room_name"),
-                assigned_user_name=occ.get("assigned_user_email"),
-                definition_priority=occ.get("definition_priority")
+
+        if stream and limit is None:
+            # Flux via curseur serveur, sérialisé ligne à ligne (mémoire bornée,
+            # premiers octets envoyés sans attendre la fin); la connexion reste
+            # prise jusqu'à la fin du téléchargement
+            async def _rows():
+                async for occ in iter_task_occurrences(db_pool, **window_filters):
+                    yield occ
+                if overdue_filters is not None:
+                    async for occ in iter_task_occurrences(db_pool, **overdue_filters):
+                        yield occ
+
+            return StreamingResponse(
+                iter_json_array(
+                    _rows(), TaskOccurrenceWithDefinition, _occurrence_with_definition
+                ),
+                media_type="application/json",
             )
-            enriched_occurrences.append(enriched)
-        
-        return enriched_occurrences
+
+        queries = [
+            get_task_occurrences(
+                db_pool,
+                **window_filters,
+                after=after,
+                limit=limit,
+            )
+        ]
+        if overdue_filters is not None:
+            queries.append(get_task_occurrences(db_pool, **overdue_filters))
+
+        # Requêtes indépendantes: exécutées en parallèle sur deux connexions du pool.
+        # Concaténer; pas de doublons attendus car fenêtres disjointes
+        results = await asyncio.gather(*queries)
+        occurrences = [occ for rows in results for occ in rows]
+
+        # Page complète: curseur de la page suivante
+        headers = None
+        window_rows = results[0]
+        if limit is not None and len(window_rows) == limit:
+            next_due_at, next_id = occurrence_cursor(window_rows[-1])
+            headers = {
+                "X-Next-After-Due-At": next_due_at.isoformat(),
+                "X-Next-After-Id": str(next_id),
+            }
+        
+        # Sérialiser les lignes au format TaskOccurrenceWithDefinition, validées
+        # et rendues par pydantic en une passe (même sortie que response_model)
+        return ModelJSONResponse(
+            content=[_occurrence_with_definition(occ) for occ in occurrences],
+            response_type=List[TaskOccurrenceWithDefinition],
+            headers=headers,
+        )
         
     except (UnauthorizedAccess,):
         raise
@@ -674,18 +759,9 @@ async def get_occurrence_stats(
                 action="view_stats"
             )
         
-        # Récupérer toutes les occurrences de la période
-        occurrences = await get_task_occurrences(
-            db_pool,
-            household_id=household_id,
-            start_date=start_date,
-            end_date=end_date,
-            assigned_to=assigned_to
-        )
-        
         # Calculer les statistiques
         stats = {
-            "total": len(occurrences),
+            "total": 0,
             "by_status": {
                 "pending": 0,
                 "snoozed": 0,
@@ -698,7 +774,15 @@ async def get_occurrence_stats(
             "by_assignee": {}
         }
         
-        for occ in occurrences:
+        # Parcourir les occurrences de la période sans les charger toutes en mémoire
+        async for occ in iter_task_occurrences(
+            db_pool,
+            household_id=household_id,
+            start_date=start_date,
+            end_date=end_date,
+            assigned_to=assigned_to
+        ):
+            stats["total"] += 1
             # Par statut
             status = occ["status"]
             if status in stats["by_status"]:
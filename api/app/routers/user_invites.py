@@ -8,6 +8,7 @@ from app.routers.households import get_db_pool
 from app.core.security import get_current_user
 from app.services.invite_service import get_invite_by_token, mark_invite_status
 from app.core.database import create_household_member
+from app.core.serialization import ModelJSONResponse
 
 router = APIRouter(prefix="/invites", tags=["invites"])
 
@@ -32,7 +33,9 @@ async def list_my_invites(
             """,
             email,
         )
-        return [dict(r) for r in rows]
+        return ModelJSONResponse(
+            content=[dict(row) for row in rows], response_type=List[Dict[str, Any]]
+        )
 
 
 @router.post("/{invite_id}/accept")
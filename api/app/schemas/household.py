@@ -10,6 +10,8 @@ class HouseholdBase(BaseModel):
 
 
 class HouseholdCreate(HouseholdBase):
+    with_default_rooms: bool = False  # Créer aussi les pièces par défaut
+
     @field_validator("name")
     @classmethod
     def name_must_not_be_empty(cls, value: str) -> str:
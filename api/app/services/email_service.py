@@ -9,13 +9,15 @@ async def send_email(to_email: str, subject: str, html: str, text: Optional[str]
 
     Retourne True si l'envoi a réussi, False sinon.
     """
+    smtp = settings.smtp
+
     # Vérifier configuration minimale
-    if not settings.smtp_host or not settings.smtp_port or not settings.sender_email:
+    if not smtp.host or not smtp.port or not smtp.sender_email:
         print("[email] SMTP non configuré correctement; email non envoyé.")
         return False
 
     msg = EmailMessage()
-    sender = f"{settings.sender_name} <{settings.sender_email}>" if settings.sender_name else settings.sender_email
+    sender = f"{smtp.sender_name} <{smtp.sender_email}>" if smtp.sender_name else smtp.sender_email
     msg["From"] = sender
     msg["To"] = to_email
     msg["Subject"] = subject
@@ -28,19 +30,19 @@ async def send_email(to_email: str, subject: str, html: str, text: Optional[str]
         if use_starttls:
             await aiosmtplib.send(
                 msg,
-                hostname=settings.smtp_host,
-                port=settings.smtp_port,
+                hostname=smtp.host,
+                port=smtp.port,
                 start_tls=True,
-                username=settings.smtp_user,
-                password=settings.smtp_password,
+                username=smtp.user,
+                password=smtp.password,
             )
         else:
             await aiosmtplib.send(
                 msg,
-                hostname=settings.smtp_host,
-                port=settings.smtp_port,
-                username=settings.smtp_user,
-                password=settings.smtp_password,
+                hostname=smtp.host,
+                port=smtp.port,
+                username=smtp.user,
+                password=smtp.password,
             )
         print(f"[email] Sent to {to_email} — subject='{subject}'")
         return True
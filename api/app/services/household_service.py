@@ -0,0 +1,29 @@
+import asyncpg
+from uuid import UUID
+from typing import Optional, Dict, Any, Sequence, Tuple
+
+from app.core.database import create_household_with_rooms
+
+# Pièces proposées à la création d'un ménage: (nom, icône)
+DEFAULT_ROOMS: Tuple[Tuple[str, str], ...] = (
+    ("Cuisine", "🍳"),
+    ("Salon", "🛋️"),
+    ("Salle de bain", "🛁"),
+    ("Chambre", "🛏️"),
+)
+
+
+async def create_household_with_default_rooms(
+    pool: asyncpg.Pool,
+    name: str,
+    created_by_user_id: Optional[UUID] = None,
+    rooms: Sequence[Tuple[str, str]] = DEFAULT_ROOMS,
+) -> Dict[str, Any]:
+    """
+    Crée un ménage puis ses pièces par défaut.
+
+    Ménage et pièces sont insérés dans une même transaction (toutes les pièces
+    en une requête): un échec ne laisse pas de ménage sans ses pièces, qu'un
+    nouvel essai du client dupliquerait.
+    """
+    return await create_household_with_rooms(pool, name, created_by_user_id, rooms)
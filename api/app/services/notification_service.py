@@ -1,7 +1,8 @@
 """
 Service de gestion des notifications pour l'application Cleaning Tracker
 """
-from typing import Dict, Any, List, Optional
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, Any, List, Optional
 from uuid import UUID
 from datetime import datetime, timedelta, timezone
 import httpx
@@ -22,12 +23,39 @@ class NotificationService:
     
     def __init__(self):
         self.expo_base_url = "https://exp.host/--/api/v2/push/send"
-        self.smtp_host = getattr(settings, "smtp_host", "smtp.gmail.com")
-        self.smtp_port = getattr(settings, "smtp_port", 587)
-        self.smtp_user = getattr(settings, "smtp_user", None)
-        self.smtp_password = getattr(settings, "smtp_password", None)
-        self.sender_email = getattr(settings, "sender_email", "noreply@cleaningtracker.com")
-        self.sender_name = getattr(settings, "sender_name", "Cleaning Tracker")
+        smtp = settings.smtp
+        self.smtp_host = smtp.host
+        self.smtp_port = smtp.port
+        self.smtp_user = smtp.user
+        self.smtp_password = smtp.password
+        self.sender_email = smtp.sender_email
+        self.sender_name = smtp.sender_name
+        # Client HTTP partagé pendant une session d'envoi (voir http_session)
+        self._http_client: Optional[httpx.AsyncClient] = None
+
+    @asynccontextmanager
+    async def http_session(self) -> AsyncIterator[httpx.AsyncClient]:
+        """
+        Ouvre un client HTTP partagé par tous les envois push de la session:
+        les connexions TLS vers Expo restent ouvertes (keep-alive) d'un envoi
+        à l'autre. Le client est lié à la boucle d'événements courante, d'où
+        une session par exécution de tâche plutôt qu'un client global.
+        """
+        async with httpx.AsyncClient(timeout=10.0) as client:
+            previous, self._http_client = self._http_client, client
+            try:
+                yield client
+            finally:
+                self._http_client = previous
+
+    @asynccontextmanager
+    async def _expo_client(self) -> AsyncIterator[httpx.AsyncClient]:
+        """Client de la session en cours, ou client jetable hors session"""
+        if self._http_client is not None:
+            yield self._http_client
+        else:
+            async with httpx.AsyncClient() as client:
+                yield client
     
     async def send_push_notification(
         self, 
@@ -68,7 +96,7 @@ class NotificationService:
             payload["data"] = data
         
         try:
-            async with httpx.AsyncClient() as client:
+            async with self._expo_client() as client:
                 response = await client.post(
                     self.expo_base_url,
                     json=payload,
@@ -237,7 +237,8 @@ class RecurrenceService:
                 if len(occurrences) >= count:
                     break
                 
-                occurrence_date = dt.date() if hasattr(dt, 'date') else dt
+                # rrule normalise dtstart en datetime: chaque occurrence est un datetime
+                occurrence_date = dt.date()
                 
                 # Vérifier les exclusions
                 if exclude_weekends and occurrence_date.weekday() in [5, 6]:  # Samedi, Dimanche
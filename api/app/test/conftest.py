@@ -125,6 +125,7 @@ async def db_pool(event_loop) -> AsyncGenerator[asyncpg.Pool, None]:
         CREATE TABLE task_occurrences (
             id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
             task_id UUID NOT NULL REFERENCES task_definitions(id) ON DELETE CASCADE,
+            household_id UUID,
             scheduled_date DATE NOT NULL,
             due_at TIMESTAMPTZ NOT NULL,
             status task_status NOT NULL DEFAULT 'pending',
@@ -134,6 +135,49 @@ async def db_pool(event_loop) -> AsyncGenerator[asyncpg.Pool, None]:
             UNIQUE(task_id, scheduled_date)
         );
         """)
+        await conn.execute("""
+        CREATE INDEX task_occurrences_pending_due_at_idx
+            ON task_occurrences(due_at) WHERE status = 'pending';
+        """)
+        
+        # household_id recopié depuis la définition (cf. migration 20251017_denormalize_occurrence_household)
+        await conn.execute("""
+        CREATE OR REPLACE FUNCTION set_occurrence_household_id()
+        RETURNS TRIGGER
+        LANGUAGE plpgsql
+        AS $$
+        BEGIN
+            SELECT td.household_id INTO NEW.household_id
+            FROM task_definitions td
+            WHERE td.id = NEW.task_id;
+            RETURN NEW;
+        END;
+        $$;
+        
+        CREATE TRIGGER task_occurrences_set_household_id
+            BEFORE INSERT OR UPDATE OF task_id ON task_occurrences
+            FOR EACH ROW EXECUTE FUNCTION set_occurrence_household_id();
+        """)
+        
+        # Fonction de passage en retard (cf. migration 20251017_denormalize_occurrence_household)
+        await conn.execute("""
+        CREATE OR REPLACE FUNCTION update_overdue_occurrences(p_household_id UUID)
+        RETURNS INTEGER
+        LANGUAGE plpgsql
+        AS $$
+        DECLARE
+            updated INTEGER;
+        BEGIN
+            UPDATE task_occurrences
+            SET status = 'overdue'
+            WHERE status = 'pending'
+              AND due_at < NOW()
+              AND (p_household_id IS NULL OR household_id = p_household_id);
+            GET DIAGNOSTICS updated = ROW_COUNT;
+            RETURN updated;
+        END;
+        $$;
+        """)
         
         # Table des complétions de tâches
         await conn.execute("""
@@ -173,6 +217,8 @@ async def db_pool(event_loop) -> AsyncGenerator[asyncpg.Pool, None]:
         await conn.execute("DROP TABLE IF EXISTS household_members CASCADE;")
         await conn.execute("DROP TABLE IF EXISTS households CASCADE;")
         await conn.execute("DROP TABLE IF EXISTS users CASCADE;")
+        await conn.execute("DROP FUNCTION IF EXISTS update_overdue_occurrences(UUID);")
+        await conn.execute("DROP FUNCTION IF EXISTS set_occurrence_household_id() CASCADE;")
         await conn.execute("DROP TYPE IF EXISTS task_status CASCADE;")
         await conn.execute("DROP TYPE IF EXISTS notif_channel CASCADE;")
 
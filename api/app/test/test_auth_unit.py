@@ -14,7 +14,7 @@ from app.core.security import (
     verify_token,
 )
 from app.schemas.auth import UserSignup, UserLogin, RefreshToken
-from app.config import settings
+from app.config import get_settings, settings
 
 
 class TestPasswordSecurity:
@@ -150,6 +150,36 @@ class TestJWTTokens:
         assert payload["role"] == "user"
         assert "exp" in payload
     
+    def test_verify_token_cached(self):
+        """Un token déjà vérifié est resservi depuis le cache, sans partage du payload"""
+        token = create_access_token({"sub": "test@example.com"})
+
+        first = verify_token(token)
+        first["sub"] = "modifié"
+        second = verify_token(token)
+
+        assert second["sub"] == "test@example.com"
+        assert second["exp"] == jwt.get_unverified_claims(token)["exp"]
+
+    def test_secret_key_rotation(self, monkeypatch):
+        """Une nouvelle SECRET_KEY est prise en compte sans réimporter le module"""
+        old_token = create_access_token({"sub": "test@example.com"})
+        verify_token(old_token)
+
+        monkeypatch.setenv("SECRET_KEY", "rotated-secret-key")
+        get_settings.cache_clear()
+        try:
+            token = create_access_token({"sub": "test@example.com"})
+            assert jwt.decode(
+                token, "rotated-secret-key", algorithms=[settings.jwt_algorithm]
+            )["sub"] == "test@example.com"
+            # Le token signé avec l'ancienne clé n'est plus accepté (cache vidé)
+            with pytest.raises(HTTPException):
+                verify_token(old_token)
+        finally:
+            monkeypatch.undo()
+            get_settings.cache_clear()
+
     def test_verify_token_invalid_format(self):
         """Test de vérification avec un format invalide"""
         with pytest.raises(HTTPException) as exc_info:
@@ -1,6 +1,9 @@
 """
 Tests pour la gestion des erreurs et les exceptions personnalisées
 """
+import copy
+import pickle
+
 from httpx import AsyncClient
 from uuid import uuid4
 from unittest.mock import MagicMock
@@ -15,7 +18,7 @@ from app.core.exceptions import (
     UnauthorizedAccess,
     DatabaseError,
     InvalidInput,
-    get_http_status_from_exception
+    get_http_status_from_exception,
 )
 from app.core.database import create_household, create_user
 
@@ -141,6 +144,23 @@ class TestCustomExceptions:
         # Exception inconnue
         assert get_http_status_from_exception(Exception()) == 500
 
+    def test_not_found_accepts_metadata(self):
+        """Les métadonnées passées à une exception « introuvable » sont fusionnées"""
+        exc = HouseholdNotFound("abc", metadata={"requested_by": "u1"})
+        assert exc.metadata == {"household_id": "abc", "requested_by": "u1"}
+        assert exc.http_status == 404
+        assert exc.technical_message == "Household not found: abc"
+        assert exc.args == ("Household not found: %s", "abc")
+
+    def test_exception_copy_and_pickle(self):
+        """Les exceptions à message différé restent copiables et sérialisables"""
+        exc = HouseholdNotFound("abc")
+        for clone in (copy.copy(exc), pickle.loads(pickle.dumps(exc))):
+            assert type(clone) is HouseholdNotFound
+            assert clone.error_code == exc.error_code
+            assert clone.metadata == {"household_id": "abc"}
+            assert str(clone) == "Household not found: abc"
+
 
 class TestErrorHandlingIntegration:
     """Tests d'intégration pour la gestion des erreurs"""
@@ -8,7 +8,8 @@ import uuid  # Import the uuid module itself for conversions
 import asyncpg
 
 from app.schemas.household import HouseholdCreate, Household
-from app.core.database import create_household, get_households
+from app.core.database import create_household, get_households, get_rooms
+from app.services.household_service import create_household_with_default_rooms, DEFAULT_ROOMS
 
 
 class TestHouseholdSchemas:
@@ -83,6 +84,29 @@ class TestHouseholdDatabase:
             assert member
             assert member["role"] == "admin"
     
+    @pytest.mark.asyncio
+    async def test_create_household_with_default_rooms(self, db_pool: asyncpg.Pool):
+        """Test de création de ménage avec ses pièces par défaut"""
+        household = await create_household_with_default_rooms(db_pool, "Seeded House")
+        
+        assert household["name"] == "Seeded House"
+        assert len(household["rooms"]) == len(DEFAULT_ROOMS)
+        
+        rooms = await get_rooms(db_pool, household["id"])
+        assert {r["name"] for r in rooms} == {name for name, _ in DEFAULT_ROOMS}
+    
+    @pytest.mark.asyncio
+    async def test_create_household_with_default_rooms_is_atomic(self, db_pool: asyncpg.Pool):
+        """Test: une pièce invalide annule aussi la création du ménage"""
+        name = f"Atomic House {uuid4()}"
+        with pytest.raises(asyncpg.NotNullViolationError):
+            await create_household_with_default_rooms(
+                db_pool, name, rooms=(("Cuisine", "🍳"), (None, None))
+            )
+        
+        count = await db_pool.fetchval("SELECT COUNT(*) FROM households WHERE name = $1", name)
+        assert count == 0
+    
     @pytest.mark.asyncio
     async def test_get_households_all(self, db_pool: asyncpg.Pool):
         """Test de récupération de tous les ménages"""
@@ -127,6 +151,35 @@ class TestHouseholdDatabase:
         assert h2["id"] in household_ids
         assert h3["id"] not in household_ids
 
+    @pytest.mark.asyncio
+    async def test_get_households_by_user_paginated(self, db_pool: asyncpg.Pool):
+        """Test de la pagination par clé (nom, id) des ménages d'un utilisateur"""
+        user_id = uuid4()
+        async with db_pool.acquire() as conn:
+            await conn.execute(
+                """
+                INSERT INTO users (id, email, full_name, hashed_password, email_confirmed_at)
+                VALUES ($1, $2, $3, $4, NOW())
+                ON CONFLICT (id) DO NOTHING;
+                """,
+                user_id, f"user_{user_id}@example.com", "Test User", "hashed_password"
+            )
+
+        for name in ("C House", "A House", "B House"):
+            await create_household(db_pool, name, user_id)
+
+        first_page = await get_households(db_pool, user_id, limit=2)
+        assert [h["name"] for h in first_page] == ["A House", "B House"]
+
+        next_page = await get_households(
+            db_pool, user_id, after_id=first_page[-1]["id"], limit=2
+        )
+        assert [h["name"] for h in next_page] == ["C House"]
+
+        await db_pool.execute("DELETE FROM households WHERE id = $1", first_page[-1]["id"])
+        with pytest.raises(ValueError):
+            await get_households(db_pool, user_id, after_id=first_page[-1]["id"], limit=2)
+
 
 class TestHouseholdEndpoints:
     """Tests d'intégration pour les endpoints de ménages"""
@@ -10,6 +10,7 @@ from app.schemas.member import HouseholdMemberCreate
 from app.core.database import (
     create_household, 
     create_household_member,
+    create_household_members_bulk,
     get_household_members,
     get_household_member
 )
@@ -106,6 +107,39 @@ class TestMemberDatabase:
         
         assert "déjà membre" in str(exc_info.value)
     
+    @pytest.mark.asyncio
+    async def test_create_members_bulk(self, db_pool: asyncpg.Pool):
+        """Test d'ajout groupé de membres (doublons ignorés)"""
+        household = await create_household(db_pool, "Test House")
+        
+        user1 = uuid4()
+        user2 = uuid4()
+        
+        async with db_pool.acquire() as conn:
+            await conn.execute(
+                "INSERT INTO users (id, email, hashed_password) VALUES ($1, $2, $3), ($4, $5, $6)",
+                user1, f"test_{user1}@example.com", "hashed_password",
+                user2, f"test_{user2}@example.com", "hashed_password"
+            )
+        
+        await create_household_member(db_pool, household["id"], user1, "admin")
+        await create_household_members_bulk(
+            db_pool,
+            household["id"],
+            [(user1, "member"), (user2, "guest")]
+        )
+        
+        async with db_pool.acquire() as conn:
+            rows = await conn.fetch(
+                "SELECT user_id, role FROM household_members WHERE household_id = $1",
+                household["id"]
+            )
+        
+        roles = {row["user_id"]: row["role"] for row in rows}
+        assert len(roles) == 2
+        assert roles[user1] == "admin"  # Membre existant inchangé
+        assert roles[user2] == "guest"
+    
     @pytest.mark.asyncio
     async def test_get_household_members(self, db_pool: asyncpg.Pool):
         """Test de récupération des membres d'un ménage"""
@@ -7,7 +7,7 @@ from uuid import uuid4
 import asyncpg
 
 from app.schemas.room import RoomCreate, Room
-from app.core.database import create_household, create_room, get_rooms, get_room
+from app.core.database import create_household, create_room, get_rooms, get_room, get_rooms_by_ids
 
 
 class TestRoomSchemas:
@@ -125,6 +125,20 @@ class TestRoomDatabase:
         assert room["name"] == "Office"
         assert room["icon"] == "💻"
     
+    @pytest.mark.asyncio
+    async def test_get_rooms_by_ids(self, db_pool: asyncpg.Pool):
+        """Test de récupération de plusieurs pièces en une requête"""
+        household = await create_household(db_pool, "Test House")
+        
+        kitchen = await create_room(db_pool, "Kitchen", household["id"], "🍳")
+        office = await create_room(db_pool, "Office", household["id"], "💻")
+        
+        rooms = await get_rooms_by_ids(db_pool, [kitchen["id"], office["id"], uuid4()])
+        
+        assert set(rooms) == {kitchen["id"], office["id"]}
+        assert rooms[kitchen["id"]]["name"] == "Kitchen"
+        assert rooms[office["id"]]["icon"] == "💻"
+    
     @pytest.mark.asyncio
     async def test_rooms_isolated_by_household(self, db_pool: asyncpg.Pool):
         """Test que les pièces sont isolées par ménage"""
@@ -204,6 +218,27 @@ class TestRoomEndpoints:
         assert all("id" in room for room in rooms)
         assert all("name" in room for room in rooms)
     
+    async def test_list_rooms_matches_response_model(
+        self,
+        async_client: AsyncClient,
+        db_pool: asyncpg.Pool
+    ):
+        """Test: la liste rendue est identique à la sortie du response_model"""
+        household = await create_household(db_pool, "Test House")
+        await create_room(db_pool, "Kitchen", household["id"], "🍳")
+        await create_room(db_pool, "Office", household["id"], None)
+        
+        response = await async_client.get(f"/households/{household['id']}/rooms")
+        
+        assert response.status_code == 200
+        expected = [
+            Room.model_validate(room).model_dump(mode="json")
+            for room in await get_rooms(db_pool, household["id"])
+        ]
+        assert response.json() == expected
+        # Colonnes hors schéma (created_at) non exposées
+        assert all("created_at" not in room for room in response.json())
+    
     async def test_get_room_details(
         self,
         async_client: AsyncClient,
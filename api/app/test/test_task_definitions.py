@@ -11,6 +11,7 @@ from app.schemas.task import TaskDefinitionCreate
 from app.core.database import (
     create_household,
     create_task_definition,
+    create_task_definitions_bulk,
     get_task_definitions,
     get_task_definition,
     update_task_definition,
@@ -177,6 +178,25 @@ class TestTaskDefinitionDatabase:
         assert "Salle de bain - Hebdo" in titles
         assert "Poussière - Bihebdo" in titles
     
+    @pytest.mark.asyncio
+    async def test_create_task_definitions_bulk(self, db_pool: asyncpg.Pool, test_household_with_user):
+        """Test de création de plusieurs définitions en une opération"""
+        household = test_household_with_user["household"]
+        user_id = test_household_with_user["user_id"]
+        
+        rows = [
+            (title, None, rrule, None, None, household["id"], False, user_id)
+            for title, rrule in [("Vitres", "FREQ=MONTHLY"), ("Linge", "FREQ=WEEKLY;BYDAY=MO")]
+        ]
+        
+        created = await create_task_definitions_bulk(db_pool, rows)
+        
+        assert created == 2
+        definitions = await get_task_definitions(db_pool, household_id=household["id"])
+        titles = [d["title"] for d in definitions]
+        assert "Vitres" in titles
+        assert "Linge" in titles
+    
     @pytest.mark.asyncio
     async def test_get_catalog_tasks(self, db_pool: asyncpg.Pool):
         """Test de récupération des tâches catalogue"""
@@ -16,6 +16,7 @@ from app.core.database import (
     create_task_occurrence,
     get_task_occurrences,
     get_task_occurrence,
+    get_task_occurrences_by_ids,
     update_task_occurrence_status,
     complete_task_occurrence,
     generate_occurrences_for_definition,
@@ -134,6 +135,29 @@ class TestTaskOccurrenceDatabase:
         
         assert len(occurrences) == 3
     
+    @pytest.mark.asyncio
+    async def test_get_task_occurrences_by_ids(
+        self, db_pool: asyncpg.Pool, test_task_definition
+    ):
+        """Test de récupération de plusieurs occurrences en une requête"""
+        created = []
+        for i in range(2):
+            scheduled_date = date.today() + timedelta(days=i)
+            created.append(await create_task_occurrence(
+                db_pool,
+                task_id=test_task_definition["id"],
+                scheduled_date=scheduled_date,
+                due_at=datetime.combine(scheduled_date, datetime.max.time())
+            ))
+        
+        occurrences = await get_task_occurrences_by_ids(
+            db_pool, [occ["id"] for occ in created] + [uuid4()]
+        )
+        
+        assert set(occurrences) == {occ["id"] for occ in created}
+        for occ in created:
+            assert occurrences[occ["id"]]["task_title"] == test_task_definition["title"]
+    
     @pytest.mark.asyncio
     async def test_update_occurrence_status(
         self, db_pool: asyncpg.Pool, test_task_definition
@@ -270,6 +294,28 @@ class TestTaskOccurrenceEndpoints:
         assert len(occurrences) >= 3
         assert all("definition_title" in occ for occ in occurrences)
     
+    async def test_list_occurrences_partial_cursor(
+        self,
+        async_client: AsyncClient,
+        test_household_with_user,
+        auth_headers: dict
+    ):
+        """Test: un curseur incomplet (un seul des deux paramètres) est refusé"""
+        household = test_household_with_user["household"]
+        
+        for params in (
+            {"limit": 10, "after_due_at": datetime.now(timezone.utc).isoformat()},
+            {"limit": 10, "after_id": str(uuid4())},
+        ):
+            response = await async_client.get(
+                f"/households/{household['id']}/occurrences",
+                params=params,
+                headers=auth_headers
+            )
+            
+            assert response.status_code == 400
+            assert response.json()["error"]["code"] == "INVALID_INPUT"
+    
     async def test_complete_occurrence_endpoint(
         self,
         async_client: AsyncClient,
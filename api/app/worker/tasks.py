@@ -4,14 +4,36 @@ Workers Celery pour le traitement des notifications
 from datetime import datetime, date, timedelta, timezone
 from typing import Dict, Any, Optional
 import asyncio
+import functools
 
+from app.config import settings
 from app.core.celery_app import celery_app
 from app.core.database import init_db_pool
+from app.core.materialized_views import refresh_occurrences_view
 from app.core.logging import get_logger, with_context
 from app.services.notification_service import notification_service
 
 logger = get_logger("celery.tasks")
 
+# Taille des lots pour le passage en retard (une requête par lot)
+OVERDUE_BATCH_SIZE = 1000
+# Nombre maximal d'envois d'emails simultanés
+NOTIFICATION_CONCURRENCY = 8
+# Statuts d'envoi écrits tous les N envois: un arrêt du worker en cours de
+# boucle ne fait renvoyer qu'au plus un lot de notifications
+NOTIFICATION_STATUS_BATCH_SIZE = 10
+
+
+def _with_http_session(func):
+    """Partage un client HTTP (keep-alive) entre les envois push d'une exécution"""
+
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        async with notification_service.http_session():
+            return await func(*args, **kwargs)
+
+    return wrapper
+
 
 @celery_app.task(name="send_notification")
 def send_notification(email: str, message: str):
@@ -58,6 +80,7 @@ def send_daily_reminders():
         }
 
 
+@_with_http_session
 async def _send_daily_reminders_async() -> Dict[str, Any]:
     """Logique async pour l'envoi des rappels quotidiens"""
     pool = await init_db_pool()
@@ -193,6 +216,7 @@ def process_notification_queue():
         loop.close()
 
 
+@_with_http_session
 async def _process_notification_queue_async() -> Dict[str, Any]:
     """Logique async pour traiter la queue de notifications"""
     pool = await init_db_pool()
@@ -231,6 +255,8 @@ async def _process_notification_queue_async() -> Dict[str, Any]:
             
             logger.info(f"Trouvé {len(notifications)} notifications à envoyer")
             
+            sent_ids = []
+            failed_ids = []
             for notif in notifications:
                 processed += 1
                 success = False
@@ -270,28 +296,14 @@ async def _process_notification_queue_async() -> Dict[str, Any]:
                                 data={"occurrence_id": str(notif["occurrence_id"])}
                             )
                     
-                    # Marquer comme envoyé
+                    # Marquer comme envoyé (mise à jour groupée par lot)
                     if success:
-                        await conn.execute(
-                            """
-                            UPDATE notifications 
-                            SET sent_at = NOW(), delivered = TRUE
-                            WHERE id = $1
-                            """,
-                            notif["id"]
-                        )
+                        sent_ids.append(notif["id"])
                         sent += 1
                     else:
                         failed += 1
                         # Optionnel : marquer l'échec pour retry
-                        await conn.execute(
-                            """
-                            UPDATE notifications 
-                            SET sent_at = NOW(), delivered = FALSE
-                            WHERE id = $1
-                            """,
-                            notif["id"]
-                        )
+                        failed_ids.append(notif["id"])
                 
                 except Exception as e:
                     failed += 1
@@ -303,6 +315,11 @@ async def _process_notification_queue_async() -> Dict[str, Any]:
                         ),
                         exc_info=True
                     )
+
+                if len(sent_ids) + len(failed_ids) >= NOTIFICATION_STATUS_BATCH_SIZE:
+                    await _flush_notification_statuses(conn, sent_ids, failed_ids)
+
+            await _flush_notification_statuses(conn, sent_ids, failed_ids)
     
     finally:
         await pool.close()
@@ -334,13 +351,23 @@ def check_overdue_tasks():
 
 async def _check_overdue_tasks_async() -> Dict[str, Any]:
     """Logique async pour vérifier les tâches en retard"""
-    from app.core.database import check_and_update_overdue_occurrences
+    from app.core.database import mark_overdue
     
     pool = await init_db_pool()
     
     try:
-        # Mettre à jour les statuts
-        count = await check_and_update_overdue_occurrences(pool)
+        # Mettre à jour les statuts par lots, jusqu'à un lot incomplet
+        count = 0
+        while True:
+            batch = await mark_overdue(pool, limit=OVERDUE_BATCH_SIZE)
+            count += len(batch)
+            if len(batch) < OVERDUE_BATCH_SIZE:
+                break
+
+        # Le rafraîchisseur différé ne tourne que dans l'API: rafraîchir ici
+        # la vue des occurrences, une fois pour tous les lots
+        if count > 0 and settings.occurrences_view_enabled:
+            await refresh_occurrences_view(pool)
         
         # Envoyer des notifications pour les nouvelles tâches en retard
         if count > 0:
@@ -365,10 +392,12 @@ async def _check_overdue_tasks_async() -> Dict[str, Any]:
                     """
                 )
                 
-                notifications_sent = 0
-                for task in overdue_tasks:
-                    if task["email"]:
-                        success = await notification_service.send_email_reminder(
+                # Envois indépendants: en parallèle, bornés pour ne pas saturer le SMTP
+                semaphore = asyncio.Semaphore(NOTIFICATION_CONCURRENCY)
+
+                async def _send_overdue(task) -> bool:
+                    async with semaphore:
+                        return await notification_service.send_email_reminder(
                             task["email"],
                             {
                                 "id": str(task["id"]),
@@ -376,8 +405,11 @@ async def _check_overdue_tasks_async() -> Dict[str, Any]:
                             },
                             reminder_type="overdue"
                         )
-                        if success:
-                            notifications_sent += 1
+
+                results = await asyncio.gather(
+                    *(_send_overdue(task) for task in overdue_tasks if task["email"])
+                )
+                notifications_sent = sum(1 for success in results if success)
                 
                 return {
                     "overdue_count": count,
@@ -391,6 +423,23 @@ async def _check_overdue_tasks_async() -> Dict[str, Any]:
 
 
 # Fonctions helper
+async def _flush_notification_statuses(conn, sent_ids: list, failed_ids: list) -> None:
+    """Écrit les statuts d'envoi en attente en une requête, puis vide les listes"""
+    if not sent_ids and not failed_ids:
+        return
+    await conn.execute(
+        """
+        UPDATE notifications
+        SET sent_at = NOW(), delivered = (id = ANY($1::bigint[]))
+        WHERE id = ANY($1::bigint[]) OR id = ANY($2::bigint[])
+        """,
+        sent_ids,
+        failed_ids,
+    )
+    sent_ids.clear()
+    failed_ids.clear()
+
+
 async def _get_user_notification_preferences(conn, user_id: str) -> Dict[str, Any]:
     """Récupérer les préférences de notification d'un utilisateur"""
     # TODO: Implémenter avec la table user_notification_preferences
@@ -0,0 +1,12 @@
+-- Un utilisateur ne peut être membre qu'une fois d'un même ménage.
+-- Permet INSERT ... ON CONFLICT (household_id, user_id) dans create_household_member.
+
+-- Supprimer les éventuels doublons existants (on garde l'adhésion la plus ancienne)
+DELETE FROM public.household_members hm
+USING public.household_members older
+WHERE hm.household_id = older.household_id
+  AND hm.user_id = older.user_id
+  AND (hm.joined_at, hm.id) > (older.joined_at, older.id);
+
+CREATE UNIQUE INDEX IF NOT EXISTS household_members_household_user_key
+  ON public.household_members(household_id, user_id);
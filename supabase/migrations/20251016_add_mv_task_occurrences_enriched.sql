@@ -0,0 +1,33 @@
+-- Vue matérialisée des occurrences pré-jointes (définition, pièce, utilisateur assigné).
+-- Lue par get_task_occurrences quand OCCURRENCES_VIEW_ENABLED=1, rafraîchie
+-- (CONCURRENTLY) en arrière-plan après les mutations d'occurrences.
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS public.mv_task_occurrences_enriched AS
+SELECT
+  o.*,
+  td.title AS task_title,
+  td.description AS task_description,
+  td.estimated_minutes,
+  td.room_id,
+  td.household_id,
+  td.priority AS definition_priority,
+  r.name AS room_name,
+  u.email AS assigned_user_email
+FROM public.task_occurrences o
+JOIN public.task_definitions td ON o.task_id = td.id
+LEFT JOIN public.rooms r ON td.room_id = r.id
+LEFT JOIN auth.users u ON o.assigned_to = u.id;
+
+-- Index unique requis par REFRESH MATERIALIZED VIEW CONCURRENTLY
+CREATE UNIQUE INDEX IF NOT EXISTS mv_task_occurrences_enriched_id_key
+  ON public.mv_task_occurrences_enriched(id);
+
+CREATE INDEX IF NOT EXISTS mv_task_occurrences_enriched_household_date_idx
+  ON public.mv_task_occurrences_enriched(household_id, scheduled_date);
+
+CREATE INDEX IF NOT EXISTS mv_task_occurrences_enriched_household_status_due_idx
+  ON public.mv_task_occurrences_enriched(household_id, status, due_at);
+
+-- Les vues matérialisées ignorent la RLS des tables sources: la vue n'est lue
+-- que par l'API (rôle de service), jamais exposée via PostgREST
+REVOKE ALL ON public.mv_task_occurrences_enriched FROM anon, authenticated;
@@ -0,0 +1,7 @@
+-- Pagination par clé (due_at, id) de get_task_occurrences: chaque page est un
+-- parcours d'index borné, quelle que soit la taille de la table.
+CREATE INDEX IF NOT EXISTS task_occurrences_due_at_id_idx
+  ON public.task_occurrences(due_at, id);
+
+CREATE INDEX IF NOT EXISTS mv_task_occurrences_enriched_household_due_id_idx
+  ON public.mv_task_occurrences_enriched(household_id, due_at, id);
@@ -0,0 +1,38 @@
+-- Passage en retard des occurrences échues, côté serveur.
+
+-- Index partiel: seules les occurrences 'pending' sont candidates au passage en
+-- retard, l'UPDATE parcourt donc une plage d'index au lieu de toute la table.
+CREATE INDEX IF NOT EXISTS task_occurrences_pending_due_at_idx
+  ON public.task_occurrences(due_at)
+  WHERE status = 'pending';
+
+-- Passe en 'overdue' les occurrences 'pending' échues (d'un ménage, ou de tous
+-- si p_household_id est NULL) et retourne le nombre de lignes modifiées.
+-- Utilisée par check_and_update_overdue_occurrences.
+CREATE OR REPLACE FUNCTION public.update_overdue_occurrences(p_household_id uuid)
+RETURNS integer
+LANGUAGE plpgsql
+AS $$
+DECLARE
+  updated integer;
+BEGIN
+  IF p_household_id IS NULL THEN
+    -- Pas de filtre par ménage: aucune jointure sur task_definitions
+    UPDATE public.task_occurrences
+    SET status = 'overdue'
+    WHERE status = 'pending'
+      AND due_at < NOW();
+  ELSE
+    UPDATE public.task_occurrences o
+    SET status = 'overdue'
+    FROM public.task_definitions td
+    WHERE o.task_id = td.id
+      AND td.household_id = p_household_id
+      AND o.status = 'pending'
+      AND o.due_at < NOW();
+  END IF;
+
+  GET DIAGNOSTICS updated = ROW_COUNT;
+  RETURN updated;
+END;
+$$;
@@ -0,0 +1,8 @@
+-- Liste paginée des ménages d'un utilisateur (get_households): l'index unique
+-- existant commence par household_id et ne sert pas le filtre sur user_id.
+CREATE INDEX IF NOT EXISTS household_members_user_household_idx
+  ON public.household_members(user_id, household_id);
+
+-- Pagination par clé (name, id), dans l'ordre de la liste
+CREATE INDEX IF NOT EXISTS households_name_id_idx
+  ON public.households(name, id);
@@ -0,0 +1,55 @@
+-- household_id recopié sur task_occurrences: les filtres par ménage des listes
+-- d'occurrences et du passage en retard s'appuient sur des index d'une seule table.
+
+ALTER TABLE public.task_occurrences
+  ADD COLUMN IF NOT EXISTS household_id uuid;
+
+UPDATE public.task_occurrences o
+SET household_id = td.household_id
+FROM public.task_definitions td
+WHERE o.task_id = td.id
+  AND o.household_id IS DISTINCT FROM td.household_id;
+
+-- Renseigné à l'insertion depuis la définition de tâche
+CREATE OR REPLACE FUNCTION public.set_occurrence_household_id()
+RETURNS trigger
+LANGUAGE plpgsql
+AS $$
+BEGIN
+  SELECT td.household_id INTO NEW.household_id
+  FROM public.task_definitions td
+  WHERE td.id = NEW.task_id;
+  RETURN NEW;
+END;
+$$;
+
+DROP TRIGGER IF EXISTS task_occurrences_set_household_id ON public.task_occurrences;
+CREATE TRIGGER task_occurrences_set_household_id
+  BEFORE INSERT OR UPDATE OF task_id ON public.task_occurrences
+  FOR EACH ROW EXECUTE FUNCTION public.set_occurrence_household_id();
+
+CREATE INDEX IF NOT EXISTS task_occurrences_household_date_idx
+  ON public.task_occurrences(household_id, scheduled_date);
+
+CREATE INDEX IF NOT EXISTS task_occurrences_assigned_due_idx
+  ON public.task_occurrences(assigned_to, due_at)
+  WHERE assigned_to IS NOT NULL;
+
+-- Passage en retard par ménage sans jointure sur task_definitions
+CREATE OR REPLACE FUNCTION public.update_overdue_occurrences(p_household_id uuid)
+RETURNS integer
+LANGUAGE plpgsql
+AS $$
+DECLARE
+  updated integer;
+BEGIN
+  UPDATE public.task_occurrences
+  SET status = 'overdue'
+  WHERE status = 'pending'
+    AND due_at < NOW()
+    AND (p_household_id IS NULL OR household_id = p_household_id);
+
+  GET DIAGNOSTICS updated = ROW_COUNT;
+  RETURN updated;
+END;
+$$;